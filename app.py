@@ -1,23 +1,53 @@
 from flask import Flask, render_template, request, jsonify
-from game_logic import (load_word_list, make_bot_move)
+from game_logic import Board, make_bot_move
+from game_logic.board import H, V
+from game_logic.generator import Move
+from game_logic.validation import check_extended_main_word, extract_cross_words, shadow
+from game_logic.registry import lexicons
+from game_logic.sessions import games
+from game_logic.word_index import CSW, NWL, lexicon_mask
 import random
 import json
 import os
+from contextlib import nullcontext
 
 app = Flask(__name__)
 
-# Load word lists
-def load_word_list(filename):
-    with open(filename, 'r') as file:
-        return set(line.strip().upper() for line in file)
+# Lexicon structures (the NWL2023 + CSW21 word index, hook indexes, the bot's
+# DAWG ...) are built on first use; by default they are also warmed on
+# background threads so the first quiz or bot move does not wait for them.
+# /status/lexicons reports readiness and build times.
+if os.environ.get('LEXICON_WARM', '1') != '0':
+    lexicons.warm()
 
-csw21_words = load_word_list('static/data/CSW21.txt')
-nwl2023_words = load_word_list('static/data/NWL2023.txt')
+# Upper bound on /solve_anagram results (a rack like ??EIRST spells thousands)
+ANAGRAM_RESULT_LIMIT = 2000
+# Longest rack /solve_anagram accepts, and most blanks in it: each blank
+# multiplies the lexicon walk, so these bound the work as well as the output
+ANAGRAM_MAX_LETTERS = 15
+ANAGRAM_MAX_BLANKS = 2
+# Longest rack the bingo checks accept (7 tiles, or a rack with the letters
+# added for a 9-letter extension) and most blanks in it: each blank and each
+# extra letter multiplies the alphagram look-ups
+BINGO_MAX_LETTERS = 9
+BINGO_MAX_BLANKS = 2
 
 @app.route('/')
 def home():
     return render_template('home.html')
 
+@app.route('/status/lexicons')
+def lexicon_status():
+    """Readiness and build time of each lexicon structure."""
+    status = lexicons.status()
+    return jsonify({'ready': all(r['ready'] for r in status.values()),
+                    'resources': status})
+
+@app.route('/status/validation')
+def validation_status():
+    """Shadow validation of generated moves: sample rate and mismatch count."""
+    return jsonify(shadow.stats())
+
 @app.route('/about')
 def about():
     """Render the about page for the Scrabble Training Hub website."""
@@ -47,91 +77,27 @@ def get_hooks():
         min_hooks = int(request.args.get('min_hooks', 1))
         include_no_hooks = request.args.get('include_no_hooks', 'false').lower() == 'true'
         
-        # Load the appropriate hook data file
-        filename = f"static/data/{dictionary.upper()}_hooks.json"
-        with open(filename, 'r') as file:
-            hooks_data = json.load(file)
+        hooks = lexicons.get('hooks:csw' if lexicon_mask(dictionary, NWL) == CSW else 'hooks:nwl')
         
         # Filter words based on criteria
-        filtered_words = []
-        for word, hooks in hooks_data.items():
-            # Skip words that don't match the requested length
-            if len(word) != word_length:
-                continue
-                
-            front_hooks = hooks.get('front', [])
-            back_hooks = hooks.get('back', [])
-            total_hooks = len(front_hooks) + len(back_hooks)
-            
-            # Handle words with no hooks if include_no_hooks is enabled
-            if total_hooks == 0 and include_no_hooks and min_hooks == 0:
-                filtered_words.append({
-                    'word': word,
-                    'front_hooks': [],
-                    'back_hooks': []
-                })
-                continue
-                
-            # Skip words with fewer total hooks than required
-            if total_hooks < min_hooks:
-                continue
-            
-            # Apply hook type filter
-            if hook_type == 'both':
-                filtered_words.append({
-                    'word': word,
-                    'front_hooks': front_hooks,
-                    'back_hooks': back_hooks
-                })
-            elif hook_type == 'front' and len(front_hooks) >= min_hooks:
-                filtered_words.append({
-                    'word': word,
-                    'front_hooks': front_hooks,
-                    'back_hooks': back_hooks
-                })
-            elif hook_type == 'back' and len(back_hooks) >= min_hooks:
-                filtered_words.append({
-                    'word': word,
-                    'front_hooks': front_hooks,
-                    'back_hooks': back_hooks
-                })
+        selected = hooks.select(word_length, hook_type, min_hooks)
         
         # If no words found, try various fallback options
-        if not filtered_words:
+        if not selected:
             print(f"No words found with initial criteria. Using fallbacks.")
             
-            # Try with looser criteria 
-            for word, hooks in hooks_data.items():
-                if len(word) == word_length:
-                    front_hooks = hooks.get('front', [])
-                    back_hooks = hooks.get('back', [])
-                    
-                    # Add words with any hooks (or no hooks if that option is enabled)
-                    if front_hooks or back_hooks or include_no_hooks:
-                        filtered_words.append({
-                            'word': word,
-                            'front_hooks': front_hooks,
-                            'back_hooks': back_hooks
-                        })
-                    
-                    # Limit to 100 words to avoid overwhelming the UI
-                    if len(filtered_words) >= 100:
-                        break
+            # Try with looser criteria: words with any hooks (or no hooks if
+            # that option is enabled), limited to 100 to avoid overwhelming the UI
+            selected = hooks.select(word_length, 'both', 0 if include_no_hooks else 1, limit=100)
             
             # If still no words, just grab any words of the right length
-            if not filtered_words:
-                word_counter = 0
-                for word, hooks in hooks_data.items():
-                    if len(word) == word_length:
-                        filtered_words.append({
-                            'word': word,
-                            'front_hooks': hooks.get('front', []),
-                            'back_hooks': hooks.get('back', [])
-                        })
-                        
-                        word_counter += 1
-                        if word_counter >= 50:
-                            break
+            if not selected:
+                selected = hooks.select(word_length, 'both', 0, limit=50)
+        
+        filtered_words = [
+            {'word': word, 'front_hooks': front_hooks, 'back_hooks': back_hooks}
+            for word, front_hooks, back_hooks in selected
+        ]
         
         # Sort words alphabetically
         filtered_words.sort(key=lambda x: x['word'])
@@ -164,20 +130,25 @@ def get_words():
         include_blanks = data.get('includeBlanks', False)
         time_limit = int(data.get('timeLimit', 5))  # Provide a default value if not set
 
-        word_list = nwl2023_words if dictionary == 'nwl2023' else csw21_words
-        filtered_words = [word for word in word_list if len(word) == word_length]
+        compact = data.get('compact', False)
+        mask = NWL if dictionary == 'nwl2023' else CSW
 
         num_test_words = time_limit * 120 if time_limit > 0 else 120  # Example calculation
-        test_words = random.sample(filtered_words, min(num_test_words, len(filtered_words)))
+        test_words = lexicons.get('word_index').sample(word_length, num_test_words, mask)
         
-        return jsonify({'testWords': test_words, 'allWords': filtered_words})
+        if compact:
+            # Only the anagram sets of the sampled words, not the whole bucket
+            return jsonify({'testWords': test_words,
+                            'anagrams': lexicons.get('word_index').anagram_map(test_words, mask)})
+        return jsonify({'testWords': test_words,
+                        'allWords': list(lexicons.get('word_index').words_of_length(word_length, mask))})
     except Exception as e:
         # Log the error to the console or a file
         print(f"Error processing request: {e}")
         # Return a JSON error message
         return jsonify({'error': str(e)}), 500
 
-def alter_word(word, all_words):
+def alter_word(word, mask):
     vowels = 'AEIOU'
     consonants = ''.join(set('ABCDEFGHIJKLMNOPQRSTUVWXYZ') - set(vowels))
     char_list = vowels if random.choice([True, False]) else consonants
@@ -190,7 +161,7 @@ def alter_word(word, all_words):
             new_chars = char_list.replace(original_char, '')
             for new_char in new_chars:
                 altered_word = word.replace(original_char, new_char, 1)
-                if altered_word not in all_words:
+                if not lexicons.get('word_index').contains(altered_word, mask):
                     return (altered_word, True)  # Successfully created a fake word
     return (word, False)  # Failed to alter the word to be fake
 
@@ -203,17 +174,14 @@ def get_judge_words():
         include_blanks = data.get('includeBlanks', False)
         time_limit = int(data.get('timeLimit', 5))
 
-        word_list = nwl2023_words if dictionary == 'nwl2023' else csw21_words
-        filtered_words = [word for word in word_list if len(word) == word_length]
-
-        num_words = min(len(filtered_words), time_limit * 120)
-        selected_words = random.sample(filtered_words, num_words)
+        mask = NWL if dictionary == 'nwl2023' else CSW
+        selected_words = lexicons.get('word_index').sample(word_length, time_limit * 120, mask)
 
         judge_words = []
         for word in selected_words:
             is_real = random.choice([True, False])
             if not is_real:
-                altered_word, was_altered = alter_word(word, filtered_words)
+                altered_word, was_altered = alter_word(word, mask)
                 is_real = not was_altered  # Update is_real based on whether the word was successfully altered
                 word = altered_word
             judge_words.append({'word': word, 'isReal': is_real})
@@ -228,8 +196,9 @@ def check_word():
     data = request.get_json()
     word = data.get('word', '').upper()
     
-    in_csw21 = word in csw21_words
-    in_nwl2023 = word in nwl2023_words
+    flags = lexicons.get('word_index').flags(word)
+    in_csw21 = bool(flags & CSW)
+    in_nwl2023 = bool(flags & NWL)
     
     if in_csw21 and in_nwl2023:
         validity = "valid in both NWL and Collins"
@@ -254,61 +223,46 @@ def solve_anagram():
     letters = data.get('letters', '').upper()
     dictionary_choice = data.get('dictionary', 'both')
     
-    # Process blank tiles (represented by '?')
-    letter_counter = {}
-    blank_count = 0
+    try:
+        min_length = int(data.get('minLength', 2))
+        max_length = data.get('maxLength')
+        # Left empty in the form: no upper bound
+        max_length = None if max_length in (None, '') else int(max_length)
+        limit = int(data.get('limit', ANAGRAM_RESULT_LIMIT))
+    except (TypeError, ValueError) as e:
+        return jsonify({"message": f"Bad request: {e}", "error": True}), 400
+    if limit < 1 or min_length < 1 or (max_length is not None and max_length < max(min_length, 1)):
+        return jsonify({
+            "message": "limit and lengths must be at least 1, and maxLength at least minLength",
+            "error": True,
+        }), 400
+    limit = min(limit, ANAGRAM_RESULT_LIMIT)
+    if len(letters) > ANAGRAM_MAX_LETTERS or letters.count('?') > ANAGRAM_MAX_BLANKS:
+        return jsonify({
+            "message": f"At most {ANAGRAM_MAX_LETTERS} letters and {ANAGRAM_MAX_BLANKS} blanks",
+            "error": True,
+        }), 400
     
-    for letter in letters:
-        if letter == '?':
-            blank_count += 1
-        elif letter.isalpha():
-            letter_counter[letter] = letter_counter.get(letter, 0) + 1
+    # Determine which dictionary to use ('nwl', 'collins' or 'both')
+    mask = lexicon_mask(dictionary_choice)
     
-    # Determine which dictionary to use
-    if dictionary_choice == 'nwl':
-        word_list = nwl2023_words
-    elif dictionary_choice == 'collins':
-        word_list = csw21_words
-    else:  # 'both'
-        word_list = nwl2023_words.union(csw21_words)
+    # Walk the lexicon guided by the rack ('?' is a blank); results come back
+    # sorted by length (descending), then alphabetically
+    hits, truncated = lexicons.get('word_index').subanagrams(
+        letters, mask, min_length=min_length, max_length=max_length, limit=limit
+    )
     
-    # Find anagrams
-    possible_words = []
+    possible_words = [
+        {
+            'word': word,
+            'in_nwl': bool(flags & NWL),
+            'in_collins': bool(flags & CSW),
+            'length': len(word)
+        }
+        for word, flags in hits
+    ]
     
-    for word in word_list:
-        # Check if the word can be formed with the given letters
-        word_counter = {}
-        for letter in word:
-            word_counter[letter] = word_counter.get(letter, 0) + 1
-        
-        # Check if we can form this word
-        can_form = True
-        blanks_needed = 0
-        
-        for letter, count in word_counter.items():
-            available = letter_counter.get(letter, 0)
-            if available < count:
-                blanks_needed += (count - available)
-                if blanks_needed > blank_count:
-                    can_form = False
-                    break
-        
-        if can_form:
-            # Determine which dictionary the word is in
-            in_nwl = word in nwl2023_words
-            in_collins = word in csw21_words
-            
-            possible_words.append({
-                'word': word,
-                'in_nwl': in_nwl,
-                'in_collins': in_collins,
-                'length': len(word)
-            })
-    
-    # Sort results - first by length (descending), then alphabetically
-    possible_words.sort(key=lambda x: (-x['length'], x['word']))
-    
-    return jsonify({'words': possible_words})
+    return jsonify({'words': possible_words, 'truncated': truncated})
 
 @app.route('/bingo_practice')
 def bingo_practice():
@@ -319,20 +273,15 @@ def check_bingos():
     data = request.get_json()
     rack = data.get('rack', '').upper()
     dictionary_choice = data.get('dictionary', 'nwl')
+    problem = _bingo_rack_problem(rack)
+    if problem:
+        return jsonify({"message": f"Bad rack: {problem}", "error": True}), 400
     
-    # Convert rack to a list of letters
-    rack_letters = list(rack)
-    
-    # Determine which dictionary to use
-    if dictionary_choice == 'nwl':
-        word_list = nwl2023_words
-    elif dictionary_choice == 'collins':
-        word_list = csw21_words
-    else:  # 'both'
-        word_list = nwl2023_words.union(csw21_words)
+    # Determine which dictionary to use ('nwl', 'collins' or 'both')
+    mask = lexicon_mask(dictionary_choice)
     
     # Find all possible 7-letter words that can be formed with the rack
-    bingos = find_possible_bingos(rack_letters, word_list)
+    bingos = find_possible_bingos(rack, mask)
     
     return jsonify({'bingos': bingos})
 
@@ -340,108 +289,106 @@ def check_bingos():
 def check_extension_bingos():
     data = request.get_json()
     rack = data.get('rack', '').upper()
-    target_length = int(data.get('targetLength', 8))
+    try:
+        target_length = int(data.get('targetLength', 8))
+    except (TypeError, ValueError) as e:
+        return jsonify({"message": f"Bad request: {e}", "error": True}), 400
     dictionary_choice = data.get('dictionary', 'nwl')
+    problem = _bingo_rack_problem(rack)
+    if problem:
+        return jsonify({"message": f"Bad rack: {problem}", "error": True}), 400
     
-    # Convert rack to a list of letters
-    rack_letters = list(rack)
-    
-    # Determine which dictionary to use
-    if dictionary_choice == 'nwl':
-        word_list = nwl2023_words
-    elif dictionary_choice == 'collins':
-        word_list = csw21_words
-    else:  # 'both'
-        word_list = nwl2023_words.union(csw21_words)
-    
-    # Filter the word list to only include words of the target length
-    target_words = [word for word in word_list if len(word) == target_length]
+    # Determine which dictionary to use ('nwl', 'collins' or 'both')
+    mask = lexicon_mask(dictionary_choice)
     
     # Find words that can be formed by adding one letter to the rack
-    bingos = find_extension_bingos(rack_letters, target_words)
+    bingos = find_extension_bingos(rack, target_length, mask)
     
     return jsonify({'bingos': bingos})
 
-def find_possible_bingos(rack, word_list):
+def _bingo_rack_problem(rack):
+    """Why *rack* is too big to check for bingos, or None if it is not."""
+    if len(rack) > BINGO_MAX_LETTERS:
+        return f"at most {BINGO_MAX_LETTERS} tiles"
+    if rack.count('?') > BINGO_MAX_BLANKS:
+        return f"at most {BINGO_MAX_BLANKS} blanks"
+    return None
+
+def find_possible_bingos(rack, mask):
     """
     Find all 7-letter words that can be formed with the given rack.
     
     Args:
-        rack: List of letters in the rack
-        word_list: Set of valid words
+        rack: Rack letters, '?' for a blank
+        mask: Lexicon mask (see game_logic.word_index)
     
     Returns:
         List of valid 7-letter words that can be formed
     """
-    # Handle blank tiles (represented by '?')
-    has_blank = False
-    rack_without_blanks = []
-    
-    for letter in rack:
-        if letter == '?':
-            has_blank = True
-        else:
-            rack_without_blanks.append(letter)
-    
-    # Convert rack to a Counter for letter counting
-    from collections import Counter
-    rack_counter = Counter(rack_without_blanks)
-    
-    # Find all possible 7-letter words
-    bingos = []
-    
-    for word in word_list:
-        if len(word) == 7:
-            word_counter = Counter(word)
-            
-            # Check if word can be formed with the rack
-            can_form = True
-            blanks_needed = 0
-            
-            for letter, count in word_counter.items():
-                available = rack_counter.get(letter, 0)
-                if available < count:
-                    blanks_needed += (count - available)
-                    if (has_blank and blanks_needed > 1) or (not has_blank and blanks_needed > 0):
-                        can_form = False
-                        break
-            
-            if can_form:
-                bingos.append(word)
-    
-    return bingos
+    # Alphagram look-ups: 1 per rack, 26 with one blank, 351 with two
+    return lexicons.get('word_index').bingos(rack, 7, mask)
 
-def find_extension_bingos(rack, target_words):
+def find_extension_bingos(rack, target_length, mask):
     """
     Find all words of the target length that can be formed by adding one letter to the rack.
     
     Args:
-        rack: List of letters in the rack
-        target_words: List of words of the target length
+        rack: Rack letters
+        target_length: Length of the words to find
+        mask: Lexicon mask (see game_logic.word_index)
     
     Returns:
         List of valid words that can be formed by adding one letter
     """
-    from collections import Counter
-    rack_counter = Counter(rack)
-    
-    # Find words that can be formed by adding one letter
-    bingos = []
-    
-    for word in target_words:
-        word_counter = Counter(word)
-        
-        # Calculate how many extra letters are needed
-        extra_letters_needed = 0
-        for letter, count in word_counter.items():
-            if count > rack_counter.get(letter, 0):
-                extra_letters_needed += count - rack_counter.get(letter, 0)
-        
-        # If we only need to add one letter, this is a valid extension bingo
-        if extra_letters_needed == 1:
-            bingos.append(word)
-    
-    return bingos
+    return lexicons.get('word_index').extension_bingos(rack, target_length, mask)
+
+@app.route('/score_move', methods=['POST'])
+def score_move():
+    """Score a player's move and check every word it forms.
+
+    Expects the board as sent to /get_move plus the move itself: *word*
+    (the whole main word, lower case for blanks), *row*, *col* and
+    *direction* ("H" or "V").  Scoring and the cross-word check share the
+    board's cross table, so no perpendicular word is rebuilt per tile.
+    """
+    data = request.get_json()
+    try:
+        board = Board.from_string(data['board'])
+        move = Move(data['word'], int(data['row']), int(data['col']), data['direction'], 0, [])
+    except (KeyError, TypeError, ValueError, AttributeError) as e:
+        return jsonify({"message": f"Bad move: {e}", "error": True}), 400
+    problem = _move_problem(board, move)
+    if problem:
+        return jsonify({"message": f"Bad move: {problem}", "error": True}), 400
+
+    dawg = lexicons.get('dawg')
+    has_extension, main_word, main_valid = check_extended_main_word(board, move, dawg)
+    if not has_extension:
+        main_word = move.word.upper()
+        main_valid = dawg.is_word(main_word)
+    words = [{"word": main_word, "valid": main_valid}]
+    words += [{"word": w, "valid": v} for w, v in extract_cross_words(board, move, dawg)]
+
+    return jsonify({
+        "score": board.calculate_score(move),
+        "words": words,
+        "valid": all(w["valid"] for w in words),
+    })
+
+def _move_problem(board, move):
+    """Why *move* cannot be scored on *board*, or None if it can."""
+    size = board.layout.size
+    if len(board.grid) != size or any(len(row) != size for row in board.grid):
+        return f"the board must be {size}x{size}"
+    if move.direction not in (H, V):
+        return f"direction must be {H!r} or {V!r}"
+    if not (isinstance(move.word, str) and move.word.isascii() and move.word.isalpha()):
+        return "the word must be letters only (lower case for blanks)"
+    end_row = move.row + (len(move.word) - 1 if move.direction == V else 0)
+    end_col = move.col + (len(move.word) - 1 if move.direction == H else 0)
+    if min(move.row, move.col) < 0 or max(end_row, end_col) >= size:
+        return "the word does not fit on the board"
+    return None
 
 @app.route('/get_move', methods=['POST'])
 def get_move():
@@ -450,6 +397,9 @@ def get_move():
     player_rack = data['playerRack']
     bot_rack = data['botRack']
     tile_bag = data['tileBag']
+    # Boards of games that send an id are kept between turns (see
+    # game_logic.sessions), so anchors and cross-checks are only updated
+    game_id = data.get('gameId')
 
     print("Received request for bot move:")
     print(f"Board state: \n{board_state[:]}...")  # Print just the beginning for brevity
@@ -457,8 +407,10 @@ def get_move():
     print(f"Tile bag length: {len(tile_bag)}")
 
     try:
-        # Process the move using game logic
-        bot_move_result = make_bot_move(board_state, player_rack, bot_rack, tile_bag)
+        # Process the move using game logic; a kept board is locked for the
+        # whole turn, as the bot's play is applied to it
+        with games.session(game_id, board_state) if game_id else nullcontext() as board:
+            bot_move_result = make_bot_move(board_state, player_rack, bot_rack, tile_bag, board=board)
         
         # Check the type of move
         if bot_move_result.get('move') == 'play':
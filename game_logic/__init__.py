@@ -1,9 +1,11 @@
 """Public interface for the new game_logic package."""
 from pathlib import Path
-from .dawg import Dawg
+from .dawg import Dawg, PackedDawg
+from .gaddag import Gaddag
 from .board import Board
-from .generator import find_all_moves
+from .generator import find_all_moves, find_best_moves
 from .bot import make_bot_move
+from .lexicon import CompiledLexicon, open_gaddag, open_lexicon
 
 def load_word_list(path: str | Path) -> set[str]:
     """Return an UPPER-CASE set of words from a plain-text list."""
@@ -12,8 +14,14 @@ def load_word_list(path: str | Path) -> set[str]:
 
 __all__ = [
     "Dawg",
+    "PackedDawg",
+    "Gaddag",
     "Board",
     "find_all_moves",
+    "find_best_moves",
     "make_bot_move",
-    "load_word_list"
+    "load_word_list",
+    "CompiledLexicon",
+    "open_gaddag",
+    "open_lexicon",
 ]
\ No newline at end of file
@@ -5,12 +5,14 @@ This version includes improved cross-check handling for better validation.
 """
 from __future__ import annotations
 
-from typing import List, Set, Tuple, Dict
-from collections import Counter
+from typing import Dict, Iterable, List, Set, Tuple
+from collections import Counter, OrderedDict
 import string
+import threading
+import weakref
 
 # Constants ------------------------------------------------------------
-SIZE = 15
+SIZE = 15  # of the standard board, see BoardLayout
 H, V = "H", "V"
 
 # Bonus squares – classic layout (0‑based).  Only those needed for scoring
@@ -42,62 +44,275 @@ TILE_POINTS = {
     **{ch: 8 for ch in "JX"},
     **{ch: 10 for ch in "QZ"},
 }
+# Cross-check masks: bit i set when letter i (A=0) may be played
+ALL_LETTERS = (1 << 26) - 1
+
+# Cross-check masks remembered per lexicon, keyed by the (before, after)
+# fragments – single letters and short words recur on almost every board
+CROSS_CHECK_CACHE_SIZE = 8192
+
+# grid snapshot → binary digits (reversed, it gives the occupancy bitboard)
+_OCCUPIED_DIGITS = str.maketrans(
+    "." + string.ascii_letters, "0" + "1" * len(string.ascii_letters)
+)
+
+# Tile values as they appear on the grid: lower case (a blank) is worth 0
+POINTS = {**TILE_POINTS, **{ch.lower(): 0 for ch in TILE_POINTS}}
+
+
+class BoardLayout:
+    """Board geometry: size, centre square and premium squares.
+
+    Everything looked up per square is built once per layout: flat letter /
+    word multipliers indexed ``r * size + c`` (premiums only apply to newly
+    placed tiles), the same split into lines – row i for H, column i for V,
+    so a play along either direction indexes its line the same way – the
+    coordinates of every line, and bitboard masks (square ``(r, c)`` is bit
+    ``r * size + c``).  ``STANDARD`` is the classic 15×15 board; give
+    ``Board`` another layout for a 21×21 board or different premiums.
+    """
+
+    __slots__ = (
+        "size", "centre", "tw", "dw", "tl", "dl",
+        "letter_mult", "word_mult", "line_letter_mult", "line_word_mult", "cells",
+        "all_squares", "centre_mask", "_first_col", "_last_col",
+    )
+
+    def __init__(
+        self,
+        size: int,
+        tw: Iterable[Tuple[int, int]] = (),
+        dw: Iterable[Tuple[int, int]] = (),
+        tl: Iterable[Tuple[int, int]] = (),
+        dl: Iterable[Tuple[int, int]] = (),
+        centre: Tuple[int, int] | None = None,
+    ):
+        self.size = size
+        self.centre = centre if centre is not None else (size // 2, size // 2)
+        self.tw, self.dw, self.tl, self.dl = (frozenset(p) for p in (tw, dw, tl, dl))
+        squares = [(r, c) for r in range(size) for c in range(size)]
+        self.letter_mult = [3 if sq in self.tl else 2 if sq in self.dl else 1 for sq in squares]
+        self.word_mult = [3 if sq in self.tw else 2 if sq in self.dw else 1 for sq in squares]
+        letter_rows = [self.letter_mult[i:i + size] for i in range(0, size * size, size)]
+        word_rows = [self.word_mult[i:i + size] for i in range(0, size * size, size)]
+        self.line_letter_mult = {H: letter_rows, V: [list(col) for col in zip(*letter_rows)]}
+        self.line_word_mult = {H: word_rows, V: [list(col) for col in zip(*word_rows)]}
+        self.cells = {
+            H: [[(i, j) for j in range(size)] for i in range(size)],
+            V: [[(j, i) for j in range(size)] for i in range(size)],
+        }
+        self.all_squares = (1 << (size * size)) - 1
+        self._first_col = sum(1 << (r * size) for r in range(size))
+        self._last_col = self._first_col << (size - 1)
+        self.centre_mask = self.bit(*self.centre)
+
+    def bit(self, r: int, c: int) -> int:
+        return 1 << (r * self.size + c)
+
+    def squares_mask(self, squares: Iterable[Tuple[int, int]]) -> int:
+        """Bitboard of *squares*."""
+        size, mask = self.size, 0
+        for r, c in squares:
+            mask |= 1 << (r * size + c)
+        return mask
+
+    def mask_squares(self, mask: int) -> Set[Tuple[int, int]]:
+        """The ``(row, col)`` squares set in bitboard *mask*."""
+        size, squares = self.size, set()
+        while mask:
+            low = mask & -mask
+            squares.add(divmod(low.bit_length() - 1, size))
+            mask ^= low
+        return squares
+
+    def neighbours(self, mask: int) -> int:
+        """Squares orthogonally next to any square of *mask*."""
+        return (
+            (mask << self.size)
+            | (mask >> self.size)
+            | ((mask & ~self._last_col) << 1)
+            | ((mask & ~self._first_col) >> 1)
+        ) & self.all_squares
+
+
+STANDARD = BoardLayout(SIZE, TW, DW, TL, DL)
+# Premium multipliers of the standard board by square, ``[r][c]``
+LETTER_MULT = STANDARD.line_letter_mult[H]
+WORD_MULT = STANDARD.line_word_mult[H]
+
+class CrossTable:
+    """Perpendicular words through the empty squares, for one direction of play.
+
+    For a tile placed at ``(r, c)`` in a move along *direction*,
+    ``sums[r][c]`` is the point total of the board tiles it joins
+    perpendicularly, or *None* if it forms no cross‑word; ``before`` /
+    ``after`` hold the letters of those tiles on either side.  Scoring the
+    cross‑word is then ``(sum + letter * lmult) * wmult`` and checking it a
+    single look‑up of ``before + letter + after``, with no board walking.
+    """
+
+    __slots__ = ("direction", "layout", "sums", "before", "after")
+
+    def __init__(self, grid: List[List[str]], direction: str, layout: BoardLayout = STANDARD):
+        self.direction = direction
+        self.layout = layout
+        size = layout.size
+        self.sums: List[List[int | None]] = [[None] * size for _ in range(size)]
+        self.before: List[List[str]] = [[""] * size for _ in range(size)]
+        self.after: List[List[str]] = [[""] * size for _ in range(size)]
+        for r in range(size):
+            for c in range(size):
+                if grid[r][c] == ".":
+                    self.update(grid, r, c)
+
+    def update(self, grid: List[List[str]], r: int, c: int) -> None:
+        """Recompute the entry for ``(r, c)`` from *grid*."""
+        if grid[r][c] != ".":
+            self.sums[r][c] = None
+            self.before[r][c] = self.after[r][c] = ""
+            return
+        # Cross-words run perpendicular to the move
+        dr, dc = (1, 0) if self.direction == H else (0, 1)
+        rr, cc = r - dr, c - dc
+        while rr >= 0 and cc >= 0 and grid[rr][cc] != ".":
+            rr, cc = rr - dr, cc - dc
+        before = [grid[rr + k * dr][cc + k * dc] for k in range(1, (r - rr) + (c - cc))]
+        rr, cc = r + dr, c + dc
+        size = self.layout.size
+        while rr < size and cc < size and grid[rr][cc] != ".":
+            rr, cc = rr + dr, cc + dc
+        after = [grid[r + k * dr][c + k * dc] for k in range(1, (rr - r) + (cc - c))]
+        if before or after:
+            self.sums[r][c] = sum(POINTS[t] for t in before) + sum(POINTS[t] for t in after)
+            self.before[r][c] = "".join(before).upper()
+            self.after[r][c] = "".join(after).upper()
+        else:
+            self.sums[r][c] = None
+            self.before[r][c] = self.after[r][c] = ""
+
+    def word(self, r: int, c: int, letter: str) -> str | None:
+        """Cross‑word formed by *letter* at ``(r, c)`` (upper case), or *None*."""
+        if self.sums[r][c] is None:
+            return None
+        return self.before[r][c] + letter.upper() + self.after[r][c]
+
+    def score(self, r: int, c: int, letter: str) -> int:
+        """Points of the cross‑word formed by a new *letter* at ``(r, c)``."""
+        total = self.sums[r][c]
+        if total is None:
+            return 0
+        i = r * self.layout.size + c
+        return (total + POINTS[letter] * self.layout.letter_mult[i]) * self.layout.word_mult[i]
 
 
 class Board:
-    """15×15 board with helper methods used by the generator."""
+    """Square board (15×15 unless given another ``BoardLayout``) with helper
+    methods used by the generator.
+
+    Anchors, cross tables and cross‑checks are computed on first use and
+    kept for the position; ``apply_move`` / ``place_tiles`` then update only
+    the squares a play affects, so a board kept across turns never rescans
+    all 225 squares.  Any other change – assigning ``grid``, or writing a
+    row or square of it in place – drops the cached data.
+
+    ``line`` gives a row, or a column from a cached transpose of the grid,
+    so the generator handles both directions with one code path.
+    Occupancy and anchors are also kept as bitboards (see ``BoardLayout``),
+    so emptiness and anchor updates are a few integer operations.
+    """
 
-    __slots__ = ("grid",)
+    __slots__ = ("_grid", "layout", "_tables", "_anchors", "_checks", "_rows", "_columns", "_occupied")
 
-    def __init__(self, grid: List[List[str]] | None = None):
+    def __init__(self, grid: List[List[str]] | None = None, layout: BoardLayout = STANDARD):
         if grid is None:
-            grid = [["." for _ in range(SIZE)] for _ in range(SIZE)]
+            grid = [["." for _ in range(layout.size)] for _ in range(layout.size)]
+        self.layout = layout
         self.grid = grid
 
+    @property
+    def grid(self) -> List[List[str]]:
+        return self._grid
+
+    @grid.setter
+    def grid(self, grid: List[List[str]]) -> None:
+        # Copied into rows that report writes, see _Row
+        self._grid = _Grid(self, grid)
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop the cached position data.  Writing to ``grid`` does this by
+        itself (``place_tiles`` updates the data instead)."""
+        self._tables: Dict[str, CrossTable] | None = None
+        self._anchors: int | None = None  # bitboard
+        self._checks: Dict["Dawg", Dict[Tuple[int, int], Dict[str, int]]] = {}
+        self._rows: List[List[str]] | None = None
+        self._columns: List[List[str]] | None = None
+        self._occupied: int | None = None
+
     # ----------------------------------------------------------- parsing
     @classmethod
-    def from_string(cls, s: str) -> "Board":
+    def from_string(cls, s: str, layout: BoardLayout = STANDARD) -> "Board":
         rows = [row.split() for row in s.strip().splitlines() if row.strip()]
-        return cls(rows)
+        return cls(rows, layout)
 
     def to_string(self) -> str:
-        return "\n".join(" ".join(r) for r in self.grid)
+        return "\n".join(" ".join(r) for r in self._grid)
 
     def __str__(self) -> str:
+        size = self.layout.size
         result = []
-        result.append("  " + " ".join(f"{i:2d}" for i in range(SIZE)))
-        result.append("  " + "-" * 45)
+        result.append("  " + " ".join(f"{i:2d}" for i in range(size)))
+        result.append("  " + "-" * 3 * size)
         
-        for r in range(SIZE):
+        for r in range(size):
             line = f"{r:2d}|"
-            for c in range(SIZE):
-                cell = self.grid[r][c] if self.grid[r][c] != "." else " "
+            for c in range(size):
+                cell = self._grid[r][c] if self._grid[r][c] != "." else " "
                 line += f" {cell} "
             line += "|"
             result.append(line)
         
-        result.append("  " + "-" * 45)
+        result.append("  " + "-" * 3 * size)
         return "\n".join(result)
 
     # ------------------------------------------------ anchors / helpers
     def is_first_move(self) -> bool:
-        return all(cell == "." for row in self.grid for cell in row)
+        return not self.occupancy()
+
+    def occupancy(self) -> int:
+        """Bitboard of the occupied squares."""
+        if self._occupied is None:
+            squares = "".join("".join(row) for row in self._grid)
+            self._occupied = int(squares.translate(_OCCUPIED_DIGITS)[::-1], 2)
+        return self._occupied
+
+    def anchor_mask(self) -> int:
+        """Bitboard of the anchors: empty squares next to a tile, or the
+        centre on an empty board."""
+        occupied = self.occupancy()
+        if self._anchors is None:
+            layout = self.layout
+            self._anchors = layout.neighbours(occupied) & ~occupied if occupied else layout.centre_mask
+        return self._anchors
 
     def anchors(self) -> Set[Tuple[int, int]]:
         """Return all squares where a new word must touch existing tiles."""
-        if self.is_first_move():
-            return {(7, 7)}
-        anchors: Set[Tuple[int, int]] = set()
-        for r in range(SIZE):
-            for c in range(SIZE):
-                if self.grid[r][c] != ".":
-                    continue
-                for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
-                    nr, nc = r + dr, c + dc
-                    if 0 <= nr < SIZE and 0 <= nc < SIZE and self.grid[nr][nc] != ".":
-                        anchors.add((r, c))
-                        break
-        return anchors
+        return self.layout.mask_squares(self.anchor_mask())
+
+    def line(self, direction: str, index: int) -> List[str]:
+        """Row *index* (H) or column *index* (V) as a list of squares.
+
+        Both come from plain copies of the grid kept with the position (the
+        generator indexes them in its innermost loops); treat the result as
+        read-only and change the board through ``place_tiles``.
+        """
+        if direction == H:
+            if self._rows is None:
+                self._rows = [list(row) for row in self._grid]
+            return self._rows[index]
+        if self._columns is None:
+            self._columns = [list(col) for col in zip(*self._grid)]
+        return self._columns[index]
 
     def get_full_word(self, r: int, c: int, direction: str) -> Tuple[str, int, int]:
         """
@@ -115,14 +330,14 @@ class Board:
         if direction == H:
             # Find the start of the word (leftmost letter)
             start_c = c
-            while start_c > 0 and self.grid[r][start_c-1] != ".":
+            while start_c > 0 and self._grid[r][start_c-1] != ".":
                 start_c -= 1
             
             # Build the word from left to right
             word = ""
             cc = start_c
-            while cc < SIZE and self.grid[r][cc] != ".":
-                word += self.grid[r][cc]
+            while cc < self.layout.size and self._grid[r][cc] != ".":
+                word += self._grid[r][cc]
                 cc += 1
             
             return (word, r, start_c)
@@ -130,87 +345,129 @@ class Board:
         else:  # direction == V
             # Find the start of the word (topmost letter)
             start_r = r
-            while start_r > 0 and self.grid[start_r-1][c] != ".":
+            while start_r > 0 and self._grid[start_r-1][c] != ".":
                 start_r -= 1
             
             # Build the word from top to bottom
             word = ""
             rr = start_r
-            while rr < SIZE and self.grid[rr][c] != ".":
-                word += self.grid[rr][c]
+            while rr < self.layout.size and self._grid[rr][c] != ".":
+                word += self._grid[rr][c]
                 rr += 1
             
             return (word, start_r, c)
 
-    def cross_checks(self, dawg: "Dawg") -> Dict[Tuple[int, int], Dict[str, Set[str]]]:
+    def cross_table(self, direction: str) -> CrossTable:
+        """Cross‑word sums for moves along *direction*, built once per position."""
+        if self._tables is None:
+            self._tables = {H: CrossTable(self._grid, H, self.layout), V: CrossTable(self._grid, V, self.layout)}
+        return self._tables[direction]
+
+    def cross_checks(self, dawg: "Dawg") -> Dict[Tuple[int, int], Dict[str, int]]:
         """
         Pre‑compute legal letters for each empty square (horizontal & vertical).
-        Enhanced to ensure cross-words validity.
+
+        Each entry is a 26‑bit mask (bit *i* set when letter *i*, A=0, may be
+        played there); squares without a perpendicular neighbour allow
+        ``ALL_LETTERS``.
         """
-        from .dawg import Dawg  # local import to avoid cycle
-
-        checks: Dict[Tuple[int, int], Dict[str, Set[str]]] = {}
-        az = set(string.ascii_uppercase)
-
-        for r in range(SIZE):
-            for c in range(SIZE):
-                if self.grid[r][c] != ".":
-                    continue
-                
-                # Horizontal cross‑check (what letters can go here when playing horizontally?)
-                # We need to check what vertical word would be formed
-                top = ""
-                rr = r - 1
-                while rr >= 0 and self.grid[rr][c] != ".":
-                    top = self.grid[rr][c] + top
-                    rr -= 1
-                
-                bottom = ""
-                rr = r + 1
-                while rr < SIZE and self.grid[rr][c] != ".":
-                    bottom += self.grid[rr][c]
-                    rr += 1
-                
-                # If there's no vertical constraint (no tiles above or below),
-                # any letter can go here horizontally
-                h_possible = az
-                
-                # Otherwise, check what letters would form valid vertical words
-                if top or bottom:
-                    h_possible = {
-                        ch for ch in az if dawg.is_word(top + ch + bottom)
-                    }
-                    # print(f"H cross-check at ({r},{c}): {top}X{bottom} -> {len(h_possible)} possible letters")
-                
-                # Vertical cross‑check (what letters can go here when playing vertically?)
-                # We need to check what horizontal word would be formed
-                left = ""
-                cc = c - 1
-                while cc >= 0 and self.grid[r][cc] != ".":
-                    left = self.grid[r][cc] + left
-                    cc -= 1
-                
-                right = ""
-                cc = c + 1
-                while cc < SIZE and self.grid[r][cc] != ".":
-                    right += self.grid[r][cc]
-                    cc += 1
-                
-                # If there's no horizontal constraint (no tiles to left or right),
-                # any letter can go here vertically
-                v_possible = az
-                
-                # Otherwise, check what letters would form valid horizontal words
-                if left or right:
-                    v_possible = {
-                        ch for ch in az if dawg.is_word(left + ch + right)
-                    }
-                    # print(f"V cross-check at ({r},{c}): {left}X{right} -> {len(v_possible)} possible letters")
-                
-                checks[(r, c)] = {H: h_possible, V: v_possible}
-        
+        checks = self._checks.get(dawg)
+        if checks is None:
+            checks = {}
+            # The perpendicular words around each square come from the cross tables
+            down, across = self.cross_table(H), self.cross_table(V)
+            size = self.layout.size
+            for r in range(size):
+                for c in range(size):
+                    if self._grid[r][c] == ".":
+                        checks[(r, c)] = {
+                            H: _square_check(dawg, down, r, c),
+                            V: _square_check(dawg, across, r, c),
+                        }
+            self._checks[dawg] = checks
         return checks
 
+    # ------------------------------------------------------------ playing
+    def apply_move(self, move) -> List[Tuple[int, int, str]]:
+        """Put *move* on the board; returns the ``(row, col, tile)`` placed.
+
+        Squares already holding a tile are left alone (the move plays
+        through them).  See ``place_tiles`` for what is updated.
+        """
+        placements = []
+        for idx, ch in enumerate(move.word):
+            r = move.row + (idx if move.direction == V else 0)
+            c = move.col + (idx if move.direction == H else 0)
+            if self._grid[r][c] == ".":
+                placements.append((r, c, ch))
+        self.place_tiles(placements)
+        return placements
+
+    def place_tiles(self, placements: Iterable[Tuple[int, int, str]]) -> None:
+        """Put tiles on empty squares and update the cached position data.
+
+        Only what a play can change is recomputed: the placed squares, the
+        empty squares at either end of the row and column runs through each
+        of them (their cross‑words grew) and their empty neighbours (new
+        anchors).
+        """
+        placements = list(placements)
+        for r, c, _ in placements:
+            if self._grid[r][c] != ".":
+                raise ValueError(f"square ({r}, {c}) is already occupied")
+        occupied = self.occupancy()
+        placed = self.layout.squares_mask((r, c) for r, c, _ in placements)
+        for r, c, ch in placements:
+            # Past _Row, which would drop everything updated below
+            list.__setitem__(self._grid[r], c, ch)
+            if self._rows is not None:
+                self._rows[r][c] = ch
+            if self._columns is not None:
+                self._columns[c][r] = ch
+        self._occupied = occupied | placed
+
+        # Squares whose cross-word for a horizontal (down) / vertical
+        # (across) play changed
+        down_dirty, across_dirty = set(), set()
+        for r, c, _ in placements:
+            down_dirty.add((r, c))
+            down_dirty.update(self._run_ends(r, c, 1, 0))
+            across_dirty.add((r, c))
+            across_dirty.update(self._run_ends(r, c, 0, 1))
+
+        if self._tables is not None:
+            down, across = self._tables[H], self._tables[V]
+            for r, c in down_dirty:
+                down.update(self._grid, r, c)
+            for r, c in across_dirty:
+                across.update(self._grid, r, c)
+
+        # (cross-checks are only ever built together with the tables)
+        for dawg, checks in self._checks.items():
+            for r, c, _ in placements:
+                checks.pop((r, c), None)
+            for dirty, table, direction in ((down_dirty, down, H), (across_dirty, across, V)):
+                for r, c in dirty:
+                    if self._grid[r][c] == ".":
+                        checks[(r, c)][direction] = _square_check(dawg, table, r, c)
+
+        if not occupied:
+            self._anchors = None  # the opening play decides; recompute once
+        elif self._anchors is not None:
+            self._anchors = (self._anchors | self.layout.neighbours(placed)) & ~self._occupied
+
+    def _run_ends(self, r: int, c: int, dr: int, dc: int) -> List[Tuple[int, int]]:
+        """Empty squares just beyond the run of tiles through ``(r, c)``."""
+        ends = []
+        size = self.layout.size
+        for sign in (-1, 1):
+            rr, cc = r + sign * dr, c + sign * dc
+            while 0 <= rr < size and 0 <= cc < size and self._grid[rr][cc] != ".":
+                rr, cc = rr + sign * dr, cc + sign * dc
+            if 0 <= rr < size and 0 <= cc < size:
+                ends.append((rr, cc))
+        return ends
+
     def is_move_valid(self, move, dawg: "Dawg") -> bool:
         """
         Check if a move is valid (all formed words are valid).
@@ -236,4 +493,97 @@ class Board:
             int: The score for the move
         """
         from .generator import _score_move
-        return _score_move(self, move.row, move.col, move.direction, move.word)
\ No newline at end of file
+        return _score_move(self, move.row, move.col, move.direction, move.word)
+
+
+class _Row(list):
+    """A row of ``Board.grid`` that drops its board's cached data when one
+    of its squares is written, so ``board.grid[r][c] = "A"`` stays safe."""
+
+    __slots__ = ("_board",)
+
+    def __init__(self, board: Board, squares: Iterable[str] = ()):
+        super().__init__(squares)
+        self._board = board
+
+    def __setitem__(self, i, value) -> None:
+        super().__setitem__(i, value)
+        self._board.invalidate()
+
+
+class _Grid(list):
+    """``Board.grid``: its rows are ``_Row``s, and so is any row put in."""
+
+    __slots__ = ("_board",)
+
+    def __init__(self, board: Board, rows: Iterable[Iterable[str]] = ()):
+        super().__init__(_Row(board, row) for row in rows)
+        self._board = board
+
+    def __setitem__(self, i, rows) -> None:
+        board = self._board
+        if isinstance(i, slice):
+            rows = [_Row(board, row) for row in rows]
+        else:
+            rows = _Row(board, rows)
+        super().__setitem__(i, rows)
+        board.invalidate()
+
+
+def _square_check(dawg, table: CrossTable, r: int, c: int) -> int:
+    if table.sums[r][c] is None:
+        return ALL_LETTERS
+    return cross_check_mask(dawg, table.before[r][c], table.after[r][c])
+
+
+class _MaskCache:
+    """Bounded LRU of ``(before, after) → mask`` for one lexicon."""
+
+    __slots__ = ("entries", "lock", "hits", "misses")
+
+    def __init__(self):
+        self.entries: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+
+# lexicon → its cache; entries go away with the automaton they were built from
+_MASK_CACHES: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def cross_check_mask(dawg, before: str, after: str) -> int:
+    """Mask of the letters ``ch`` for which ``before + ch + after`` is a word.
+
+    *before* is walked once and only the letters that can follow it are
+    tried, each resuming from that node instead of re‑walking from the root.
+    Results are memoized per lexicon (see ``CROSS_CHECK_CACHE_SIZE``).
+    """
+    cache = _MASK_CACHES.get(dawg)
+    if cache is None:
+        cache = _MASK_CACHES.setdefault(dawg, _MaskCache())
+    key = (before, after)
+    with cache.lock:
+        mask = cache.entries.get(key)
+        if mask is not None:
+            cache.entries.move_to_end(key)
+            cache.hits += 1
+            return mask
+        cache.misses += 1
+
+    mask = 0
+    node = dawg.walk(before)
+    if node is not None:
+        children = dawg.children_mask(node) & ALL_LETTERS
+        for i in range(26):
+            if not children >> i & 1:
+                continue
+            end = dawg.walk(after, dawg.step(node, chr(65 + i)))
+            if end is not None and dawg.is_terminal(end):
+                mask |= 1 << i
+
+    with cache.lock:
+        cache.entries[key] = mask
+        while len(cache.entries) > CROSS_CHECK_CACHE_SIZE:
+            cache.entries.popitem(last=False)
+    return mask
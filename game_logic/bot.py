@@ -1,19 +1,15 @@
 """High‑level make_bot_move exposed to Flask."""
 from __future__ import annotations
 
-from collections import Counter
 from typing import List, Dict, Any
+import os
 import random
 
-from .dawg import Dawg
 from .board import Board
-from .generator import find_all_moves
-from .validation import find_all_moves_with_validation
+from .generator import find_best_moves
 from .debug_utils import DebugUtils
-
-# Load dictionary at module import
-DICT_PATH = "static/data/NWL2023.txt"
-DAWG = Dawg.from_wordlist_file(DICT_PATH)
+from .rack import Rack
+from .registry import lexicons
 
 TILE_POINTS = {
     **{ch: 1 for ch in "EAIONRTLSU"},
@@ -25,21 +21,30 @@ TILE_POINTS = {
     **{ch: 10 for ch in "QZ"},
 }
 
+# Worker processes for the move search (see game_logic.parallel); 1 = serial
+SEARCH_WORKERS = int(os.environ.get("MOVEGEN_WORKERS", "1"))
+
 
 def make_bot_move(
     board_state: str,
     player_rack,
     bot_rack,
     tile_bag,
+    board: Board | None = None,
 ):
     """
     Returns a dict for /get_move:
         • plays use lower-case letters to mark blanks (matches your JS)
         • rack & bag are updated; blanks scored as 0
         • score still 0 for now (full scoring comes later)
+
+    Pass *board* (already matching *board_state*, e.g. from
+    ``game_logic.sessions``) to reuse its anchors and cross-checks; the
+    bot's play is then applied to it.
     """
     print("Making bot move...")
-    board = Board.from_string(board_state)
+    if board is None:
+        board = Board.from_string(board_state)
     DebugUtils.print_board(board)
     print(f"Board parsed, finding anchors...")
     
@@ -47,24 +52,23 @@ def make_bot_move(
     anchors = board.anchors()
     print(f"Found {len(anchors)} anchors: {anchors}")
 
-    # build Counter with '' for blanks
-    rack_counter = Counter(
-        "" if not t.get("letter") else t["letter"].upper()
-        for t in bot_rack
-    )
-    print(f"Bot rack: {rack_counter}")
+    # tile counts, '' letter = blank
+    rack = Rack.from_letters(t.get("letter") or "" for t in bot_rack)
+    print(f"Bot rack: {rack}")
 
     # Generate potential moves
-    moves = find_all_moves_with_validation(board, rack_counter.copy(), DAWG)
+    # Built on first use (or already warmed in the background, see registry)
+    dawg = lexicons.get("dawg")
+    # Only the best move is needed: a bounded top-K search, not a full list
+    moves = find_best_moves(board, rack, dawg, gaddag=lexicons.get("gaddag"), k=1, workers=SEARCH_WORKERS)
     
     # Debug: check the moves
     print(f"Found {len(moves)} possible moves")
-    for i, move in enumerate(sorted(moves, key=lambda m: m.total_score, reverse=True)[:5]):
+    for i, move in enumerate(moves):
         print(f"Move {i+1}: {move.word} at ({move.row},{move.col}) {move.direction} for {move.total_score} points")
-        # Verify move is valid
-        if not DAWG.is_word(move.word.upper()):
-            print(f"WARNING: Invalid word generated: {move.word}")
     
+    # Generated moves are legal by construction (see game_logic.validation
+    # for the sampled shadow check), so there is nothing to filter
     if not moves:
         print("No valid moves found. Bot will pass.")
         return {
@@ -73,57 +77,21 @@ def make_bot_move(
             "newTileBag": tile_bag,
         }
 
-    # Filter out invalid words (additional validation)
-    valid_moves = [move for move in moves if DAWG.is_word(move.word.upper())]
-    
-    if not valid_moves:
-        print("No valid words found after filtering. Bot will exchange or pass.")
-        if len(tile_bag) >= 7:  # Only exchange if there are enough tiles in the bag
-            # Exchange up to 3 random tiles
-            num_to_exchange = min(3, len(bot_rack))
-            tiles_to_exchange = random.sample(bot_rack, num_to_exchange)
-            exchanged_indices = [bot_rack.index(t) for t in tiles_to_exchange]
-            
-            # Remove exchanged tiles from rack
-            new_bot_rack = [t for i, t in enumerate(bot_rack) if i not in exchanged_indices]
-            
-            # Add exchanged tiles back to the bag
-            new_tile_bag = tile_bag + tiles_to_exchange
-            
-            # Draw new tiles
-            drawn = new_tile_bag[:num_to_exchange]
-            new_tile_bag = new_tile_bag[num_to_exchange:]
-            new_bot_rack.extend(drawn)
-            
-            return {
-                "move": "exchange",
-                "exchanged": [t["letter"] for t in tiles_to_exchange],
-                "newBotRack": new_bot_rack,
-                "newTileBag": new_tile_bag,
-            }
-        else:
-            return {
-                "move": "pass",
-                "newBotRack": bot_rack,
-                "newTileBag": tile_bag,
-            }
-
-    # Sort by score and pick the best
-    valid_moves.sort(key=lambda m: m.total_score, reverse=True)
-    best = valid_moves[0]
+    # Moves come best first
+    best = moves[0]
 
     # Debug output
     print(f"Selected best move: {best.word} at ({best.row},{best.col}) {best.direction}")
     print(f"Move score: {best.score}, Rack equity: {best.rack_equity:.2f}, Total: {best.total_score:.2f}")
 
-    # ----- consume rack tiles used in best.word ------------------------
-    used = Counter("" if ch.islower() else ch for ch in best.word)
-    rack_counter.subtract(used)
-    # clean zeros
-    rack_counter += Counter()
+    board.apply_move(best)
+
+    # ----- consume the tiles placed (not those already on the board) ----
+    for ch in best.tiles:
+        rack.take_tile(ch)
 
     # ----- draw replacements ------------------------------------------
-    need = 7 - sum(rack_counter.values())
+    need = 7 - len(rack)
     print(f"Bot needs {need} new tiles. Tile bag has {len(tile_bag)} tiles.")
     
     # Create a new tile bag for the return value
@@ -141,19 +109,15 @@ def make_bot_move(
         
         print(f"Drew {len(drawn)} tiles. New tile bag has {len(new_tile_bag)} tiles.")
     
-    # Add drawn tiles to rack counter
+    # Add drawn tiles to the rack
     for t in drawn:
-        key = "" if not t["letter"] else t["letter"].upper()
-        rack_counter[key] += 1
+        rack.put_tile((t["letter"] or "").upper())
 
     # ----- rebuild bot rack list (objects with letter/points) ----------
-    new_bot_rack = []
-    for letter, cnt in rack_counter.items():
-        for _ in range(cnt):
-            new_bot_rack.append({
-                "letter": "" if letter == "" else letter,
-                "points": 0 if letter == "" else TILE_POINTS[letter],
-            })
+    new_bot_rack = [
+        {"letter": letter, "points": 0 if letter == "" else TILE_POINTS[letter]}
+        for letter in rack.tiles()
+    ]
 
     return {
         "move": "play",
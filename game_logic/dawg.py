@@ -5,17 +5,84 @@ This version keeps everything in‑memory for simplicity.  It supports:
   • is_word(s)            – exact lookup
   • is_prefix(p)          – prefix test used by the move generator
 
-If you later want the super‑compact on‑disk edge array described in the
-Appel & Jacobson paper, swap‐out the *_EdgeTrie* class with an mmap‑backed
-version – the rest of the API can stay the same.
+The graph is minimised while it is built (Daciuk et al., "Incremental
+construction of minimal acyclic finite‑state automata"): words are added in
+sorted order and every finished suffix subtree is merged with an equivalent
+one already in a register, so shared endings (‑ING, ‑IEST, ‑S …) are stored
+once.
+
+Two interchangeable back‑ends share that API plus a small node‑handle
+protocol for callers that walk the graph themselves – ``root()``,
+``step(node, ch)``, ``walk(s, node)``, ``is_terminal(node)``, ``flags(node)``
+and ``children_mask(node)`` – so a walk can resume from a known node instead
+of starting over at the root (``cursor()`` wraps the same in an object):
+  • Dawg        – ``_Node`` objects with a ``children`` dict (easy to build)
+  • PackedDawg  – the compact edge array of the Appel & Jacobson paper:
+                  three flat ``uint32`` arrays, node handles are plain ints
+                  and a child is found by a bitmap rank (one popcount).
+                  It can sit directly on an mmap'd lexicon file.
 """
 from __future__ import annotations
 
+from array import array
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Iterator, Tuple
+
+__all__ = ["Cursor", "Dawg", "PackedDawg", "FLAG_MASK", "SEPARATOR", "TERMINAL_BIT", "mask_letters"]
+
+# Flag stored next to the child bits of a packed node (see Dawg.pack)
+TERMINAL_BIT = 1 << 31
+# Per-word flags (e.g. which lexicons contain it) ride in bits 27–30
+FLAG_SHIFT, FLAG_MASK = 27, 0xF
+# GADDAG "turn around" symbol (see game_logic.gaddag); packed as bit 26
+SEPARATOR = "^"
+_LETTER_BITS = {chr(65 + i): 1 << i for i in range(26)}
+_LETTER_BITS[SEPARATOR] = 1 << 26
+_CHILD_BITS = (1 << 27) - 1
+
+
+def mask_letters(mask: int) -> str:
+    """The edge letters set in a ``children_mask`` (A–Z, then SEPARATOR)."""
+    return "".join(ch for ch, bit in _LETTER_BITS.items() if mask & bit)
+
+
+class Cursor:
+    """A position in a graph: the node reached by the letters walked so far.
+
+    Cursors are immutable – ``step``/``walk`` return a new cursor (or *None*
+    when the graph has no such path), so one can be kept and resumed from.
+    """
+
+    __slots__ = ("graph", "node")
+
+    def __init__(self, graph, node):
+        self.graph = graph
+        self.node = node
+
+    def step(self, ch: str) -> "Cursor | None":
+        node = self.graph.step(self.node, ch)
+        return None if node is None else Cursor(self.graph, node)
 
-__all__ = ["Dawg"]
+    def walk(self, s: str) -> "Cursor | None":
+        node = self.graph.walk(s, self.node)
+        return None if node is None else Cursor(self.graph, node)
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.graph.is_terminal(self.node)
+
+    @property
+    def flags(self) -> int:
+        return self.graph.flags(self.node)
+
+    @property
+    def children_mask(self) -> int:
+        return self.graph.children_mask(self.node)
+
+    def letters(self) -> str:
+        """Letters that can follow, in order."""
+        return mask_letters(self.graph.children_mask(self.node))
 
 
 class _Node:
@@ -23,55 +90,326 @@ class _Node:
 
     def __init__(self):
         self.children: Dict[str, _Node] = {}
-        self.terminal: bool = False
+        # 0 = not the end of a word, otherwise the word's flags (1 by default)
+        self.terminal: int = 0
 
 
 class Dawg:
-    """A really just‑a‑trie helper – fast enough for <100k words."""
+    """Minimal DAWG over upper‑case words (nodes are shared – never mutate)."""
 
     def __init__(self, root: _Node | None = None):
         self._root: _Node = root or _Node()
+        # Filled by build_from_words: node/edge counts of the plain trie
+        # ("trie_*") next to those of the minimised graph ("dawg_*").
+        self.build_stats: Dict[str, int] = {}
 
     # ---------------------------------------------------------------------
     # Public look‑ups ------------------------------------------------------
     # ---------------------------------------------------------------------
     def is_word(self, word: str) -> bool:
         """Return *True* if *word* is found in the DAWG."""
-        node = self._root
-        for ch in word.upper():
-            node = node.children.get(ch)
-            if node is None:
-                return False
-        return node.terminal
+        return self.word_flags(word) != 0
+
+    def word_flags(self, word: str) -> int:
+        """Return the flags stored for *word*, or 0 if it is not a word."""
+        node = self.walk(word)
+        return 0 if node is None else node.terminal
 
     def is_prefix(self, prefix: str) -> bool:
         """Return *True* if *prefix* is a valid start of some word."""
-        node = self._root
-        for ch in prefix.upper():
+        return self.walk(prefix) is not None
+
+    def completions(self, prefix: str) -> Iterator[str]:
+        """Yield every non‑empty *s* with ``prefix + s`` a word, in order."""
+        node = self.walk(prefix)
+        if node is None:
+            return
+        stack = [(node, "")]
+        while stack:
+            node, path = stack.pop()
+            if path and node.terminal:
+                yield path
+            for ch in sorted(node.children, reverse=True):
+                stack.append((node.children[ch], path + ch))
+
+    # ------------------------------------------------------------------
+    # Node handles (shared with PackedDawg) -----------------------------
+    # ------------------------------------------------------------------
+    def root(self) -> _Node:
+        return self._root
+
+    def cursor(self) -> Cursor:
+        return Cursor(self, self._root)
+
+    def step(self, node: _Node, ch: str) -> _Node | None:
+        """Return the child of *node* along *ch*, or *None*."""
+        return node.children.get(ch)
+
+    def walk(self, s: str, node: _Node | None = None) -> _Node | None:
+        """Follow *s* (any case) from *node* (default: the root)."""
+        if node is None:
+            node = self._root
+        for ch in s.upper():
             node = node.children.get(ch)
             if node is None:
-                return False
-        return True
+                return None
+        return node
+
+    def is_terminal(self, node: _Node) -> bool:
+        return node.terminal != 0
+
+    def flags(self, node: _Node) -> int:
+        """Flags of the word ending at *node* (0 if none ends there)."""
+        return node.terminal
+
+    def children_mask(self, node: _Node) -> int:
+        """Bit *i* set for each outgoing letter (A=0 … Z=25, SEPARATOR=26)."""
+        mask = 0
+        for ch in node.children:
+            mask |= _LETTER_BITS[ch]
+        return mask
+
+    def stats(self) -> Dict[str, int]:
+        """Count the distinct nodes and edges currently in the graph."""
+        seen = {id(self._root)}
+        stack = [self._root]
+        edges = 0
+        while stack:
+            node = stack.pop()
+            edges += len(node.children)
+            for child in node.children.values():
+                if id(child) not in seen:
+                    seen.add(id(child))
+                    stack.append(child)
+        return {"nodes": len(seen), "edges": edges}
+
+    # ------------------------------------------------------------------
+    # Serialisation ----------------------------------------------------
+    # ------------------------------------------------------------------
+    def pack(self) -> Tuple[array, array, array]:
+        """Flatten the graph into three ``uint32`` arrays (node 0 = root).
+
+        • ``info[n]``  – bit *i* set if node *n* has an edge for letter *i*
+                         (A=0 … Z=25, SEPARATOR=26); ``TERMINAL_BIT`` marks
+                         end of word, bits 27–30 hold that word's flags
+        • ``first[n]`` – index in ``edges`` of node *n*'s first edge
+        • ``edges[e]`` – target node of edge *e*; a node's edges are stored
+                         contiguously in letter order, so the edge for a
+                         letter is ``first[n] + popcount(info[n] & (bit-1))``
+        """
+        info, first, edges = array("I"), array("I"), array("I")
+        ids = {id(self._root): 0}
+        order = [self._root]
+        i = 0
+        while i < len(order):
+            node = order[i]
+            i += 1
+            mask = TERMINAL_BIT | (node.terminal << FLAG_SHIFT) if node.terminal else 0
+            first.append(len(edges))
+            for ch in sorted(node.children, key=_LETTER_BITS.__getitem__):
+                child = node.children[ch]
+                key = id(child)
+                if key not in ids:
+                    ids[key] = len(order)
+                    order.append(child)
+                edges.append(ids[key])
+                mask |= _LETTER_BITS[ch]
+            info.append(mask)
+        return info, first, edges
 
     # ------------------------------------------------------------------
     # Construction helpers ---------------------------------------------
     # ------------------------------------------------------------------
     @classmethod
     def build_from_words(cls, words: Iterable[str]) -> "Dawg":
+        wordlist = {w.strip().upper() for w in words if len(w.strip()) >= 2}
+        return cls.build_from_flags(dict.fromkeys(wordlist, 1))
+
+    @classmethod
+    def build_from_flags(cls, word_flags: Dict[str, int]) -> "Dawg":
+        """Build from ``{WORD: flags}``; flags (1–15) are kept per word and
+        read back with ``word_flags``/``flags`` – e.g. lexicon membership."""
+        if any(not 0 < f <= FLAG_MASK for f in word_flags.values()):
+            raise ValueError(f"word flags must be in 1..{FLAG_MASK}")
+        wordlist = sorted(word_flags)
+
         root = _Node()
-        for w in words:
-            w = w.strip().upper()
-            if len(w) < 2:
-                continue
-            node = root
-            for ch in w:
-                node = node.children.setdefault(ch, _Node())
-            node.terminal = True
-        return cls(root)
+        register: Dict[tuple, _Node] = {}
+        path = [root]       # nodes spelling the previous word, not yet merged
+        prev = ""
+        trie_nodes = 1
+        for w in wordlist:
+            common = 0
+            limit = min(len(w), len(prev))
+            while common < limit and w[common] == prev[common]:
+                common += 1
+            _replace_or_register(path, prev, common, register)
+            del path[common + 1:]
+
+            node = path[-1]
+            for ch in w[common:]:
+                child = _Node()
+                node.children[ch] = child
+                path.append(child)
+                node = child
+            node.terminal = word_flags[w]
+            trie_nodes += len(w) - common
+            prev = w
+        _replace_or_register(path, prev, 0, register)
+
+        dawg = cls(root)
+        after = dawg.stats()
+        dawg.build_stats = {
+            "words": len(wordlist),
+            "trie_nodes": trie_nodes,
+            "trie_edges": trie_nodes - 1,
+            "dawg_nodes": after["nodes"],
+            "dawg_edges": after["edges"],
+        }
+        return dawg
 
     @classmethod
     def from_wordlist_file(cls, path: str | Path) -> "Dawg":
         path = Path(path)
         with path.open("r", encoding="utf8") as fh:
             words = (line.strip() for line in fh)
-            return cls.build_from_words(words)
\ No newline at end of file
+            return cls.build_from_words(words)
+
+
+
+class PackedDawg:
+    """Array‑backed DAWG; node handles are ints (the root is node 0).
+
+    *info*, *first* and *edges* are the arrays produced by ``Dawg.pack`` –
+    either ``array('I')`` objects or ``uint32`` memoryviews into a mapped
+    lexicon file (see ``game_logic.lexicon``).
+    """
+
+    __slots__ = ("_info", "_first", "_edges", "_root", "__weakref__")
+
+    def __init__(self, info, first, edges):
+        self._info = info
+        self._first = first
+        self._edges = edges
+        self._root = 0
+
+    # ------------------------------------------------------------------
+    # Node handles -----------------------------------------------------
+    # ------------------------------------------------------------------
+    def root(self) -> int:
+        return 0
+
+    def cursor(self) -> Cursor:
+        return Cursor(self, 0)
+
+    def step(self, node: int, ch: str) -> int | None:
+        """Return the child of *node* along *ch*, or *None*."""
+        bit = _LETTER_BITS.get(ch)
+        if bit is None:
+            return None
+        mask = self._info[node]
+        if not mask & bit:
+            return None
+        return self._edges[self._first[node] + (mask & (bit - 1)).bit_count()]
+
+    def is_terminal(self, node: int) -> bool:
+        return bool(self._info[node] & TERMINAL_BIT)
+
+    def flags(self, node: int) -> int:
+        """Flags of the word ending at *node* (0 if none ends there)."""
+        return (self._info[node] >> FLAG_SHIFT) & FLAG_MASK
+
+    def children_mask(self, node: int) -> int:
+        """Bit *i* set for each outgoing letter (A=0 … Z=25, SEPARATOR=26)."""
+        return self._info[node] & _CHILD_BITS
+
+    def walk(self, s: str, node: int | None = None) -> int | None:
+        """Follow *s* (any case) from *node* (default: the root)."""
+        if node is None:
+            node = 0
+        for ch in s.upper():
+            node = self.step(node, ch)
+            if node is None:
+                return None
+        return node
+
+    # ------------------------------------------------------------------
+    # Public look‑ups ------------------------------------------------------
+    # ------------------------------------------------------------------
+    def is_word(self, word: str) -> bool:
+        """Return *True* if *word* is found in the DAWG."""
+        node = self.walk(word)
+        return node is not None and self.is_terminal(node)
+
+    def word_flags(self, word: str) -> int:
+        """Return the flags stored for *word*, or 0 if it is not a word."""
+        node = self.walk(word)
+        return 0 if node is None else self.flags(node)
+
+    def is_prefix(self, prefix: str) -> bool:
+        """Return *True* if *prefix* is a valid start of some word."""
+        return self.walk(prefix) is not None
+
+    def completions(self, prefix: str) -> Iterator[str]:
+        """Yield every non‑empty *s* with ``prefix + s`` a word, in order."""
+        node = self.walk(prefix)
+        if node is None:
+            return
+        info, first, edges = self._info, self._first, self._edges
+        stack = [(node, "")]
+        while stack:
+            node, path = stack.pop()
+            mask = info[node]
+            if path and mask & TERMINAL_BIT:
+                yield path
+            # Children sit in letter order from first[node]; push them reversed
+            children = [i for i in range(26) if mask >> i & 1]
+            base = first[node]
+            for k in range(len(children) - 1, -1, -1):
+                stack.append((edges[base + k], path + chr(65 + children[k])))
+
+    def stats(self) -> Dict[str, int]:
+        return {"nodes": len(self._info), "edges": len(self._edges)}
+
+    # ------------------------------------------------------------------
+    # Construction helpers ---------------------------------------------
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_dawg(cls, dawg: Dawg) -> "PackedDawg":
+        return cls(*dawg.pack())
+
+    @classmethod
+    def build_from_words(cls, words: Iterable[str]) -> "PackedDawg":
+        return cls.from_dawg(Dawg.build_from_words(words))
+
+    @classmethod
+    def from_wordlist_file(cls, path: str | Path) -> "PackedDawg":
+        return cls.from_dawg(Dawg.from_wordlist_file(path))
+
+
+def _replace_or_register(path: list, word: str, keep: int, register: Dict[tuple, _Node]) -> None:
+    """Merge the nodes of *path* below depth *keep* into the register.
+
+    Works bottom‑up so a node's children are already canonical when its
+    signature (terminal flag + outgoing letters/targets) is computed.
+    """
+    for depth in range(len(path) - 1, keep, -1):
+        node = path[depth]
+        key = (node.terminal, tuple((ch, id(c)) for ch, c in node.children.items()))
+        twin = register.get(key)
+        if twin is None:
+            register[key] = node
+        else:
+            path[depth - 1].children[word[depth - 1]] = twin
+
+
+if __name__ == "__main__":
+    import sys
+
+    for arg in sys.argv[1:]:
+        st = Dawg.from_wordlist_file(arg).build_stats
+        print(
+            f"{arg}: {st['words']:,} words – trie {st['trie_nodes']:,} nodes / "
+            f"{st['trie_edges']:,} edges → DAWG {st['dawg_nodes']:,} nodes / "
+            f"{st['dawg_edges']:,} edges"
+        )
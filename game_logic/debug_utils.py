@@ -7,7 +7,6 @@ from __future__ import annotations
 from typing import List, Dict, Tuple, Set
 import sys
 import json
-from .board import TW, DW, TL, DL
 
 class DebugUtils:
     @staticmethod
@@ -34,27 +33,29 @@ class DebugUtils:
         BG_YELLOW = "\033[43m"
         
         # Print column headers
-        print("\n     " + "   ".join(f"{chr(ord('a') + i)}" for i in range(15)))
+        layout = board.layout
+        size = layout.size
+        print("\n     " + "   ".join(f"{chr(ord('a') + i)}" for i in range(size)))
         
         # Print top border
-        print("   ┌" + "───┬" * 14 + "───┐")
+        print("   ┌" + "───┬" * (size - 1) + "───┐")
         
-        for r in range(15):
+        for r in range(size):
             # Print row with cell content
             row_content = f"{r+1:2} │"
-            for c in range(15):
+            for c in range(size):
                 cell = board.grid[r][c]
                 pos = (r, c)
                 
                 # If cell is empty, show special space marker
                 if cell == ".":
-                    if pos in TW:
+                    if pos in layout.tw:
                         cell_display = RED + "TW " + RESET
-                    elif pos in DW:
+                    elif pos in layout.dw:
                         cell_display = MAGENTA + "DW " + RESET
-                    elif pos in TL:
+                    elif pos in layout.tl:
                         cell_display = BLUE + "TL " + RESET
-                    elif pos in DL:
+                    elif pos in layout.dl:
                         cell_display = CYAN + "DL " + RESET
                     else:
                         cell_display = "   "
@@ -70,11 +71,11 @@ class DebugUtils:
             print(row_content)
             
             # Print row separator (except after the last row)
-            if r < 14:
-                print("   ├" + "───┼" * 14 + "───┤")
+            if r < size - 1:
+                print("   ├" + "───┼" * (size - 1) + "───┤")
         
         # Print bottom border
-        print("   └" + "───┴" * 14 + "───┘")
+        print("   └" + "───┴" * (size - 1) + "───┘")
         
         # Add a legend for special spaces
         print("\nLegend:")
@@ -105,28 +106,30 @@ class DebugUtils:
         BG_YELLOW = "\033[43m"
         
         # Print column headers
+        layout = board.layout
+        size = layout.size
         print("   ", end="")
-        for i in range(15):               # 15 → a-o
+        for i in range(size):             # 15 → a-o
             ch = chr(ord('a') + i)        # 0→'a', 1→'b', …
             print(ch, end=" ")
         print()
-        print("  +" + "-" * 30 + "+")
+        print("  +" + "-" * 2 * size + "+")
         
-        for r in range(15):
+        for r in range(size):
             row = f"{r:2}|"
-            for c in range(15):
+            for c in range(size):
                 cell = board.grid[r][c]
                 pos = (r, c)
                 
                 # If cell is empty, show special space marker
                 if cell == ".":
-                    if pos in TW:
+                    if pos in layout.tw:
                         cell_display = RED + "#" + RESET
-                    elif pos in DW:
+                    elif pos in layout.dw:
                         cell_display = MAGENTA + "%" + RESET
-                    elif pos in TL:
+                    elif pos in layout.tl:
                         cell_display = BLUE + "=" + RESET
-                    elif pos in DL:
+                    elif pos in layout.dl:
                         cell_display = CYAN + "+" + RESET
                     else:
                         cell_display = " "
@@ -142,7 +145,7 @@ class DebugUtils:
             row += "|"
             print(row)
         
-        print("  +" + "-" * 30 + "+")
+        print("  +" + "-" * 2 * size + "+")
         
         # Add a legend for special spaces
         print("\nLegend:")
@@ -164,7 +167,7 @@ class DebugUtils:
         r, c = move.row, move.col
         direction = move.direction
         word = move.word
-        SIZE = 15
+        SIZE = board.layout.size
         
         # Apply the move to a temporary board
         from copy import deepcopy
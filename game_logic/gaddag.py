@@ -0,0 +1,76 @@
+"""GADDAG lexicon for bidirectional move generation (Gordon, 1994).
+
+Every word *w* of length n is stored n times: for each split point
+``1 ≤ i ≤ n`` the string ``rev(w[:i]) + "^" + w[i:]`` (the separator is
+dropped when i = n).  Starting on an anchor square the generator can then
+walk *left* through the reversed prefix, cross the ``^`` edge and carry on
+*right* – so a word is grown from the anchor outward and every path stays
+in contact with the board, instead of enumerating board‑blind left parts.
+
+The strings are fed to the same minimising builder as ``Dawg`` and can be
+packed/mmap'd the same way (``game_logic.lexicon.open_gaddag``), so the
+structure exposes the usual node‑handle protocol (``root``, ``step``,
+``walk``, ``is_terminal``, ``children_mask`` …) over the 26 letters plus
+``SEPARATOR``.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .dawg import Cursor, Dawg, PackedDawg, SEPARATOR
+
+__all__ = ["Gaddag", "SEPARATOR", "gaddag_strings"]
+
+
+def gaddag_strings(word: str) -> Iterator[str]:
+    """Yield the GADDAG paths for *word* (``CAT`` → ``TAC``, ``C^AT``, ``AC^T``)."""
+    yield word[::-1]
+    for i in range(1, len(word)):
+        yield word[i - 1::-1] + SEPARATOR + word[i:]
+
+
+class Gaddag:
+    """Thin wrapper giving a GADDAG graph the Dawg look‑up API."""
+
+    __slots__ = ("_graph", "root", "step", "walk", "is_terminal", "flags", "children_mask")
+
+    def __init__(self, graph: Dawg | PackedDawg):
+        self._graph = graph
+        # Bound methods of the underlying graph – the generator calls these
+        # in its innermost loop, so skip one level of indirection.
+        self.root = graph.root
+        self.step = graph.step
+        self.walk = graph.walk
+        self.is_terminal = graph.is_terminal
+        self.flags = graph.flags
+        self.children_mask = graph.children_mask
+
+    def cursor(self) -> Cursor:
+        return Cursor(self, self.root())
+
+    def is_word(self, word: str) -> bool:
+        """Return *True* if *word* is in the lexicon (walks ``rev(word)``)."""
+        return self._graph.is_word(word.upper()[::-1])
+
+    def stats(self):
+        return self._graph.stats()
+
+    def pack(self):
+        return self._graph.pack()
+
+    @classmethod
+    def build_from_words(cls, words: Iterable[str], packed: bool = False) -> "Gaddag":
+        paths = [
+            p
+            for w in {w.strip().upper() for w in words}
+            if len(w) >= 2
+            for p in gaddag_strings(w)
+        ]
+        graph = Dawg.build_from_words(paths)
+        return cls(PackedDawg.from_dawg(graph) if packed else graph)
+
+    @classmethod
+    def from_wordlist_file(cls, path: str | Path, packed: bool = False) -> "Gaddag":
+        with Path(path).open("r", encoding="utf8") as fh:
+            return cls.build_from_words(fh, packed)
@@ -1,15 +1,27 @@
-"""Recursive move generator (LeftPart + ExtendRight) – *simplified*.
+"""Recursive move generator (LeftPart + ExtendRight).
 
-Only the happy‑path first version: no blanks, no scoring, no cross‑word
-validation yet.  It yields moves that are *legal wrt anchors & rack*.
-Polish and scoring come later.
+Moves are built from each anchor (Appel & Jacobson, 1988): a left part of
+rack tiles on the empty squares before it, or the board tiles already
+there, then extended right to the edge.  Blanks, cross‑checks (see
+``Board.cross_checks``) and scoring are handled as the words are walked,
+so every move is legal and scored once it is recorded; ``find_best_moves``
+also skips what cannot make its top *k* (see ``_Bounds``).
+
+A second mode walks a GADDAG (see ``game_logic.gaddag``): words are grown
+left from each anchor through the reversed prefix and then right after the
+separator, so every partial word touches the board.  Pick it per call with
+``find_all_moves(..., gaddag=...)``.
 """
 from __future__ import annotations
 
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 from collections import Counter
-from .board import Board, H, V, TW, DW, TL, DL, TILE_POINTS
-from .dawg import Dawg
+from heapq import heappush, heapreplace
+from .board import ALL_LETTERS, Board, H, V, POINTS
+from .dawg import Dawg, SEPARATOR
+from .gaddag import Gaddag
+from .rack import BLANK, LETTERS, Rack
+from .validation import shadow
 
 RACK_EQUITIES = {
     '': 25.6,
@@ -40,7 +52,9 @@ RACK_EQUITIES = {
     'Y': -0.6,
     'Z': 5.1
 }
-
+# Same values by rack slot (A–Z, then the blank), see game_logic.rack
+_SLOT_EQUITIES = [RACK_EQUITIES[ch] for ch in LETTERS] + [RACK_EQUITIES['']]
+_SLOTS = tuple(enumerate(LETTERS))
 
 class Move:
     __slots__ = ("word", "row", "col", "direction", "score", "tiles", "rack_equity", "total_score")
@@ -62,97 +76,451 @@ class Move:
 # ---------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------
-def find_all_moves(board: Board, rack: Counter, dawg: Dawg) -> List[Move]:
-    """Return *all* moves legal with current rack with rack equity considered."""
-    moves: List[Move] = []
-    cross_checks = board.cross_checks(dawg)
+def find_all_moves(
+    board: Board,
+    rack: Rack | Counter,
+    dawg: Dawg,
+    gaddag: Gaddag | None = None,
+    workers: int | None = None,
+) -> List[Move]:
+    """Return *all* moves legal with current rack with rack equity considered.
+
+    *rack* is a ``Rack`` or a ``Counter`` with ``""`` for blanks; it is not
+    modified.  With *gaddag* the moves are generated in GADDAG mode (same
+    move set, grown outward from each anchor); otherwise LeftPart/ExtendRight
+    over *dawg*.  *dawg* is still used for cross‑checks.  Moves are legal by
+    construction, so none are filtered out; ``validation.shadow`` re‑checks
+    a sample of them.  With *workers* > 1 the anchors are searched in a process pool (see
+    ``game_logic.parallel``); the result is the same.
+    """
+    rack = Rack.coerce(rack)
     
     # Debug
     print(f"Finding moves with rack: {rack}")
+
+    cross_checks = board.cross_checks(dawg)
+    cross_scores = {H: board.cross_table(H).sums, V: board.cross_table(V).sums}
+    anchors = board.anchors()
+    if workers is not None and workers > 1:
+        from .parallel import search_moves
+        moves = search_moves(board, rack, dawg, gaddag, workers, cross_checks, cross_scores, anchors)
+    else:
+        moves = []
+        for (r, c) in anchors:
+            for d in (H, V):
+                _search_anchor(board, rack, dawg, gaddag, r, c, d, anchors, moves, cross_checks, cross_scores[d])
     
-    for (r, c) in board.anchors():
-        # Debug
-        # print(f"Checking anchor at ({r}, {c})")
-        
-        # horizontal moves (left-parts)
-        if c > 0 and board.grid[r][c - 1] == ".":
-            _gen_left_parts(
-                board, rack, dawg, r, c, [], dawg._root, min(c, 7), moves, cross_checks, H
-            )
-        # vertical moves
-        if r > 0 and board.grid[r - 1][c] == ".":
-            _gen_left_parts(
-                board, rack, dawg, r, c, [], dawg._root, min(r, 7), moves, cross_checks, V
-            )
-    
-    # Filter out invalid words
-    valid_moves = []
-    invalid_words = []
-    
+    # Every generated move is legal (cross-check masks + board prefixes), so
+    # there is no filtering here; a sample may be re-checked, see
+    # game_logic.validation.shadow
     for move in moves:
-        word_to_check = move.word.upper()
-        if dawg.is_word(word_to_check):
-            # Calculate the remaining rack after this move
-            remaining_rack = rack.copy()
-            
-            # Only consider tiles that weren't already on the board
-            for idx, ch in enumerate(move.word):
-                r = move.row + (idx if move.direction == V else 0)
-                c = move.col + (idx if move.direction == H else 0)
-                
-                # Only subtract from rack if this position was empty
-                if board.grid[r][c] == ".":
-                    # For blank tiles (lowercase in the word)
-                    if ch.islower():
-                        remaining_rack[""] -= 1
-                    else:
-                        remaining_rack[ch] -= 1
-            
-            # Calculate rack equity for remaining tiles
-            rack_equity = calculate_rack_equity(remaining_rack)
-            
-            # Add equity to the move object
-            move.rack_equity = rack_equity
-            move.total_score = move.score + rack_equity
-            
-            valid_moves.append(move)
-    
-    if invalid_words:
-        # print(f"Filtered out {len(invalid_words)} invalid words: {invalid_words[:10]}")
-        pass
+        # Only tiles that weren't already on the board leave the rack
+        move.tiles = placed_tiles(board, move)
+        for ch in move.tiles:
+            rack.take_tile(ch)
+        
+        # Calculate rack equity for remaining tiles
+        rack_equity = calculate_rack_equity(rack)
+        for ch in move.tiles:
+            rack.put_tile(ch)
+        
+        # Add equity to the move object
+        move.rack_equity = rack_equity
+        move.total_score = move.score + rack_equity
     
     # Sort by total score (move score + rack equity)
-    valid_moves.sort(key=lambda m: m.total_score, reverse=True)
-    return valid_moves
+    moves.sort(key=lambda m: m.total_score, reverse=True)
+    shadow.check(board, moves, dawg)
+    return moves
+
+
+def find_best_moves(
+    board: Board,
+    rack: Rack | Counter,
+    dawg: Dawg,
+    gaddag: Gaddag | None = None,
+    k: int = 1,
+    workers: int | None = None,
+) -> List[Move]:
+    """Return the *k* best moves by ``total_score``, best first.
+
+    Moves are streamed into a bounded heap as they are found instead of
+    being collected and sorted, in either mode (GADDAG with *gaddag*,
+    LeftPart/ExtendRight without).  Anchors are searched in order of their
+    score upper bound, and an anchor or subtree whose bound (see
+    ``_Bounds``) cannot beat the current k‑th best is not searched at all.
+    *workers* > 1 spreads the anchors over a process pool, as in
+    ``find_all_moves``.
+    """
+    rack = Rack.coerce(rack)
+    cross_scores = {H: board.cross_table(H).sums, V: board.cross_table(V).sums}
+    anchors = board.anchors()
+    bounds = _Bounds(board, rack, cross_scores)
+
+    # Most promising anchors first, so the k-th best score rises early
+    order = sorted(
+        ((bounds.anchor_bound(r, c, d), r, c, d) for (r, c) in anchors for d in (H, V)),
+        reverse=True,
+    )
+    cross_checks = board.cross_checks(dawg)
+    if workers is not None and workers > 1:
+        from .parallel import search_best_moves
+        best = search_best_moves(board, rack, dawg, gaddag, k, order, workers, cross_checks, cross_scores, anchors)
+    else:
+        best = _best_of(board, rack, dawg, gaddag, k, order, cross_checks, cross_scores, bounds, anchors)
+    shadow.check(board, best, dawg)
+    return best
 
 
-def calculate_rack_equity(remaining_rack: Counter) -> float:
+def calculate_rack_equity(remaining_rack: Rack | Counter) -> float:
     """
     Calculate the equity value of the remaining rack.
     Penalizes duplicate letters with -4 points for each duplicated letter.
     
     Args:
-        remaining_rack: Counter of remaining tiles after a move
+        remaining_rack: Rack (or Counter, "" = blank) of remaining tiles after a move
     
     Returns:
         float: The equity value of the remaining rack
     """
+    if not isinstance(remaining_rack, Rack):
+        remaining_rack = Rack.from_counter(remaining_rack)
+    return _leave_equity(remaining_rack.counts)
+
+
+def _leave_equity(counts: List[int]) -> float:
     # Base equity from letter values
-    equity = sum(RACK_EQUITIES.get(tile, 0) * count for tile, count in remaining_rack.items())
-    
-    # Apply penalty for duplicate letters (-4 for each duplicate)
-    for tile, count in remaining_rack.items():
-        # Skip blank tiles (represented by empty string)
-        if tile and count > 1:
-            # -4 points for each duplicate (beyond the first occurrence)
-            equity -= 4 * (count - 1)
+    equity = sum(v * n for v, n in zip(_SLOT_EQUITIES, counts))
     
+    # Apply penalty for duplicate letters (-4 for each duplicate beyond the
+    # first occurrence); blanks are not penalised
+    for i in range(26):
+        if counts[i] > 1:
+            equity -= 4 * (counts[i] - 1)
     return equity
 
 
+def placed_tiles(board: Board, move: Move) -> List[str]:
+    """Letters *move* puts on empty squares (lower‑case = blank), in order."""
+    tiles = []
+    for idx, ch in enumerate(move.word):
+        r = move.row + (idx if move.direction == V else 0)
+        c = move.col + (idx if move.direction == H else 0)
+        if board.grid[r][c] == ".":
+            tiles.append(ch)
+    return tiles
+
+
 # ---------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------
+def _search_anchor(board, rack, dawg, gaddag, r, c, direction, anchors, moves, cross_checks, cross_scores,
+                   top=None, bounds=None) -> None:
+    """Append the moves of anchor ``(r, c)`` in *direction* to *moves*, or
+    with *top* offer them to it, skipping what *bounds* shows cannot make it."""
+    if gaddag is not None:
+        _gaddag_anchor(board, rack, gaddag, r, c, direction, anchors, moves, cross_checks, cross_scores, top, bounds)
+        return
+    # LeftPart mode (Appel–Jacobson): the left part is either the tiles
+    # already on the board just before the anchor, or rack tiles on the
+    # empty non-anchor squares before it.  Left parts never reach another
+    # anchor, so every move is generated from its leftmost anchor only.
+    line = _Line(board, direction, r if direction == H else c, cross_checks, cross_scores, rack, top, bounds)
+    anchor = c if direction == H else r
+    squares = line.squares
+    i = anchor - 1
+    if i >= 0 and squares[i] != ".":
+        while i >= 0 and squares[i] != ".":
+            i -= 1
+        prefix = "".join(squares[i + 1:anchor])
+        node = dawg.walk(prefix)
+        if node is not None:
+            _extend_right(rack, dawg, line, anchor, prefix, node, moves, sum(POINTS[ch] for ch in prefix))
+        return
+    # At least one tile goes on the anchor, so the rest is the most a left
+    # part can use
+    most = len(rack) - 1
+    limit = 0
+    while i >= 0 and limit < most and squares[i] == "." and line.cells[i] not in anchors:
+        limit += 1
+        i -= 1
+    _gen_left_parts(rack, dawg, line, anchor, [], dawg.root(), limit, moves)
+
+
+def _best_of(board, rack, dawg, gaddag, k, order, cross_checks, cross_scores, bounds, anchors) -> List[Move]:
+    """Top *k* over the ``(bound, r, c, direction)`` units of *order*, which
+    is sorted by bound, highest first."""
+    top = _TopK(k)
+    for bound, r, c, d in order:
+        if bound <= top.floor:
+            break  # every anchor left is bounded lower still
+        _search_anchor(board, rack, dawg, gaddag, r, c, d, anchors, None, cross_checks, cross_scores[d], top, bounds)
+    return top.moves()
+
+
+class _Line:
+    """One row (H) or column (V) flattened for a search along it: its
+    squares (see ``Board.line``), their coordinates, cross‑check masks
+    (*None* on occupied squares), premiums and cross‑word sums, all
+    indexed by position along the line.
+
+    A LeftPart search with *rack* keeps its state here too: the letters a
+    blank may trade squares with (see ``_settle_blanks``) and, looking for
+    the best moves only, the *top* heap moves are offered to and the
+    line's rightward reach tables from *bounds*."""
+
+    __slots__ = ("direction", "cells", "squares", "checks", "lmult", "wmult", "sides",
+                 "counts", "held", "top", "bounds", "reach")
+
+    def __init__(self, board: Board, direction: str, index: int, cross_checks, cross_scores,
+                 rack: Rack | None = None, top: "_TopK | None" = None, bounds: "_Bounds | None" = None):
+        layout = board.layout
+        self.direction = direction
+        self.cells = layout.cells[direction][index]
+        self.squares = board.line(direction, index)
+        self.checks = [cross_checks[rc][direction] if rc in cross_checks else None for rc in self.cells]
+        self.lmult = layout.line_letter_mult[direction][index]
+        self.wmult = layout.line_word_mult[direction][index]
+        self.sides = [cross_scores[r][c] for r, c in self.cells]
+        self.counts = rack.counts if rack is not None else None
+        self.held = rack.letter_mask() if rack is not None else 0
+        self.top = top
+        self.bounds = bounds
+        self.reach = bounds.line(direction, index)[0] if bounds is not None else None
+
+    def record(self, moves: List[Move], word: str, end: int, placed) -> None:
+        """Append *word*, whose last letter is on square *end*, with the
+        running score *placed* (see ``_left_part_score``) to *moves*, or
+        offer it to ``top``."""
+        start = end + 1 - len(word)
+        score = _final_score(*placed)
+        if not word.isupper():
+            word, after = _settle_blanks(word, start, self, placed[1])
+            score -= after
+        r, c = self.cells[start]
+        if self.top is None:
+            moves.append(Move(word, r, c, self.direction, score, list(word)))
+            return
+        squares = self.squares
+        tiles = [ch for pos, ch in enumerate(word, start) if squares[pos] == "."]
+        self.top.offer(score, self.counts, lambda: Move(word, r, c, self.direction, score, tiles))
+
+
+def _settle_blanks(word: str, start: int, line: _Line, mult: int) -> Tuple[str, int]:
+    """Put the blanks of *word* (laid from square *start*) where they cost least.
+
+    A blank is only ever played as a letter once no real copy of it is left
+    (the search tries real tiles first), so a word holding both a blank and
+    a real tile of one letter is found once, with the blank on whichever
+    square came last.  Any of those squares will do for the blank; this
+    moves it to the cheapest one – lowest letter premium times the word
+    multiplier *mult*, plus the cross‑word multiplier where one is formed.
+
+    Returns ``(word, after)``: the settled word and what real letters on
+    the blanks' squares would score.  The search counts such a blank at its
+    letter's value (see ``_left_part_score``), so that is taken off.
+    """
+    squares, lmult, wmult, sides = line.squares, line.lmult, line.wmult, line.sides
+    chars = list(word)
+    after = 0
+    for blank in {ch for ch in word if ch.islower()}:
+        letter = blank.upper()
+        spots = [p for p in range(start, start + len(word)) if squares[p] == "." and chars[p - start].upper() == letter]
+        blanks = sum(chars[p - start] == blank for p in spots)
+        if not blanks or blanks == len(spots):
+            continue  # nothing to trade places with
+        weight = {p: lmult[p] * (mult + (wmult[p] if sides[p] is not None else 0)) for p in spots}
+        spots.sort(key=lambda p: (weight[p], p))
+        for k, p in enumerate(spots):
+            chars[p - start] = blank if k < blanks else letter
+        after += POINTS[letter] * sum(weight[p] for p in spots[:blanks])
+    return "".join(chars), after
+
+
+def _final_score(main: int, mult: int, cross: int, new_tiles: int) -> int:
+    return main * mult + cross + (50 if new_tiles == 7 else 0)
+
+
+class _TopK:
+    """The *k* best moves seen so far: a min‑heap on total score."""
+
+    __slots__ = ("k", "heap", "floor", "_equity", "_seq")
+
+    def __init__(self, k: int):
+        self.k = k
+        self.heap: List[Tuple[float, int, Move]] = []
+        self.floor = float("-inf")  # total a move must beat to get in
+        self._equity: Dict[bytes, float] = {}  # leave → equity
+        self._seq = 0
+
+    def offer(self, score: int, leave: List[int], make_move) -> None:
+        """Consider a move scoring *score* that keeps *leave* (rack counts);
+        *make_move* builds it only if it makes the cut."""
+        key = bytes(leave)
+        equity = self._equity.get(key)
+        if equity is None:
+            equity = self._equity[key] = _leave_equity(leave)
+        total = score + equity
+        if total <= self.floor:
+            return
+        move = make_move()
+        move.rack_equity = equity
+        move.total_score = total
+        self._seq += 1
+        if len(self.heap) < self.k:
+            heappush(self.heap, (total, -self._seq, move))
+        else:
+            heapreplace(self.heap, (total, -self._seq, move))
+        if len(self.heap) == self.k:
+            self.floor = self.heap[0][0]
+
+    def moves(self) -> List[Move]:
+        return [m for _, _, m in sorted(self.heap, reverse=True)]
+
+
+class _Bounds:
+    """Score upper bounds for a best‑moves search with one rack on one board.
+
+    For each line (a row for H, a column for V), each square and each number
+    *m* of tiles still to be placed, ``reach`` tables hold what those tiles
+    could at best add when laid from that square onward in one direction:
+
+        gain   – board tiles joined + the rack's highest values paired with
+                 the best letter premiums among the next *m* empty squares
+        mult   – product of the word premiums of those squares
+        cross  – sum of their best possible cross‑word scores
+        room   – how many of the *m* tiles fit before the edge
+
+    A search state ``(main, mult, cross, new)`` can then finish at most at
+    ``(main + gain) * mult * wmult + cross + xcross`` plus the better of the
+    bingo bonus (when all tiles fit) and the best leave the rack allows.
+    """
+
+    __slots__ = ("_board", "_cross_scores", "_values", "_tiles", "_blanks", "_keep", "_lines", "no_reach")
+
+    def __init__(self, board: Board, rack: Rack, cross_scores):
+        self._board = board
+        self._cross_scores = cross_scores
+        # Tile values on the rack, highest first (a blank is worth 0).  These
+        # are the whole rack's, so they also cover a real tile a blank later
+        # trades squares with (see ``_settle_blanks``)
+        self._values = sorted((POINTS[ch] for i, ch in _SLOTS for _ in range(rack.counts[i])), reverse=True)
+        self._values += [0] * rack.blanks
+        self._tiles = len(self._values)
+        # Reach of a direction the word cannot grow in, for any tile count
+        self.no_reach = [(0, 1, 0, 0)] * (self._tiles + 1)
+        self._blanks = rack.blanks
+        # Best equity of keeping exactly t tiles, by number of blanks still
+        # held: each copy of a letter adds its equity, less the duplicate
+        # penalty after the first, so the best t are the t largest of these
+        gains = []
+        for i, n in enumerate(rack.counts[:26]):
+            eq = _SLOT_EQUITIES[i]
+            gains += [eq] + [eq - 4] * (n - 1) if n else []
+        self._keep = []
+        for blanks in range(rack.blanks + 1):
+            ranked = sorted(gains + [_SLOT_EQUITIES[BLANK]] * blanks, reverse=True)
+            self._keep.append([sum(ranked[:t]) for t in range(self._tiles + 1)])
+        self._lines: Dict[Tuple[str, int], Tuple[list, list]] = {}
+
+    def line(self, direction: str, index: int) -> Tuple[list, list]:
+        """``(rightward, leftward)`` reach tables of a row (H) or column (V)."""
+        key = (direction, index)
+        tables = self._lines.get(key)
+        if tables is None:
+            layout, sums = self._board.layout, self._cross_scores[direction]
+            line = (
+                self._board.line(direction, index),
+                layout.line_letter_mult[direction][index],
+                layout.line_word_mult[direction][index],
+                [sums[r][c] for r, c in layout.cells[direction][index]],
+            )
+            tables = self._lines[key] = (
+                [self._reach(line, pos, 1) for pos in range(layout.size)],
+                [self._reach(line, pos, -1) for pos in range(layout.size)],
+            )
+        return tables
+
+    def _reach(self, line, pos: int, step: int) -> list:
+        squares, lmults, wmults, sides = line
+        values, n = self._values, self._tiles
+        top = values[0] if values else 0
+        out: list = [None] * (n + 1)
+        board_pts, wmult, cross = 0, 1, 0
+        lms: List[int] = []
+
+        def entry():
+            ranked = sorted(lms, reverse=True)
+            return (board_pts + sum(v * lm for v, lm in zip(values, ranked)), wmult, cross, len(lms))
+
+        i = pos
+        while 0 <= i < len(squares) and len(lms) < n + 1:
+            square = squares[i]
+            if square != ".":
+                board_pts += POINTS[square]
+            else:
+                out[len(lms)] = entry()
+                if len(lms) == n:
+                    break
+                lm, wm, side = lmults[i], wmults[i], sides[i]
+                lms.append(lm)
+                wmult *= wm
+                if side is not None:
+                    cross += (side + top * lm) * wm
+            i += step
+        last = entry()
+        for m in range(n + 1):
+            if out[m] is None:
+                out[m] = last
+        return out
+
+    def bound(self, reach, main: int, mult: int, cross: int, new: int, blanks: int) -> float:
+        """Best total a state can still reach: the best over how many of
+        its remaining tiles are played, of the score that many could add
+        plus the best leave of the rest (or the bingo bonus for all)."""
+        left = self._tiles - new
+        keep = self._keep[blanks]
+        best = float("-inf")
+        for j in range(left + 1):
+            gain, wmult, xcross, room = reach[j]
+            if room < j:
+                break
+            total = (main + gain) * mult * wmult + cross + xcross + keep[left - j]
+            if j == left and new + j == 7:
+                total += 50
+            if total > best:
+                best = total
+        return best
+
+    def anchor_bound(self, r: int, c: int, direction: str) -> float:
+        """Bound on every move the search from this anchor can find (the
+        same moves in either mode: those whose leftmost anchor it is)."""
+        right, leftward = self.line(direction, r if direction == H else c)
+        anchor = c if direction == H else r
+        beyond = right[anchor + 1] if anchor + 1 < len(right) else self.no_reach
+        return self.bound(_join_all(leftward[anchor], beyond), 0, 1, 0, 0, self._blanks)
+
+
+def _join_all(a, b):
+    """Reach of growing both left (*a*) and right (*b*) with up to *m*
+    tiles: each part is the best over the ways of splitting the *m* tiles
+    between the two sides (taken separately, so still an over‑estimate)."""
+    joined = []
+    for m in range(len(a)):
+        gain = mult = cross = room = 0
+        for i in range(m + 1):
+            x, y = a[i], b[m - i]
+            if x[0] + y[0] > gain:
+                gain = x[0] + y[0]
+            if x[1] * y[1] > mult:
+                mult = x[1] * y[1]
+            if x[2] + y[2] > cross:
+                cross = x[2] + y[2]
+            if x[3] + y[3] > room:
+                room = x[3] + y[3]
+        joined.append((gain, mult, cross, room))
+    return joined
+
 
 def _score_move(board: Board, r0: int, c0: int, direction: str, word: str) -> int:
     """
@@ -160,366 +528,347 @@ def _score_move(board: Board, r0: int, c0: int, direction: str, word: str) -> in
       • lower-case letters in *word* are blanks (0 pts)
       • premiums apply **only** to newly-placed tiles (squares currently ".")
       • bingo = +50 for 7 fresh tiles
+
+    Cross-words come from the board's cross table (see ``Board.cross_table``),
+    so no perpendicular word is rebuilt here.
     """
+    cross_table = board.cross_table(direction)
+    layout = board.layout
+    index, start = (r0, c0) if direction == H else (c0, r0)
+    squares, cells = board.line(direction, index), layout.cells[direction][index]
+    lmult, wmult = layout.line_letter_mult[direction][index], layout.line_word_mult[direction][index]
     main_pts, main_mult = 0, 1
-    new_tile_count = 0
-    SIZE = 15
-
-    def letter_points(ch: str) -> int:
-        # Safety check - don't try to score empty cells
-        if ch == ".":
-            return 0
-        return 0 if ch.islower() else TILE_POINTS[ch]
-
-    # Track positions where we'll place new tiles
-    new_positions = []
-    for idx, ch in enumerate(word):
-        r = r0 + (idx if direction == V else 0)
-        c = c0 + (idx if direction == H else 0)
-        if board.grid[r][c] == ".":  # This is a new tile
-            new_positions.append((r, c, ch))
-            new_tile_count += 1
-    
-    # Score the main word by checking each position
-    for idx, ch in enumerate(word):
-        r = r0 + (idx if direction == V else 0)
-        c = c0 + (idx if direction == H else 0)
-        
-        # Get the letter value
-        lp = letter_points(ch)
-        lmult = 1
-        wmult = 1
-        
-        # Apply bonuses only to new tiles (if the current grid cell is empty)
-        if board.grid[r][c] == ".":
-            if (r, c) in DL:
-                lmult = 2
-            elif (r, c) in TL:
-                lmult = 3
-            if (r, c) in DW:
-                wmult = 2
-            elif (r, c) in TW:
-                wmult = 3
-                
-        main_pts += lp * lmult
-        main_mult *= wmult
-    
-    # Calculate cross-word scores
     cross_words_pts = 0
-    
-    # For each new tile, check if it forms a cross-word
-    for r, c, ch in new_positions:
-        cross_word = None
-        
-        # Get the cross-word depending on the direction of the main word
-        if direction == H:  # Main word is horizontal, check vertical cross-words
-            # Look up
-            top = ""
-            rr = r - 1
-            while rr >= 0 and board.grid[rr][c] != ".":
-                top = board.grid[rr][c] + top
-                rr -= 1
-            
-            # Look down
-            bottom = ""
-            rr = r + 1
-            while rr < SIZE and board.grid[rr][c] != ".":
-                bottom += board.grid[rr][c]
-                rr += 1
-            
-            # Only count as a cross-word if there's something above or below
-            if top or bottom:
-                cross_word = top + ch.upper() + bottom
-        
-        else:  # Main word is vertical, check horizontal cross-words
-            # Look left
-            left = ""
-            cc = c - 1
-            while cc >= 0 and board.grid[r][cc] != ".":
-                left = board.grid[r][cc] + left
-                cc -= 1
-            
-            # Look right
-            right = ""
-            cc = c + 1
-            while cc < SIZE and board.grid[r][cc] != ".":
-                right += board.grid[r][cc]
-                cc += 1
-            
-            # Only count as a cross-word if there's something to the left or right
-            if left or right:
-                cross_word = left + ch.upper() + right
-        
-        # If we found a cross-word with at least 2 letters, score it
-        if cross_word and len(cross_word) > 1:
-            # Calculate points for this cross-word
-            cross_pts = 0
-            cross_mult = 1
-            
-            # For the newly placed letter, apply premium squares
-            letter_value = letter_points(ch)
-            letter_mult = 1
-            word_mult = 1
-            
-            if (r, c) in DL:
-                letter_mult = 2
-            elif (r, c) in TL:
-                letter_mult = 3
-            
-            if (r, c) in DW:
-                word_mult = 2
-            elif (r, c) in TW:
-                word_mult = 3
-            
-            # Add the value of the played letter with any multipliers
-            cross_pts += letter_value * letter_mult
-            
-            # Now add points for existing tiles in the cross-word
-            # For a horizontal cross-word (from vertical main word)
-            if direction == V:
-                # Score letters to the left
-                cc = c - 1
-                while cc >= 0 and board.grid[r][cc] != ".":
-                    cross_pts += letter_points(board.grid[r][cc])
-                    cc -= 1
-                
-                # Score letters to the right
-                cc = c + 1
-                while cc < SIZE and board.grid[r][cc] != ".":
-                    cross_pts += letter_points(board.grid[r][cc])
-                    cc += 1
-            
-            # For a vertical cross-word (from horizontal main word)
-            else:
-                # Score letters above
-                rr = r - 1
-                while rr >= 0 and board.grid[rr][c] != ".":
-                    cross_pts += letter_points(board.grid[rr][c])
-                    rr -= 1
-                
-                # Score letters below
-                rr = r + 1
-                while rr < SIZE and board.grid[rr][c] != ".":
-                    cross_pts += letter_points(board.grid[rr][c])
-                    rr += 1
-            
-            # Apply the word multiplier to the entire cross-word
-            cross_words_pts += cross_pts * word_mult
-    
-    # Final score calculation
-    total = main_pts * main_mult + cross_words_pts
-    
-    # Bingo bonus for using all 7 tiles
-    if new_tile_count == 7:
-        total += 50
-    
-    return total
+    new_tile_count = 0
 
+    for pos, ch in enumerate(word, start):
+        if squares[pos] != ".":
+            # Tiles already on the board score at face value
+            main_pts += POINTS[ch]
+            continue
 
-def _gen_left_parts(
+        # Newly placed tile: premiums apply to the main word and its cross-word
+        new_tile_count += 1
+        main_pts += POINTS[ch] * lmult[pos]
+        main_mult *= wmult[pos]
+        cross_words_pts += cross_table.score(*cells[pos], ch)
+
+    return _final_score(main_pts, main_mult, cross_words_pts, new_tile_count)
+
+
+def _gaddag_anchor(
     board: Board,
-    rack: Counter,
-    dawg: Dawg,
+    rack: Rack,
+    gaddag: Gaddag,
     anchor_r: int,
     anchor_c: int,
+    direction: str,
+    anchors,
+    moves: List[Move] | None,
+    cross_checks,
+    cross_scores,
+    top: _TopK | None = None,
+    bounds: _Bounds | None = None,
+):
+    """Generate every move in *direction* whose leftmost (topmost) anchor
+    among its new tiles is (anchor_r, anchor_c).
+
+    Moves are appended to *moves*, or with *top* offered to it instead; then
+    *bounds* is used to skip squares from which nothing can beat ``top.floor``.
+
+    The board row/column is flattened (see ``_Line``); the walk places the
+    anchor first, moves left over board tiles and non‑anchor empty squares,
+    and after the separator moves right from anchor + 1.  The score is
+    carried along (see ``_left_part_score``), so recording a move is O(1) apart from
+    listing its tiles.
+    """
+    flat = _Line(board, direction, anchor_r if direction == H else anchor_c, cross_checks, cross_scores)
+    anchor = anchor_c if direction == H else anchor_r
+    cells, line, checks = flat.cells, flat.squares, flat.checks
+    lmult, wmult, sides = flat.lmult, flat.wmult, flat.sides
+    size = len(line)
+    blocked = [rc in anchors for rc in cells]  # other anchors stop the left walk
+    step, is_terminal, children_mask = gaddag.step, gaddag.is_terminal, gaddag.children_mask
+    counts = rack.counts
+    held = rack.letter_mask()  # letters a blank may trade squares with
+
+    if top is not None:
+        right, leftward = bounds.line(direction, anchor_r if direction == H else anchor_c)
+        beyond = right[anchor + 1] if anchor + 1 < size else bounds.no_reach
+        joined = {}  # reach of the left walk from a square, plus the right side
+
+    # score = (main, mult, cross, new tiles) so far, a blank counted at its
+    # letter's value when a real copy is on the rack (so the bounds hold
+    # wherever ``_settle_blanks`` puts it)
+    def record(word: str, start: int, score):
+        r, c = cells[start]
+        total = _final_score(*score)
+        if not word.isupper():
+            word, after = _settle_blanks(word, start, flat, score[1])
+            total -= after
+        tiles = [ch for i, ch in enumerate(word) if line[start + i] == "."]
+        if top is None:
+            moves.append(Move(word, r, c, direction, total, tiles))
+        else:
+            top.offer(total, counts, lambda: Move(word, r, c, direction, total, tiles))
+
+    def gen(pos: int, word: str, node, left: bool, score):
+        square = line[pos]
+        if square != ".":
+            nxt = step(node, square.upper())
+            if nxt is not None:
+                main, mult, cross, new = score
+                go_on(pos, square, word, nxt, left, (main + POINTS[square], mult, cross, new))
+            return
+
+        main, mult, cross, new = score
+        if top is not None and top.floor > float("-inf"):
+            # Nothing below here can make the cut: skip the subtree
+            if left:
+                reach = joined.get(pos)
+                if reach is None:
+                    reach = joined[pos] = _join_all(leftward[pos], beyond)
+            else:
+                reach = right[pos]
+            if bounds.bound(reach, main, mult, cross, new, counts[BLANK]) <= top.floor:
+                return
+
+        allowed = checks[pos]
+        lm, wm, side = lmult[pos], wmult[pos], sides[pos]
+        for i, ch in _SLOTS:
+            if not counts[i] or not allowed >> i & 1:
+                continue
+            nxt = step(node, ch)
+            if nxt is None:
+                continue
+            counts[i] -= 1
+            v = POINTS[ch] * lm
+            go_on(pos, ch, word, nxt, left,
+                  (main + v, mult * wm, cross if side is None else cross + (side + v) * wm, new + 1))
+            counts[i] += 1
+
+        if counts[BLANK]:
+            # a blank scores 0 but still takes the word multiplier; only
+            # letters the node continues with, and none still held as a tile
+            blank = (main, mult * wm, cross if side is None else cross + side * wm, new + 1)
+            letters = children_mask(node) & allowed
+            while letters:
+                low = letters & -letters
+                letters ^= low
+                i = low.bit_length() - 1
+                if counts[i]:
+                    continue
+                if held & low:
+                    v = POINTS[LETTERS[i]] * lm
+                    placed = (main + v, mult * wm, cross if side is None else cross + (side + v) * wm, new + 1)
+                else:
+                    placed = blank
+                counts[BLANK] -= 1
+                go_on(pos, LETTERS[i].lower(), word, step(node, LETTERS[i]), left, placed)   # lower-case marks blank
+                counts[BLANK] += 1
+
+    def go_on(pos: int, ch: str, word: str, node, left: bool, score):
+        if left:
+            word = ch + word
+            left_open = pos == 0 or line[pos - 1] == "."
+            if is_terminal(node) and left_open and (anchor + 1 == size or line[anchor + 1] == "."):
+                record(word, pos, score)
+            if pos > 0 and (line[pos - 1] != "." or not blocked[pos - 1]):
+                gen(pos - 1, word, node, True, score)
+            if left_open and anchor + 1 < size:
+                sep = step(node, SEPARATOR)
+                if sep is not None:
+                    gen(anchor + 1, word, sep, False, score)
+        else:
+            word = word + ch
+            if is_terminal(node) and (pos + 1 == size or line[pos + 1] == "."):
+                record(word, pos + 1 - len(word), score)
+            if pos + 1 < size:
+                gen(pos + 1, word, node, False, score)
+
+    gen(anchor, "", gaddag.root(), True, (0, 1, 0, 0))
+
+
+def _gen_left_parts(
+    rack: Rack,
+    dawg: Dawg,
+    line: _Line,
+    anchor: int,
     left_seq: List[str],
     node,
     limit: int,
     moves: List[Move],
-    cross_checks,
-    direction: str,
 ):
-    """Recursive generation of left parts of length ≤ limit."""
-    from copy import deepcopy
+    """Recursive generation of left parts of length ≤ limit, ending just
+    before square *anchor* of *line*.
 
+    *rack* is updated in place and restored before returning.
+    """
     # Once we have a left part, try to extend rightwards
+    # (_extend_right puts back every tile it takes, so no copy is needed)
     _extend_right(
-        board,
-        deepcopy(rack),
+        rack,
         dawg,
-        anchor_r,
-        anchor_c,
-        "".join(reversed(left_seq)),  # reversed because built right‑to‑left
+        line,
+        anchor,
+        "".join(left_seq),  # walked from the root, so already in reading order
         node,
         moves,
-        cross_checks,
-        direction,
+        *_left_part_score(line, left_seq, anchor),
     )
 
     if limit == 0:
         return
 
-    for ch in list(rack.keys()):
-        if rack[ch] == 0:
+    counts = rack.counts
+    for i, ch in _SLOTS:
+        if not counts[i]:
             continue
-        next_node = node.children.get(ch)
+        next_node = dawg.step(node, ch)
         if next_node is None:
             continue
-        rack[ch] -= 1
+        counts[i] -= 1
         left_seq.append(ch)
-        _gen_left_parts(
-            board,
-            rack,
-            dawg,
-            anchor_r,
-            anchor_c,
-            left_seq,
-            next_node,
-            limit - 1,
-            moves,
-            cross_checks,
-            direction,
-        )
+        _gen_left_parts(rack, dawg, line, anchor, left_seq, next_node, limit - 1, moves)
         left_seq.pop()
-        rack[ch] += 1
+        counts[i] += 1
+
+    # blank tiles can stand for any letter the node continues with, bar
+    # those still held as a real tile (tried above, see _settle_blanks)
+    if counts[BLANK]:
+        counts[BLANK] -= 1
+        letters = dawg.children_mask(node) & ALL_LETTERS
+        while letters:
+            low = letters & -letters
+            letters ^= low
+            i = low.bit_length() - 1
+            if counts[i]:
+                continue
+            next_node = dawg.step(node, LETTERS[i])
+            left_seq.append(LETTERS[i].lower())      # lower-case marks blank
+            _gen_left_parts(rack, dawg, line, anchor, left_seq, next_node, limit - 1, moves)
+            left_seq.pop()
+        counts[BLANK] += 1
+
+def _left_part_score(line: _Line, left_seq: List[str], anchor: int):
+    """Running score ``(main, mult, cross, new)`` of a left part ending just
+    before square *anchor* – computed once per left part, not once per move.
+
+    The running score is the main‑word letter sum, the word multiplier,
+    the accumulated cross‑word points and the number of new tiles.  A
+    blank standing for a letter also held as a real tile counts at that
+    letter's value, so the score bounds every square ``_settle_blanks``
+    may move the blank to (``_Line.record`` takes the blank back off).
+    """
+    main, mult, cross, new = 0, 1, 0, 0
+    squares, lmult, wmult, sides = line.squares, line.lmult, line.wmult, line.sides
+    held = line.held
+    for pos, ch in enumerate(left_seq, anchor - len(left_seq)):
+        if squares[pos] == ".":
+            if ch.islower() and held >> (ord(ch) - 97) & 1:
+                ch = ch.upper()
+            v = POINTS[ch] * lmult[pos]
+            wm = wmult[pos]
+            side = sides[pos]
+            main += v
+            mult *= wm
+            if side is not None:
+                cross += (side + v) * wm
+            new += 1
+        else:
+            main += POINTS[ch]
+    return main, mult, cross, new
+
 
 def _extend_right(
-    board: Board,
-    rack: Counter,
+    rack: Rack,
     dawg: Dawg,
-    row: int,
-    col: int,
+    line: _Line,
+    pos: int,
     prefix: str,
     node,
     moves: List[Move],
-    cross_checks,
-    direction: str,
+    main: int = 0,
+    mult: int = 1,
+    cross: int = 0,
+    new: int = 0,
 ):
-    """Extend a partial word to the board edge, now supporting blank tiles."""
-    SIZE = 15
-    r, c = row, col
+    """Extend a partial word from square *pos* of *line* to the edge.
 
-    # ------------------------------------------------------------------ HORIZONTAL
-    if direction == H:
-        square = board.grid[r][c]
+    *main*, *mult*, *cross* and *new* carry the score of *prefix* (see
+    ``_left_part_score``), so a finished word is scored without rescanning it.
+    A word is recorded only where the next square is empty or off the board.
+    """
+    squares = line.squares
+    square = squares[pos]
+    last = pos + 1 == len(squares)
+    ends = last or squares[pos + 1] == "."
 
-        # ─── Empty square ──────────────────────────────────────────────
-        if square == ".":
-            target_set = cross_checks[(r, c)][H]
+    # ─── Pre-existing board tile ───────────────────────────────────────
+    if square != ".":
+        nxt = dawg.step(node, square.upper())  # lower case: a blank on the board
+        if nxt is None:
+            return
+        new_prefix = prefix + square
+        main += POINTS[square]
+        if ends and dawg.is_terminal(nxt):
+            line.record(moves, new_prefix, pos, (main, mult, cross, new))
+        if not last:
+            _extend_right(rack, dawg, line, pos + 1, new_prefix, nxt, moves, main, mult, cross, new)
+        return
 
-            # 1) normal letters in rack
-            for ch in [k for k in rack if k]:
-                if rack[ch] == 0 or ch not in target_set:
-                    continue
-                nxt = node.children.get(ch)
-                if nxt is None:
-                    continue
-                rack[ch] -= 1
-                new_prefix = prefix + ch
-                if nxt.terminal:
-                    # Additional dictionary check to ensure valid word
-                    if dawg.is_word(new_prefix.upper()):
-                        score = _score_move(board, row, col - len(prefix), H, new_prefix)
-                        moves.append(
-                            Move(new_prefix, row, col - len(prefix), H, score, list(new_prefix))
-                        )
-                if c + 1 < SIZE:
-                    _extend_right(
-                        board, rack, dawg, r, c + 1, new_prefix,
-                        nxt, moves, cross_checks, direction
-                    )
-                rack[ch] += 1
-
-            # 2) blank tiles ("" key in rack Counter)
-            if rack.get("", 0):
-                for letter in target_set:
-                    nxt = node.children.get(letter)
-                    if nxt is None:
-                        continue
-                    rack[""] -= 1
-                    new_prefix = prefix + letter.lower()      # lower-case marks blank
-                    if nxt.terminal:
-                        # Additional dictionary check to ensure valid word
-                        if dawg.is_word(new_prefix.upper()):
-                            score = _score_move(board, row, col - len(prefix), H, new_prefix)
-                            moves.append(
-                                Move(new_prefix, row, col - len(prefix), H, score, list(new_prefix))
-                            )
-                    if c + 1 < SIZE:
-                        _extend_right(
-                            board, rack, dawg, r, c + 1, new_prefix,
-                            nxt, moves, cross_checks, direction
-                        )
-                    rack[""] += 1
-
-        # ─── Pre-existing board tile ───────────────────────────────────
-        else:
-            nxt = node.children.get(square)
-            if nxt is None:
-                return
-            new_prefix = prefix + square
-            if nxt.terminal:
-                # Additional dictionary check to ensure valid word
-                if dawg.is_word(new_prefix.upper()):
-                    score = _score_move(board, row, col - len(prefix), H, new_prefix)
-                    moves.append(Move(new_prefix, row, col - len(prefix), H, score, []))
-            if c + 1 < SIZE:
-                _extend_right(
-                    board, rack, dawg, r, c + 1, new_prefix,
-                    nxt, moves, cross_checks, direction
-                )
-
-    # ------------------------------------------------------------------ VERTICAL (mirror of above)
-    else:  # direction == V
-        square = board.grid[r][c]
-
-        if square == ".":
-            target_set = cross_checks[(r, c)][V]
-
-            for ch in [k for k in rack if k]:
-                if rack[ch] == 0 or ch not in target_set:
-                    continue
-                nxt = node.children.get(ch)
-                if nxt is None:
-                    continue
-                rack[ch] -= 1
-                new_prefix = prefix + ch
-                if nxt.terminal:
-                    # Additional dictionary check to ensure valid word
-                    if dawg.is_word(new_prefix.upper()):
-                        score = _score_move(board, row - len(prefix), col, V, new_prefix)
-                        moves.append(
-                            Move(new_prefix, row - len(prefix), col, V, score, list(new_prefix))
-                        )
-                if r + 1 < SIZE:
-                    _extend_right(
-                        board, rack, dawg, r + 1, c, new_prefix,
-                        nxt, moves, cross_checks, direction
-                    )
-                rack[ch] += 1
-
-            if rack.get("", 0):
-                for letter in target_set:
-                    nxt = node.children.get(letter)
-                    if nxt is None:
-                        continue
-                    rack[""] -= 1
-                    new_prefix = prefix + letter.lower()
-                    if nxt.terminal:
-                        # Additional dictionary check to ensure valid word
-                        if dawg.is_word(new_prefix.upper()):
-                            score = _score_move(board, row - len(prefix), col, V, new_prefix)
-                            moves.append(
-                                Move(new_prefix, row - len(prefix), col, V, score, list(new_prefix))
-                            )
-                    if r + 1 < SIZE:
-                        _extend_right(
-                            board, rack, dawg, r + 1, c, new_prefix,
-                            nxt, moves, cross_checks, direction
-                        )
-                    rack[""] += 1
-        else:
-            nxt = node.children.get(square)
-            if nxt is None:
-                return
-            new_prefix = prefix + square
-            if nxt.terminal:
-                # Additional dictionary check to ensure valid word
-                if dawg.is_word(new_prefix.upper()):
-                    score = _score_move(board, row - len(prefix), col, V, new_prefix)
-                    moves.append(Move(new_prefix, row - len(prefix), col, V, score, []))
-            if r + 1 < SIZE:
-                _extend_right(
-                    board, rack, dawg, r + 1, c, new_prefix,
-                    nxt, moves, cross_checks, direction
-                )
\ No newline at end of file
+    # ─── Empty square ──────────────────────────────────────────────────
+    counts = rack.counts
+    top = line.top
+    if top is not None and top.floor > float("-inf"):
+        # Nothing from here on can make the cut: skip the subtree
+        if line.bounds.bound(line.reach[pos], main, mult, cross, new, counts[BLANK]) <= top.floor:
+            return
+    allowed = line.checks[pos]
+    lm, wm, side = line.lmult[pos], line.wmult[pos], line.sides[pos]
+
+    # 1) normal letters in rack
+    for i, ch in _SLOTS:
+        if not counts[i] or not allowed >> i & 1:
+            continue
+        nxt = dawg.step(node, ch)
+        if nxt is None:
+            continue
+        counts[i] -= 1
+        new_prefix = prefix + ch
+        v = POINTS[ch] * lm
+        placed = (main + v, mult * wm, cross if side is None else cross + (side + v) * wm, new + 1)
+        if ends and dawg.is_terminal(nxt):
+            line.record(moves, new_prefix, pos, placed)
+        if not last:
+            _extend_right(rack, dawg, line, pos + 1, new_prefix, nxt, moves, *placed)
+        counts[i] += 1
+
+    # 2) blank tiles, as the letters both the node and the cross-checks
+    # allow, bar those still held as a real tile (see _settle_blanks)
+    if counts[BLANK]:
+        # a blank scores 0 but still takes the word multiplier (counted at
+        # its letter's value when a real copy is on the rack, see
+        # _left_part_score)
+        blank = (main, mult * wm, cross if side is None else cross + side * wm, new + 1)
+        held = line.held
+        letters = dawg.children_mask(node) & allowed
+        while letters:
+            low = letters & -letters
+            letters ^= low
+            i = low.bit_length() - 1
+            if counts[i]:
+                continue
+            if held & low:
+                v = POINTS[LETTERS[i]] * lm
+                placed = (main + v, mult * wm, cross if side is None else cross + (side + v) * wm, new + 1)
+            else:
+                placed = blank
+            nxt = dawg.step(node, LETTERS[i])
+            counts[BLANK] -= 1
+            new_prefix = prefix + LETTERS[i].lower()      # lower-case marks blank
+            if ends and dawg.is_terminal(nxt):
+                line.record(moves, new_prefix, pos, placed)
+            if not last:
+                _extend_right(rack, dawg, line, pos + 1, new_prefix, nxt, moves, *placed)
+            counts[BLANK] += 1
@@ -0,0 +1,121 @@
+"""Front/back hook index for the Hook Trainer.
+
+A *front hook* of WORD is a letter ``c`` with ``c + WORD`` valid, a *back
+hook* one with ``WORD + c`` valid.  Hooks are derived once per lexicon mask
+from the shared ``WordIndex`` – every word of length n+1 hooks its two
+n‑letter cores – and stored per word length as parallel arrays:
+
+    ids    – positions in the sorted word table
+    front  – 26‑bit letter mask (bit 0 = A)
+    back   – 26‑bit letter mask
+    counts – front / back hook counts (precomputed popcounts)
+
+so filtering by length, hook type and minimum hook count is a scan over
+small integer arrays and only the selected words are ever decoded.
+
+    hooks = HookIndex(open_word_index(), NWL)
+    for word, front, back in hooks.select(4, "front", min_hooks=3): ...
+"""
+from __future__ import annotations
+
+import string
+from array import array
+from typing import Dict, Iterator, List, Tuple
+
+from .word_index import ALL, WordIndex
+
+__all__ = ["HookIndex", "hook_letters"]
+
+
+def hook_letters(mask: int) -> List[str]:
+    """Letters whose bits are set in the 26‑bit *mask*, in order."""
+    return [ch for i, ch in enumerate(string.ascii_uppercase) if mask >> i & 1]
+
+
+class _Bucket:
+    __slots__ = ("ids", "front", "back", "front_n", "back_n")
+
+    def __init__(self, ids: array):
+        n = len(ids)
+        self.ids = ids
+        self.front = array("I", bytes(4 * n))
+        self.back = array("I", bytes(4 * n))
+        self.front_n = array("B", bytes(n))
+        self.back_n = array("B", bytes(n))
+
+
+class HookIndex:
+    """Single‑letter hooks of every word in one lexicon mask."""
+
+    def __init__(self, index: WordIndex, mask: int = ALL):
+        self._words = index.word_table
+        self._buckets: Dict[int, _Bucket] = {}
+        by_length = index.by_length(mask)
+        for length, ids in by_length.items():
+            self._buckets[length] = _Bucket(ids)
+
+        # word → slot in its bucket, one length at a time
+        for length in sorted(self._buckets):
+            longer = self._buckets.get(length + 1)
+            if longer is None:
+                continue
+            bucket = self._buckets[length]
+            slot = {self._words[i]: j for j, i in enumerate(bucket.ids)}
+            front, back = bucket.front, bucket.back
+            for i in longer.ids:
+                word = self._words[i]
+                j = slot.get(word[1:])
+                if j is not None:
+                    front[j] |= 1 << ord(word[0]) - 65
+                j = slot.get(word[:-1])
+                if j is not None:
+                    back[j] |= 1 << ord(word[-1]) - 65
+            for j in range(len(bucket.ids)):
+                bucket.front_n[j] = bin(front[j]).count("1")
+                bucket.back_n[j] = bin(back[j]).count("1")
+
+    def lengths(self) -> List[int]:
+        return sorted(self._buckets)
+
+    def hooks(self, length: int) -> Iterator[Tuple[str, int, int]]:
+        """Yield ``(word, front_mask, back_mask)`` for every word of *length*."""
+        bucket = self._buckets.get(length)
+        if bucket is None:
+            return
+        for j, i in enumerate(bucket.ids):
+            yield self._words[i], bucket.front[j], bucket.back[j]
+
+    def select(
+        self,
+        length: int,
+        hook_type: str = "both",
+        min_hooks: int = 1,
+        limit: int | None = None,
+    ) -> List[Tuple[str, List[str], List[str]]]:
+        """Words of *length* with at least *min_hooks* hooks of *hook_type*.
+
+        *hook_type* is ``"front"``, ``"back"`` or ``"both"`` (total of the
+        two).  Returns ``(word, front_letters, back_letters)`` in
+        alphabetical order, at most *limit* of them.
+        """
+        bucket = self._buckets.get(length)
+        if bucket is None:
+            return []
+        if hook_type == "front":
+            counts = bucket.front_n
+        elif hook_type == "back":
+            counts = bucket.back_n
+        else:
+            counts = [f + b for f, b in zip(bucket.front_n, bucket.back_n)]
+        out = []
+        for j, n in enumerate(counts):
+            if n < min_hooks:
+                continue
+            out.append((
+                self._words[bucket.ids[j]],
+                hook_letters(bucket.front[j]),
+                hook_letters(bucket.back[j]),
+            ))
+            if limit is not None and len(out) >= limit:
+                break
+        return out
@@ -0,0 +1,260 @@
+"""Compiled, memory‑mapped lexicon files.
+
+A plain word list is compiled once into a single binary file next to it
+(``NWL2023.txt`` → ``NWL2023.lex``) holding:
+  • a packed automaton – per‑node child bitmap + first‑edge index and a flat
+    edge → target array (see ``Dawg.pack``), served as a ``PackedDawg``
+  • a word table       – the sorted words as one ASCII blob + offset array,
+                         plus one flag byte per word
+
+Several lists can share one file (``compile_lexicons``): every word is then
+stored once and its flags say which lists contain it (bit *i* ↔ list *i*),
+in the word table and on the automaton's terminal nodes alike.
+
+Every process then ``mmap``s the file read‑only: all gunicorn workers share
+the same physical pages and a cold start costs a few syscalls instead of
+parsing ~475k lines.
+
+The same container holds a packed GADDAG (``NWL2023.gdg``) for the
+bidirectional move generator.  Build ahead of a deploy with::
+
+    python -m game_logic.lexicon static/data/NWL2023.txt static/data/CSW21.txt
+    python -m game_logic.lexicon --gaddag static/data/NWL2023.txt
+
+``open_lexicon`` / ``open_gaddag`` also (re)compile on demand when the file
+is missing or older than its source (a GADDAG takes ~30 s – prefer the CLI).
+"""
+from __future__ import annotations
+
+import argparse
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Sequence as SequenceT, Tuple
+
+from .dawg import Dawg, PackedDawg
+from .gaddag import Gaddag
+
+__all__ = [
+    "CompiledLexicon",
+    "WordTable",
+    "compile_lexicons",
+    "compile_words",
+    "compile_wordlist",
+    "open_gaddag",
+    "open_lexicon",
+    "open_lexicons",
+]
+
+MAGIC = b"TTLEX002"
+BYTE_ORDER_MARK = 0x01020304
+# magic, byte‑order mark, node count, edge count, word count, blob length
+_HEADER = struct.Struct("=8sIIIII")
+LEX_SUFFIX = ".lex"
+GADDAG_SUFFIX = ".gdg"
+
+
+# ---------------------------------------------------------------------
+# Building
+# ---------------------------------------------------------------------
+def compile_words(words: Iterable[str], dst: str | Path, gaddag: bool = False) -> Path:
+    """Compile *words* into a lexicon file at *dst* (written atomically).
+
+    With *gaddag* the file's automaton is a GADDAG instead of a DAWG.
+    """
+    wordset = {w.strip().upper() for w in words if len(w.strip()) >= 2}
+    return _write(Path(dst), dict.fromkeys(wordset, 1), gaddag)
+
+
+def compile_lexicons(srcs: SequenceT[str | Path], dst: str | Path) -> Path:
+    """Compile several plain‑text lists into one file at *dst*.
+
+    Each word is stored once; bit *i* of its flags is set if ``srcs[i]``
+    contains it.
+    """
+    if not 0 < len(srcs) <= 4:
+        raise ValueError("between 1 and 4 word lists can share a file")
+    word_flags: Dict[str, int] = {}
+    for i, src in enumerate(srcs):
+        with Path(src).open("r", encoding="utf8") as fh:
+            for line in fh:
+                w = line.strip().upper()
+                if len(w) >= 2:
+                    word_flags[w] = word_flags.get(w, 0) | 1 << i
+    return _write(Path(dst), word_flags, gaddag=False)
+
+
+def _write(dst: Path, word_flags: Dict[str, int], gaddag: bool) -> Path:
+    wordlist = sorted(word_flags)
+    if gaddag:
+        graph = Gaddag.build_from_words(wordlist)
+    else:
+        graph = Dawg.build_from_flags(word_flags)
+    info, first, edges = graph.pack()
+
+    blob = "\n".join(wordlist).encode("ascii")
+    offsets = array("I")
+    pos = 0
+    for w in wordlist:
+        offsets.append(pos)
+        pos += len(w) + 1
+    offsets.append(pos)
+
+    tmp = dst.with_name(f"{dst.name}.{os.getpid()}.tmp")
+    with tmp.open("wb") as fh:
+        fh.write(_HEADER.pack(MAGIC, BYTE_ORDER_MARK, len(info), len(edges), len(wordlist), len(blob)))
+        for section in (info, first, edges, offsets):
+            fh.write(section.tobytes())
+        fh.write(blob)
+        fh.write(bytes(word_flags[w] for w in wordlist))
+    os.replace(tmp, dst)  # other workers never see a half‑written file
+    return dst
+
+
+def compile_wordlist(src: str | Path, dst: str | Path | None = None, gaddag: bool = False) -> Path:
+    """Compile the plain‑text list *src* (default output: ``src.lex``/``.gdg``)."""
+    src = Path(src)
+    dst = Path(dst) if dst else src.with_suffix(GADDAG_SUFFIX if gaddag else LEX_SUFFIX)
+    with src.open("r", encoding="utf8") as fh:
+        return compile_words(fh, dst, gaddag)
+
+
+# ---------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------
+class WordTable(Sequence):
+    """Read‑only sorted word sequence backed by the mapped file."""
+
+    __slots__ = ("_offsets", "_blob", "_lexicon")
+
+    def __init__(self, offsets: memoryview, blob: memoryview, lexicon: "CompiledLexicon"):
+        self._offsets = offsets
+        self._blob = blob
+        self._lexicon = lexicon
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("word index out of range")
+        return str(self._blob[self._offsets[i]:self._offsets[i + 1] - 1], "ascii")
+
+    def __iter__(self) -> Iterator[str]:
+        if len(self):
+            yield from str(self._blob, "ascii").split("\n")
+
+    def __contains__(self, word) -> bool:
+        return isinstance(word, str) and self._lexicon.is_word(word)
+
+
+class CompiledLexicon:
+    """A lexicon file mapped read‑only into memory."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        with self.path.open("rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, bom, n_nodes, n_edges, n_words, blob_len = _HEADER.unpack_from(self._mm)
+        if magic != MAGIC or bom != BYTE_ORDER_MARK:
+            self._mm.close()
+            raise ValueError(f"{self.path} is not a compatible lexicon file")
+
+        view = memoryview(self._mm)
+        pos = _HEADER.size
+
+        def section(count: int) -> memoryview:
+            nonlocal pos
+            part = view[pos:pos + 4 * count].cast("I")
+            pos += 4 * count
+            return part
+
+        info = section(n_nodes)
+        first = section(n_nodes)
+        edges = section(n_edges)
+        self.dawg = PackedDawg(info, first, edges)
+        offsets = section(n_words + 1)
+        self.words = WordTable(offsets, view[pos:pos + blob_len], self)
+        pos += blob_len
+        # Flag byte of words[i] (which source lists contain it)
+        self.word_flags = view[pos:pos + n_words]
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word) -> bool:
+        return isinstance(word, str) and self.is_word(word)
+
+    def is_word(self, word: str) -> bool:
+        return self.dawg.is_word(word)
+
+    def is_prefix(self, prefix: str) -> bool:
+        return self.dawg.is_prefix(prefix)
+
+    def flags(self, word: str) -> int:
+        """Flags of *word* (0 if it is not in the file)."""
+        return self.dawg.word_flags(word)
+
+    def items(self) -> Iterator[Tuple[str, int]]:
+        """Yield ``(word, flags)`` in sorted order."""
+        return zip(self.words, self.word_flags)
+
+
+_OPEN: Dict[Path, CompiledLexicon] = {}
+
+
+def open_lexicon(src: str | Path) -> CompiledLexicon:
+    """Return the mapped lexicon for word list *src*, compiling it if needed.
+
+    Results are cached per process, so repeated calls are free.
+    """
+    src = Path(src)
+    dst = src if src.suffix == LEX_SUFFIX else src.with_suffix(LEX_SUFFIX)
+    return _open(dst, [src], lambda: compile_wordlist(src, dst))
+
+
+def open_gaddag(src: str | Path) -> Gaddag:
+    """Return the mapped GADDAG for word list *src*, compiling it if needed."""
+    src = Path(src)
+    dst = src if src.suffix == GADDAG_SUFFIX else src.with_suffix(GADDAG_SUFFIX)
+    return Gaddag(_open(dst, [src], lambda: compile_wordlist(src, dst, gaddag=True)).dawg)
+
+
+def open_lexicons(srcs: SequenceT[str | Path], dst: str | Path) -> CompiledLexicon:
+    """Return the mapped multi‑list file *dst* (see ``compile_lexicons``)."""
+    return _open(Path(dst), [Path(s) for s in srcs], lambda: compile_lexicons(srcs, dst))
+
+
+def _open(dst: Path, sources: list, build: Callable[[], Path]) -> CompiledLexicon:
+    key = dst.resolve()
+    if key in _OPEN:
+        return _OPEN[key]
+
+    sources = [s for s in sources if s != dst and s.exists()]
+    if not dst.exists() or any(s.stat().st_mtime > dst.stat().st_mtime for s in sources):
+        build()
+    try:
+        lexicon = CompiledLexicon(dst)
+    except ValueError:
+        if not sources:
+            raise
+        # Old format or built on a machine with another byte order
+        build()
+        lexicon = CompiledLexicon(dst)
+    _OPEN[key] = lexicon
+    return lexicon
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile word lists into mmap-able lexicon files")
+    parser.add_argument("lists", nargs="+", help="Path(s) to word-list files")
+    parser.add_argument("--gaddag", action="store_true", help="Build a GADDAG (.gdg) instead of a DAWG (.lex)")
+    args = parser.parse_args()
+    for arg in args.lists:
+        out = compile_wordlist(arg, gaddag=args.gaddag)
+        print(f"• {arg} → {out} ({out.stat().st_size:,} bytes)")
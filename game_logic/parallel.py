@@ -0,0 +1,245 @@
+"""Move generation spread over a process pool.
+
+Every anchor is searched on its own in each direction, so the
+``(anchor, direction)`` units of a position can be dealt out to worker
+processes and the results merged afterwards: move lists are concatenated
+(in the serial order, so ranking them gives the serial result) and top‑K
+lists are merged by total score.  The generator functions use this when
+asked for more than one worker:
+
+    moves = find_all_moves(board, rack, dawg, gaddag=gaddag, workers=4)
+    best = find_best_moves(board, rack, dawg, gaddag=gaddag, k=5, workers=4)
+
+The caller's position is prepared once, in the parent: the cross‑check
+masks, cross‑word sums and anchors (kept on the ``Board``, so a session
+board only updates them) are pickled once per search and shipped with each
+task, and a worker unpickles them once however many of that search's tasks
+it runs.  Workers only rebuild the light ``Board`` wrapper around the rows.
+
+Workers need the caller's automata.  The registry's lexicons are mmap'd
+from their compiled files (see ``game_logic.lexicon``), so a worker opens
+them again through the registry and all processes share the same pages.
+Any other automaton (e.g. one built in memory) is inherited copy‑on‑write
+by a forked pool; where fork is not available such a search runs serially.
+
+One pool is kept per ``(dawg, gaddag, workers)``; asking for a different
+combination retires it once the searches still using it finish.
+``shutdown()`` stops it.
+"""
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+from .board import Board, H, V
+from .generator import Move, _Bounds, _best_of, _search_anchor
+from .rack import Rack
+
+__all__ = ["search_best_moves", "search_moves", "shutdown"]
+
+# Units per worker: a little over one evens out anchors of unequal cost
+CHUNKS_PER_WORKER = 2
+
+_lock = threading.Lock()
+_pool: "_Pool | None" = None
+_searches = itertools.count()
+
+# Worker side: the automata every task searches with, and the position of
+# the last search seen (by token), so its tasks unpickle it only once
+_dawg = None
+_gaddag = None
+_position: Tuple[tuple, tuple] | None = None
+
+
+def search_moves(board: Board, rack: Rack, dawg, gaddag, workers: int,
+                 cross_checks, cross_scores, anchors) -> List[Move]:
+    """Unranked moves of every anchor, in the order a serial search finds them.
+
+    *cross_checks*, *cross_scores* and *anchors* are the board's, as the
+    serial search uses them.
+    """
+    units = [(r, c, d) for (r, c) in anchors for d in (H, V)]
+    with _lease(dawg, gaddag, workers) as pool:
+        if pool is None:
+            return _search(None, (board, cross_checks, cross_scores, anchors), rack.counts, units, dawg, gaddag)
+        position = _shipped(board, cross_checks, cross_scores, anchors)
+        size = -(-len(units) // (workers * CHUNKS_PER_WORKER)) or 1
+        futures = [
+            pool.submit(_search, *position, rack.counts, units[i:i + size])
+            for i in range(0, len(units), size)
+        ]
+        moves: List[Move] = []
+        for fut in futures:
+            moves += fut.result()
+        return moves
+
+
+def search_best_moves(board: Board, rack: Rack, dawg, gaddag, k: int, order, workers: int,
+                      cross_checks, cross_scores, anchors) -> List[Move]:
+    """Top *k* over the ``(bound, r, c, direction)`` units of *order*
+    (highest bound first), each worker pruning against its own k‑th best."""
+    with _lease(dawg, gaddag, workers) as pool:
+        if pool is None:
+            return _best(None, (board, cross_checks, cross_scores, anchors), rack.counts, k, order, dawg, gaddag)
+        position = _shipped(board, cross_checks, cross_scores, anchors)
+        # Dealt round-robin, so every worker gets some of the promising anchors
+        chunks = min(len(order), workers * CHUNKS_PER_WORKER)
+        futures = [
+            pool.submit(_best, *position, rack.counts, k, order[i::chunks])
+            for i in range(chunks)
+        ]
+        moves = [m for fut in futures for m in fut.result()]
+    moves.sort(key=lambda m: m.total_score, reverse=True)
+    return moves[:k]
+
+
+def shutdown() -> None:
+    """Stop the worker pool (a later parallel search starts a new one)."""
+    global _pool
+    with _lock:
+        if _pool is not None:
+            _pool.retire()
+        _pool = None
+
+
+# ---------------------------------------------------------------------
+# Pool
+# ---------------------------------------------------------------------
+class _Pool:
+    """An executor for one ``(dawg, gaddag, workers)`` and the number of
+    searches using it; a retired pool shuts down when the last one ends."""
+
+    __slots__ = ("dawg", "gaddag", "workers", "executor", "users", "retired")
+
+    def __init__(self, dawg, gaddag, workers: int, executor: ProcessPoolExecutor):
+        # Holding the automata keeps them alive, so they are compared by identity
+        self.dawg, self.gaddag, self.workers = dawg, gaddag, workers
+        self.executor = executor
+        self.users = 0
+        self.retired = False
+
+    def serves(self, dawg, gaddag, workers: int) -> bool:
+        return self.dawg is dawg and self.gaddag is gaddag and self.workers == workers
+
+    def retire(self) -> None:
+        self.retired = True
+        if not self.users:
+            self.executor.shutdown(wait=False)
+
+
+@contextmanager
+def _lease(dawg, gaddag, workers: int) -> Iterator[ProcessPoolExecutor | None]:
+    """The pool for these automata while a search uses it, or *None* if
+    they cannot reach a worker."""
+    global _pool
+    with _lock:
+        if _pool is None or not _pool.serves(dawg, gaddag, workers):
+            if _pool is not None:
+                _pool.retire()  # searches still using it finish first
+                _pool = None
+            executor = _executor(dawg, gaddag, workers)
+            if executor is None:
+                pool = None
+            else:
+                pool = _pool = _Pool(dawg, gaddag, workers, executor)
+        else:
+            pool = _pool
+        if pool is not None:
+            pool.users += 1
+    if pool is None:
+        yield None
+        return
+    try:
+        yield pool.executor
+    finally:
+        with _lock:
+            pool.users -= 1
+            if pool.retired and not pool.users:
+                pool.executor.shutdown(wait=False)
+
+
+def _executor(dawg, gaddag, workers: int) -> ProcessPoolExecutor | None:
+    names = _registry_names(dawg, gaddag)
+    if names is not None:
+        return ProcessPoolExecutor(workers, initializer=_open_registry, initargs=names)
+    if "fork" in multiprocessing.get_all_start_methods():
+        # A forked worker gets its arguments by inheritance, not pickling
+        return ProcessPoolExecutor(
+            workers, mp_context=multiprocessing.get_context("fork"),
+            initializer=_inherit, initargs=(dawg, gaddag),
+        )
+    return None
+
+
+def _registry_names(dawg, gaddag) -> Tuple[str, str | None] | None:
+    """Registry names of *dawg* / *gaddag* if both came from the registry."""
+    from .registry import lexicons
+    if not (lexicons.ready("dawg") and lexicons.get("dawg") is dawg):
+        return None
+    if gaddag is None:
+        return "dawg", None
+    if lexicons.ready("gaddag") and lexicons.get("gaddag") is gaddag:
+        return "dawg", "gaddag"
+    return None
+
+
+def _open_registry(dawg_name: str, gaddag_name: str | None) -> None:
+    global _dawg, _gaddag
+    from .registry import lexicons
+    _dawg = lexicons.get(dawg_name)
+    _gaddag = lexicons.get(gaddag_name) if gaddag_name else None
+
+
+def _inherit(dawg, gaddag) -> None:
+    global _dawg, _gaddag
+    _dawg, _gaddag = dawg, gaddag
+
+
+def _shipped(board: Board, cross_checks, cross_scores, anchors) -> Tuple[tuple, bytes]:
+    """``(token, pickled position)``: pickled once here, not once per task."""
+    token = (os.getpid(), next(_searches))
+    # Strings pickle far smaller than the nested lists
+    rows = ["".join(row) for row in board.grid]
+    return token, pickle.dumps((rows, board.layout, cross_checks, cross_scores, anchors), pickle.HIGHEST_PROTOCOL)
+
+
+# ---------------------------------------------------------------------
+# Tasks (run in the workers)
+# ---------------------------------------------------------------------
+def _position_of(token, state) -> tuple:
+    """``(board, cross_checks, cross_scores, anchors)`` of a search; a
+    *token* of *None* means *state* is that already (a serial search)."""
+    global _position
+    if token is None:
+        return state
+    if _position is None or _position[0] != token:
+        rows, layout, cross_checks, cross_scores, anchors = pickle.loads(state)
+        board = Board([list(row) for row in rows], layout)
+        _position = (token, (board, cross_checks, cross_scores, anchors))
+    return _position[1]
+
+
+def _search(token, state, counts, units, dawg=None, gaddag=None) -> List[Move]:
+    if dawg is None:
+        dawg, gaddag = _dawg, _gaddag
+    board, cross_checks, cross_scores, anchors = _position_of(token, state)
+    rack = Rack(counts)
+    moves: List[Move] = []
+    for r, c, d in units:
+        _search_anchor(board, rack, dawg, gaddag, r, c, d, anchors, moves, cross_checks, cross_scores[d])
+    return moves
+
+
+def _best(token, state, counts, k, order, dawg=None, gaddag=None) -> List[Move]:
+    if dawg is None:
+        dawg, gaddag = _dawg, _gaddag
+    board, cross_checks, cross_scores, anchors = _position_of(token, state)
+    rack = Rack(counts)
+    bounds = _Bounds(board, rack, cross_scores)
+    return _best_of(board, rack, dawg, gaddag, k, order, cross_checks, cross_scores, bounds, anchors)
@@ -0,0 +1,147 @@
+"""Fixed‑size rack of tile counts for the move generator.
+
+A ``Rack`` is a list of 27 counts – slots 0–25 for A–Z and ``BLANK`` (26)
+for the blank – mutated in place while the generator recurses: ``take`` a
+tile before descending, ``put`` it back afterwards, so no copy is ever made
+per branch.  ``key()`` gives a cheap hashable snapshot (e.g. for caching
+leaves) and ``letter_mask()`` the 26‑bit set of letters still held.
+
+Blanks are written ``"?"`` in strings and ``""`` in the ``Counter`` racks
+the rest of the code (and the front‑end) uses; ``from_counter`` /
+``to_counter`` convert.
+"""
+from __future__ import annotations
+
+import string
+from collections import Counter
+from typing import Iterable, Iterator, List, Tuple
+
+__all__ = ["BLANK", "LETTERS", "Rack"]
+
+BLANK = 26
+LETTERS = string.ascii_uppercase
+
+
+def _slot(tile: str) -> int:
+    """Slot of a tile: ``"A"``–``"Z"`` (any case), ``""`` / ``"?"`` = blank."""
+    if tile in ("", "?"):
+        return BLANK
+    i = ord(tile.upper()) - 65
+    if not 0 <= i < 26:
+        raise ValueError(f"not a tile: {tile!r}")
+    return i
+
+
+def _tile_slot(tile: str) -> int:
+    # Played tiles: lower case marks a blank standing for that letter
+    return BLANK if tile.islower() else _slot(tile)
+
+
+class Rack:
+    """Tile counts (A–Z + blank) with in‑place take / put."""
+
+    __slots__ = ("counts",)
+
+    def __init__(self, counts: Iterable[int] | None = None):
+        self.counts: List[int] = list(counts) if counts is not None else [0] * 27
+        if len(self.counts) != 27:
+            raise ValueError("a rack has 27 slots")
+
+    # ------------------------------------------------------------------
+    # Construction / conversion ------------------------------------------
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_letters(cls, tiles: Iterable[str]) -> "Rack":
+        """``Rack.from_letters("RETAIN?")`` – ``?`` (or ``""``) is a blank."""
+        rack = cls()
+        for t in tiles:
+            rack.counts[_slot(t)] += 1
+        return rack
+
+    @classmethod
+    def from_counter(cls, counter: Counter) -> "Rack":
+        """From the ``Counter`` form used elsewhere (``""`` = blank)."""
+        rack = cls()
+        for t, n in counter.items():
+            if n > 0:
+                rack.counts[_slot(t)] += n
+        return rack
+
+    @classmethod
+    def coerce(cls, rack: "Rack | Counter | str") -> "Rack":
+        """A private ``Rack`` for *rack* (always a copy, safe to mutate)."""
+        if isinstance(rack, Rack):
+            return rack.copy()
+        if isinstance(rack, Counter):
+            return cls.from_counter(rack)
+        return cls.from_letters(rack)
+
+    def to_counter(self) -> Counter:
+        return Counter({
+            ("" if i == BLANK else LETTERS[i]): n for i, n in enumerate(self.counts) if n
+        })
+
+    def copy(self) -> "Rack":
+        return Rack(self.counts)
+
+    # ------------------------------------------------------------------
+    # In‑place updates ---------------------------------------------------
+    # ------------------------------------------------------------------
+    def take(self, slot: int) -> None:
+        """Remove one tile from *slot* (caller checked it is there)."""
+        self.counts[slot] -= 1
+
+    def put(self, slot: int) -> None:
+        """Undo ``take``."""
+        self.counts[slot] += 1
+
+    def take_tile(self, tile: str) -> None:
+        """Remove a played tile – a lower‑case letter is a blank."""
+        self.counts[_tile_slot(tile)] -= 1
+
+    def put_tile(self, tile: str) -> None:
+        """Undo ``take_tile`` (or add a drawn tile)."""
+        self.counts[_tile_slot(tile)] += 1
+
+    # ------------------------------------------------------------------
+    # Queries ------------------------------------------------------------
+    # ------------------------------------------------------------------
+    @property
+    def blanks(self) -> int:
+        return self.counts[BLANK]
+
+    def __len__(self) -> int:
+        return sum(self.counts)
+
+    def __getitem__(self, tile: str) -> int:
+        return self.counts[_slot(tile)]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Rack) and self.counts == other.counts
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+    def key(self) -> bytes:
+        """Hashable snapshot of the counts."""
+        return bytes(self.counts)
+
+    def letter_mask(self) -> int:
+        """Bit *i* set while letter *i* (A=0) is held; blanks not included."""
+        mask = 0
+        for i in range(26):
+            if self.counts[i]:
+                mask |= 1 << i
+        return mask
+
+    def letters(self) -> List[Tuple[int, str]]:
+        """``(slot, letter)`` for each distinct letter held (no blanks)."""
+        return [(i, LETTERS[i]) for i in range(26) if self.counts[i]]
+
+    def tiles(self) -> Iterator[str]:
+        """Every tile, letters in order then blanks as ``""``."""
+        for i, n in enumerate(self.counts):
+            yield from ("" if i == BLANK else LETTERS[i] for _ in range(n))
+
+    def __repr__(self) -> str:
+        return f"Rack({''.join(LETTERS[i] * n for i, n in enumerate(self.counts[:26]))}{'?' * self.blanks})"
@@ -0,0 +1,147 @@
+"""Process‑wide registry of lexicon structures, built on first use.
+
+Nothing is loaded at import time: each resource is built the first time
+``get`` asks for it (one thread builds, concurrent callers wait for it), or
+ahead of time on daemon threads with ``warm``.  A worker can therefore
+serve pages that never touch a lexicon straight away, and a process that
+never plays or quizzes never pays for the structures at all.
+
+    from game_logic.registry import lexicons
+    dawg = lexicons.get("dawg")
+    lexicons.warm()                    # build everything in the background
+    lexicons.status()                  # {"dawg": {"ready": True, "seconds": 0.01, …}, …}
+
+Loaders may ``get`` other resources (the hook indexes build on the word
+index); each resource has its own lock, so that is safe as long as the
+dependencies do not form a cycle.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List
+
+from .hooks import HookIndex
+from .lexicon import GADDAG_SUFFIX, open_gaddag, open_lexicon
+from .word_index import CSW, NWL, open_word_index
+
+__all__ = ["DICT_PATH", "LexiconRegistry", "lexicons"]
+
+# Word list the bot plays with
+DICT_PATH = "static/data/NWL2023.txt"
+
+
+class _Resource:
+    __slots__ = ("loader", "lock", "value", "ready", "loading", "seconds", "error")
+
+    def __init__(self, loader: Callable[[], Any]):
+        self.loader = loader
+        self.lock = threading.Lock()
+        self.value: Any = None
+        self.ready = False
+        self.loading = False
+        self.seconds: float | None = None
+        self.error: str | None = None
+
+
+class LexiconRegistry:
+    """Named, lazily built resources with readiness and load timings."""
+
+    def __init__(self):
+        self._resources: Dict[str, _Resource] = {}
+
+    def register(self, name: str, loader: Callable[[], Any]) -> None:
+        """Declare *name*; *loader* is called (once) to build it."""
+        self._resources[name] = _Resource(loader)
+
+    def names(self) -> List[str]:
+        return list(self._resources)
+
+    def get(self, name: str) -> Any:
+        """Return resource *name*, building it first if needed.
+
+        A failed build raises here and is retried by the next call.
+        """
+        res = self._resources[name]
+        if res.ready:
+            return res.value
+        with res.lock:
+            if not res.ready:
+                res.loading = True
+                start = time.perf_counter()
+                try:
+                    res.value = res.loader()
+                except Exception as exc:
+                    res.error = f"{type(exc).__name__}: {exc}"
+                    raise
+                finally:
+                    res.loading = False
+                    res.seconds = time.perf_counter() - start
+                res.error = None
+                res.ready = True
+        return res.value
+
+    def ready(self, name: str) -> bool:
+        return self._resources[name].ready
+
+    def warm(self, names: Iterable[str] | None = None) -> List[threading.Thread]:
+        """Build *names* (default: all) on background daemon threads."""
+        threads = []
+        for name in names if names is not None else self.names():
+            if self._resources[name].ready:
+                continue
+            t = threading.Thread(target=self._warm_one, args=(name,), name=f"warm-{name}", daemon=True)
+            t.start()
+            threads.append(t)
+        return threads
+
+    def _warm_one(self, name: str) -> None:
+        try:
+            self.get(name)
+        except Exception:
+            pass  # recorded in status(); the next get() retries
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Readiness and build time (seconds) of every resource."""
+        return {
+            name: {
+                "ready": res.ready,
+                "loading": res.loading,
+                "seconds": None if res.seconds is None else round(res.seconds, 3),
+                "error": res.error,
+            }
+            for name, res in self._resources.items()
+        }
+
+
+def _gaddag():
+    # GADDAG move generation is used once the GADDAG has been compiled with
+    #   python -m game_logic.lexicon --gaddag static/data/NWL2023.txt
+    if not Path(DICT_PATH).with_suffix(GADDAG_SUFFIX).exists():
+        return None
+    return open_gaddag(DICT_PATH)
+
+
+def _word_index():
+    index = open_word_index()
+    # Per-length quiz buckets for both lexicons
+    for mask in (NWL, CSW):
+        index.by_length(mask)
+    return index
+
+
+def _hooks(mask: int) -> Callable[[], HookIndex]:
+    return lambda: HookIndex(lexicons.get("word_index"), mask)
+
+
+lexicons = LexiconRegistry()
+# The packed automaton is mmap'd from the compiled lexicon file, so every
+# worker shares one read-only copy
+lexicons.register("dawg", lambda: open_lexicon(DICT_PATH).dawg)
+lexicons.register("gaddag", _gaddag)
+# One index over NWL2023 + CSW21 with per-word lexicon flags
+lexicons.register("word_index", _word_index)
+# Single-letter front/back hooks per lexicon, computed from the index
+lexicons.register("hooks:nwl", _hooks(NWL))
+lexicons.register("hooks:csw", _hooks(CSW))
@@ -0,0 +1,103 @@
+"""Boards kept alive between the requests of one game.
+
+The front‑end sends the whole board with every ``/get_move``.  Parsing it
+afresh each turn would throw away the anchors and cross‑checks computed
+last turn, so games are given an id and the server keeps their ``Board``:
+
+    with games.session(game_id, board_state) as board:   # caught up with the player's tiles
+        ...                                             # generate, then board.apply_move(best)
+
+When the incoming board is the stored one plus newly placed tiles, those
+tiles are applied incrementally (see ``Board.place_tiles``); anything else
+(a new game under an old id, an undo …) simply starts from the incoming
+board.  The least recently used games are dropped beyond ``max_games``.
+
+A stored board is mutated by the turn that uses it, so ``session`` holds a
+per‑game lock for the whole turn: two requests for one game (the Flask
+server is threaded) take turns instead of searching a board the other is
+changing.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+from .board import Board
+
+__all__ = ["GameSessions", "games"]
+
+
+class GameSessions:
+    """``game id → Board`` for the most recently active games."""
+
+    def __init__(self, max_games: int = 256):
+        self.max_games = max_games
+        self._boards: "OrderedDict[str, Board]" = OrderedDict()
+        self._turns: Dict[str, threading.Lock] = {}  # held while a turn uses the board
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._boards)
+
+    @contextmanager
+    def session(self, game_id: str, board_state: str) -> Iterator[Board]:
+        """``board(game_id, board_state)``, used by no other session of the
+        game until the block ends."""
+        with self._lock:
+            turn = self._turns.setdefault(game_id, threading.Lock())
+        with turn:
+            yield self.board(game_id, board_state)
+
+    def board(self, game_id: str, board_state: str) -> Board:
+        """The board of *game_id*, brought up to date with *board_state*.
+
+        The board is shared with later calls for the game: use ``session``
+        to change it.
+        """
+        incoming = Board.from_string(board_state)
+        with self._lock:
+            board = self._boards.get(game_id)
+            if board is not None:
+                self._boards.move_to_end(game_id)
+        if board is not None:
+            placements = _new_tiles(board, incoming)
+            if placements is not None:
+                board.place_tiles(placements)
+                return board
+        with self._lock:
+            self._boards[game_id] = incoming
+            self._boards.move_to_end(game_id)
+            while len(self._boards) > self.max_games:
+                dropped, _ = self._boards.popitem(last=False)
+                self._turns.pop(dropped, None)
+        return incoming
+
+    def discard(self, game_id: str) -> None:
+        with self._lock:
+            self._boards.pop(game_id, None)
+            self._turns.pop(game_id, None)
+
+
+def _new_tiles(old: Board, new: Board) -> List[Tuple[int, int, str]] | None:
+    """Tiles *new* adds to *old*, or *None* if it is not *old* plus tiles."""
+    size = old.layout.size
+    if len(new.grid) != size or any(len(row) != size for row in new.grid):
+        return None
+    placements = []
+    for r in range(size):
+        old_row, new_row = old.grid[r], new.grid[r]
+        if old_row == new_row:
+            continue
+        for c in range(size):
+            if old_row[c] == new_row[c]:
+                continue
+            if old_row[c] != ".":
+                return None
+            placements.append((r, c, new_row[c]))
+    return placements
+
+
+# Process-wide store used by the Flask app
+games = GameSessions()
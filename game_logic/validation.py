@@ -2,8 +2,20 @@
 
 This enhances cross-word validation to ensure that all words formed by a move
 are valid dictionary words.
+
+The generator only produces legal moves (cross-check masks and board
+prefixes), so nothing on the production path calls these checks.  Instead
+``shadow`` re-validates a random sample of the generated moves – the
+fraction comes from ``MOVEGEN_SHADOW_RATE`` (default 0, off) – and counts
+and prints any move that fails:
+
+    shadow.rate = 0.01        # re-check 1 % of generated moves
+    shadow.stats()            # {"rate": 0.01, "checked": 412, "mismatches": 0}
 """
 from __future__ import annotations
+import os
+import random
+import threading
 from typing import List, Set, Tuple
 
 def extract_cross_words(board, move, dawg):
@@ -23,16 +35,10 @@ def extract_cross_words(board, move, dawg):
     col = move.col
     direction = move.direction
     
-    SIZE = 15
+    # Perpendicular words through every empty square, shared with scoring
+    cross_table = board.cross_table(direction)
     cross_words = []
     
-    # First, validate the main word
-    main_word = move.word.upper()
-    main_word_valid = dawg.is_word(main_word)
-    
-    # print(f"Main word: {main_word} - Valid: {main_word_valid}")
-    
-    # Then check all cross-words
     for idx, ch in enumerate(word):
         r = row + (idx if direction == "V" else 0)
         c = col + (idx if direction == "H" else 0)
@@ -41,48 +47,9 @@ def extract_cross_words(board, move, dawg):
         if board.grid[r][c] != ".":
             continue
         
-        # Check for potential cross-word in the perpendicular direction
-        if direction == "H":  # Horizontal move, check vertical cross-words
-            # Get the vertical word formed by this tile
-            top = ""
-            rr = r - 1
-            while rr >= 0 and board.grid[rr][c] != ".":
-                top = board.grid[rr][c] + top
-                rr -= 1
-            
-            bottom = ""
-            rr = r + 1
-            while rr < SIZE and board.grid[rr][c] != ".":
-                bottom += board.grid[rr][c]
-                rr += 1
-            
-            # If there's a vertical cross-word (top or bottom has content)
-            if top or bottom:
-                cross_word = top + ch.upper() + bottom
-                is_valid = dawg.is_word(cross_word)
-                cross_words.append((cross_word, is_valid))
-                # print(f"Cross-word (vertical): {cross_word} - Valid: {is_valid}")
-        
-        else:  # Vertical move, check horizontal cross-words
-            # Get the horizontal word formed by this tile
-            left = ""
-            cc = c - 1
-            while cc >= 0 and board.grid[r][cc] != ".":
-                left = board.grid[r][cc] + left
-                cc -= 1
-            
-            right = ""
-            cc = c + 1
-            while cc < SIZE and board.grid[r][cc] != ".":
-                right += board.grid[r][cc]
-                cc += 1
-            
-            # If there's a horizontal cross-word (left or right has content)
-            if left or right:
-                cross_word = left + ch.upper() + right
-                is_valid = dawg.is_word(cross_word)
-                cross_words.append((cross_word, is_valid))
-                # print(f"Cross-word (horizontal): {cross_word} - Valid: {is_valid}")
+        cross_word = cross_table.word(r, c, ch)
+        if cross_word is not None:
+            cross_words.append((cross_word, dawg.is_word(cross_word)))
     
     return cross_words
 
@@ -103,7 +70,7 @@ def check_extended_main_word(board, move, dawg):
     r, c = move.row, move.col
     direction = move.direction
     word = move.word
-    SIZE = 15
+    SIZE = board.layout.size
     
     # For a horizontal move, check if there are adjacent tiles at the left or right
     if direction == "H":
@@ -193,16 +160,17 @@ def validate_cross_words(board, move, dawg):
     return True
 
 
-def find_all_moves_with_validation(board, rack, dawg):
+def find_all_moves_with_validation(board, rack, dawg, gaddag=None):
     """
     Find all legal moves with full cross-word validation.
     
     This is a wrapper around find_all_moves that adds cross-word validation.
+    Pass *gaddag* to generate in GADDAG mode.
     """
     from .generator import find_all_moves
     
     # Get candidate moves
-    moves = find_all_moves(board, rack, dawg)
+    moves = find_all_moves(board, rack, dawg, gaddag=gaddag)
     print(f"Found {len(moves)} potential moves before cross-word validation")
     
     # Validate cross-words
@@ -221,4 +189,39 @@ def find_all_moves_with_validation(board, rack, dawg):
             print(f"  Invalid move {i+1}: {move}")
     
     valid_moves.sort(key=lambda m: m.total_score, reverse=True)
-    return valid_moves
\ No newline at end of file
+    return valid_moves
+
+
+class ShadowValidator:
+    """Re-checks a random fraction of generated moves with
+    ``validate_cross_words`` and records the ones that fail."""
+
+    def __init__(self, rate: float = 0.0, seed: int | None = None):
+        self.rate = rate
+        self.checked = 0
+        self.mismatches = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def check(self, board, moves, dawg) -> list:
+        """Validate a sample of *moves* (made on *board*); returns the failures."""
+        if self.rate <= 0 or not moves:
+            return []
+        with self._lock:
+            # Expected count len(moves) * rate, rounded at random
+            n = min(len(moves), int(len(moves) * self.rate + self._random.random()))
+            sample = self._random.sample(moves, n)
+        failed = [m for m in sample if not validate_cross_words(board, m, dawg)]
+        with self._lock:
+            self.checked += n
+            self.mismatches += len(failed)
+        for move in failed:
+            print(f"WARNING: shadow validation rejected generated move {move}")
+        return failed
+
+    def stats(self) -> dict:
+        return {"rate": self.rate, "checked": self.checked, "mismatches": self.mismatches}
+
+
+# Process-wide sampler used by the move generator
+shadow = ShadowValidator(float(os.environ.get("MOVEGEN_SHADOW_RATE", "0")))
@@ -0,0 +1,324 @@
+"""One shared index over every supported word list.
+
+NWL2023 and CSW21 overlap almost entirely, so instead of two sets (and a
+fresh ``union`` for every "both" query) each word is stored once together
+with a bitmask of the lexicons that contain it.  Queries take a lexicon
+mask, so a union costs nothing extra:
+
+    index = open_word_index()
+    index.flags("QI")                    # → NWL | CSW
+    index.contains("ZE", CSW)            # Collins only
+    for word, flags in index.items(NWL | CSW): ...
+
+Anagram‑style look‑ups go through per‑length alphagram buckets
+(``"AEINRST" → [RETAINS, RETINAS, …]``) built once on first use, so a rack
+is answered by direct look‑ups instead of a lexicon scan: one for a plain
+rack, 26 with one blank, 351 with two.  Sub‑anagrams ("every word these
+letters can spell") walk the union automaton instead, spending rack counts
+as they go, so only words the rack can actually reach are visited.
+
+Per‑lexicon, per‑length word lists (for quizzes) are arrays of positions
+in the sorted word table, so sampling a quiz touches only the sampled words.
+
+The index lives in one compiled file (``static/data/WORDS.lex``) that is
+mmap'd read‑only like the per‑list lexicons (see ``game_logic.lexicon``).
+"""
+from __future__ import annotations
+
+import random
+import string
+from array import array
+from collections import Counter
+from collections.abc import Sequence
+from itertools import combinations, combinations_with_replacement
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from .lexicon import CompiledLexicon, open_lexicons
+
+__all__ = ["ALL", "CSW", "NWL", "LengthBucket", "WordIndex", "alphagram", "lexicon_mask", "open_word_index"]
+
+# Flag bits – bit i belongs to WORD_LISTS[i]
+NWL = 1 << 0
+CSW = 1 << 1
+ALL = NWL | CSW
+
+WORD_LISTS = ("static/data/NWL2023.txt", "static/data/CSW21.txt")
+INDEX_PATH = "static/data/WORDS.lex"
+
+# Names the front‑end sends for its dictionary selector
+_MASKS: Dict[str, int] = {
+    "nwl": NWL,
+    "nwl2023": NWL,
+    "collins": CSW,
+    "csw": CSW,
+    "csw21": CSW,
+    "both": ALL,
+}
+
+
+def lexicon_mask(name: str | None, default: int = ALL) -> int:
+    """Map a dictionary name from a request (``"nwl"``, ``"both"`` …) to a mask."""
+    if not name:
+        return default
+    return _MASKS.get(name.lower(), default)
+
+
+def alphagram(letters: str) -> str:
+    """Letters in alphabetical order – the key shared by all anagrams."""
+    return "".join(sorted(letters))
+
+
+class LengthBucket(Sequence):
+    """Sorted words of one length in one lexicon mask.
+
+    Holds positions into the lexicon's word table, so ``random.sample`` on
+    it only ever decodes the words it picks.
+    """
+
+    __slots__ = ("_ids", "_words")
+
+    def __init__(self, ids: array, words: Sequence):
+        self._ids = ids
+        self._words = words
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, i: int) -> str:
+        return self._words[self._ids[i]]
+
+
+class WordIndex:
+    """Every word once, with the mask of the lexicons it belongs to."""
+
+    def __init__(self, lexicon: CompiledLexicon):
+        self._lexicon = lexicon
+        self.dawg = lexicon.dawg  # automaton over the union, flags on terminals
+        # word length → alphagram → [(word, flags)], filled lazily
+        self._alphagrams: Dict[int, Dict[str, List[Tuple[str, int]]]] = {}
+        # mask → word length → positions in the word table, see by_length()
+        self._by_length: Dict[int, Dict[int, array]] = {}
+
+    def __len__(self) -> int:
+        return len(self._lexicon)
+
+    @property
+    def word_table(self) -> Sequence[str]:
+        """All words, sorted; ``by_length`` positions index into it."""
+        return self._lexicon.words
+
+    def flags(self, word: str) -> int:
+        """Mask of the lexicons containing *word* (0 if none)."""
+        return self._lexicon.flags(word)
+
+    def contains(self, word: str, mask: int = ALL) -> bool:
+        return bool(self._lexicon.flags(word) & mask)
+
+    def items(self, mask: int = ALL) -> Iterator[Tuple[str, int]]:
+        """Yield ``(word, flags)`` for words in any lexicon of *mask*, sorted."""
+        if mask & ALL == ALL:
+            return self._lexicon.items()
+        return ((w, f) for w, f in self._lexicon.items() if f & mask)
+
+    def words(self, mask: int = ALL) -> Iterator[str]:
+        """Yield the words in any lexicon of *mask*, sorted."""
+        if mask & ALL == ALL:
+            return iter(self._lexicon.words)
+        return (w for w, f in self._lexicon.items() if f & mask)
+
+    # ------------------------------------------------------------------
+    # Length buckets -----------------------------------------------------
+    # ------------------------------------------------------------------
+    def by_length(self, mask: int = ALL) -> Dict[int, array]:
+        """Word‑table positions of the words in *mask*, grouped by length.
+
+        Built in one pass the first time a mask is asked for (call it at
+        start‑up to warm it); positions are ascending, so every bucket is
+        sorted.
+        """
+        buckets = self._by_length.get(mask)
+        if buckets is None:
+            buckets = {}
+            for i, (word, flags) in enumerate(self._lexicon.items()):
+                if flags & mask:
+                    ids = buckets.get(len(word))
+                    if ids is None:
+                        ids = buckets[len(word)] = array("I")
+                    ids.append(i)
+            self._by_length[mask] = buckets
+        return buckets
+
+    def words_of_length(self, length: int, mask: int = ALL) -> LengthBucket:
+        return LengthBucket(self.by_length(mask).get(length, array("I")), self.word_table)
+
+    def sample(self, length: int, k: int, mask: int = ALL) -> List[str]:
+        """Up to *k* distinct words of *length* drawn uniformly at random."""
+        bucket = self.words_of_length(length, mask)
+        return random.sample(bucket, min(k, len(bucket)))
+
+    def anagram_map(self, words: Iterable[str], mask: int = ALL) -> Dict[str, List[str]]:
+        """``alphagram → anagrams`` for *words* – what a quiz client needs to
+        check answers without the whole word list."""
+        return {key: self.anagrams(key, mask) for key in {alphagram(w) for w in words}}
+
+    # ------------------------------------------------------------------
+    # Alphagram look‑ups -------------------------------------------------
+    # ------------------------------------------------------------------
+    def _alphagram_bucket(self, length: int) -> Dict[str, List[Tuple[str, int]]]:
+        bucket = self._alphagrams.get(length)
+        if bucket is None:
+            bucket = {}
+            for word, flags in self._lexicon.items():
+                if len(word) == length:
+                    bucket.setdefault(alphagram(word), []).append((word, flags))
+            self._alphagrams[length] = bucket
+        return bucket
+
+    def anagrams(self, letters: str, mask: int = ALL) -> List[str]:
+        """Words using exactly *letters* (no blanks)."""
+        bucket = self._alphagram_bucket(len(letters))
+        return [w for w, f in bucket.get(alphagram(letters.upper()), ()) if f & mask]
+
+    def bingos(self, rack: str, length: int = 7, mask: int = ALL) -> List[str]:
+        """Sorted words of *length* the rack can spell; ``?`` is a blank.
+
+        Each blank is tried as every letter (26 look‑ups for one blank,
+        351 for two – letter order never matters for an alphagram).
+        """
+        letters = sorted(ch for ch in rack.upper() if "A" <= ch <= "Z")
+        blanks = rack.count("?")
+        bucket = self._alphagram_bucket(length)
+        found = set()
+        for used in range(min(blanks, length) + 1):
+            need = length - used
+            if need > len(letters):
+                continue
+            for base in set(combinations(letters, need)):
+                for fill in combinations_with_replacement(string.ascii_uppercase, used):
+                    for word, flags in bucket.get(alphagram(base + fill), ()):
+                        if flags & mask:
+                            found.add(word)
+        return sorted(found)
+
+    def extension_bingos(self, rack: str, length: int = 8, mask: int = ALL) -> List[str]:
+        """Sorted words of *length* spelled by rack letters plus exactly one
+        extra letter (blanks on the rack are ignored)."""
+        letters = sorted(ch for ch in rack.upper() if "A" <= ch <= "Z")
+        if not 0 < length <= len(letters) + 1:
+            return []
+        bucket = self._alphagram_bucket(length)
+        have = Counter(letters)
+        found = set()
+        for base in set(combinations(letters, length - 1)):
+            for extra in string.ascii_uppercase:
+                for word, flags in bucket.get(alphagram(base + (extra,)), ()):
+                    # the extra letter must really be extra, not a spare rack tile
+                    if flags & mask and Counter(word) - have:
+                        found.add(word)
+        return sorted(found)
+
+    def subanagrams(
+        self,
+        letters: str,
+        mask: int = ALL,
+        min_length: int = 2,
+        max_length: int | None = None,
+        limit: int | None = None,
+    ) -> Tuple[List[Tuple[str, int]], bool]:
+        """Words spelled by any subset of *letters* (``?`` is a blank).
+
+        Returns ``(hits, truncated)`` where *hits* is a list of
+        ``(word, flags)`` sorted longest first, then alphabetically, cut to
+        *limit* entries.  A real tile is always preferred over a blank for
+        the same letter, so every word is reached by exactly one path.
+
+        With a *limit*, once more than *limit* words of some length or
+        longer are found, shorter words can no longer make the cut: they
+        are not recorded, and branches too short to reach that length are
+        not walked.
+        """
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be at least 1")
+        if min_length < 1:
+            raise ValueError("min_length must be at least 1")
+        if max_length is not None and max_length < min_length:
+            raise ValueError("max_length must be at least min_length")
+        counts = [0] * 26
+        blanks = 0
+        for ch in letters.upper():
+            if ch == "?":
+                blanks += 1
+            elif "A" <= ch <= "Z":
+                counts[ord(ch) - 65] += 1
+        longest = sum(counts) + blanks
+        if max_length is not None:
+            longest = min(longest, max_length)
+
+        dawg = self.dawg
+        step, is_terminal, node_flags = dawg.step, dawg.is_terminal, dawg.flags
+        hits: List[Tuple[str, int]] = []
+        path: List[str] = []
+        by_length = [0] * (longest + 1)  # hits recorded per word length
+        floor = min_length  # shortest length still worth recording
+
+        def record(word: str, flags: int) -> None:
+            nonlocal floor
+            hits.append((word, flags))
+            by_length[len(word)] += 1
+            if limit is None:
+                return
+            # Raise the floor to the longest length with > limit hits at or above it
+            found = 0
+            for length in range(longest, floor - 1, -1):
+                found += by_length[length]
+                if found > limit:
+                    floor = length
+                    return
+
+        def walk(node, left: int, blanks_left: int) -> None:
+            depth = len(path)
+            if depth >= floor and is_terminal(node):
+                flags = node_flags(node)
+                if flags & mask:
+                    record("".join(path), flags)
+            if depth == longest or depth + left < floor:
+                return
+            for i, ch in enumerate(string.ascii_uppercase):
+                if counts[i]:
+                    use_blank = False
+                elif blanks_left:
+                    use_blank = True
+                else:
+                    continue
+                child = step(node, ch)
+                if child is None:
+                    continue
+                if use_blank:
+                    blanks_left -= 1
+                else:
+                    counts[i] -= 1
+                path.append(ch)
+                walk(child, left - 1, blanks_left)
+                path.pop()
+                if use_blank:
+                    blanks_left += 1
+                else:
+                    counts[i] += 1
+
+        walk(dawg.root(), sum(counts) + blanks, blanks)
+        hits = [h for h in hits if len(h[0]) >= floor]
+        hits.sort(key=lambda h: (-len(h[0]), h[0]))
+        if limit is not None and len(hits) > limit:
+            return hits[:limit], True
+        return hits, False
+
+
+_INDEX: WordIndex | None = None
+
+
+def open_word_index() -> WordIndex:
+    """Return the process‑wide index, compiling ``WORDS.lex`` if needed."""
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = WordIndex(open_lexicons(WORD_LISTS, INDEX_PATH))
+    return _INDEX
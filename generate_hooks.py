@@ -17,14 +17,32 @@ Output format  (example):
   "CAT":  { "back": ["S"],               "front": ["BOBCAT", "WILDCAT"] },
   ...
 }
+
+Hooks come straight out of two DAWGs: the back hooks of WORD are the
+completions below WORD in a DAWG of the list, the front hooks are the
+completions below rev(WORD) in a DAWG of the reversed words.  Each list is
+handled in its own process.
+
+Next to the JSON a compressed tab-separated copy is written
+(``WORD<TAB>front hooks<TAB>back hooks``, hooks space-separated), with
+zstd when ``zstandard`` is installed and gzip otherwise.
 """
 from __future__ import annotations
 import argparse
+import gzip
 import json
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from collections import defaultdict
 from typing import Dict, List, Set
 
+from game_logic.dawg import Dawg
+
+try:
+    import zstandard
+except ImportError:  # optional – fall back to gzip
+    zstandard = None
+
 
 # ──────────────────────────────────────────────────────────────────────────
 # helper
@@ -35,48 +53,50 @@ def load_word_set(filepath: Path) -> Set[str]:
         return {line.strip().upper() for line in fh if line.strip()}
 
 def build_hook_dict(words: set[str]) -> dict[str, dict[str, list[str]]]:
-    """Return { base_word : {'front':[1-letter], 'back':[1-letter]} }."""
-    from collections import defaultdict
-
-    hooks: dict[str, dict[str, set[str]]] = defaultdict(
-        lambda: {"front": set(), "back": set()}
-    )
-
-    # quick prefix / suffix maps
-    prefix_map: dict[str, list[str]] = defaultdict(list)
-    suffix_map: dict[str, list[str]] = defaultdict(list)
-
-    for w in words:
-        ln = len(w)
-        for i in range(1, ln):                # all shorter splits
-            prefix_map[w[:i]].append(w)       #  base -> longer word(s)
-            suffix_map[w[i:]].append(w)
-
-    # First populate hooks for any word that has them
-    for base in words:
-        # ── back hooks ───────────────────────────────────────────────
-        for longer in prefix_map.get(base, []):          # longer starts with base
-            hook = longer[len(base):]                    # part you append
-            if len(hook) == 1:                           # ← only single-letter
-                hooks[base]["back"].add(hook)
-
-        # ── front hooks ──────────────────────────────────────────────
-        for longer in suffix_map.get(base, []):          # longer ends with base
-            hook = longer[:-len(base)]                   # part you prepend
-            if len(hook) == 1:                           # ← only single-letter
-                hooks[base]["front"].add(hook)
-
-    # Now make sure ALL words are included (even those without hooks)
-    for word in words:
-        if word not in hooks:
-            hooks[word] = {"front": set(), "back": set()}
-    
-    # sets -> sorted lists, include ALL words
-    return {
-        w: {"front": sorted(h["front"]), "back": sorted(h["back"])}
+    """Return { word : {'front':[hooks], 'back':[hooks]} } for every word."""
+    forward = Dawg.build_from_words(words)
+    backward = Dawg.build_from_words(w[::-1] for w in words)
+
+    hooks: Dict[str, Dict[str, List[str]]] = {}
+    for w in sorted(words):
+        hooks[w] = {
+            "front": sorted(h[::-1] for h in backward.completions(w[::-1])),
+            "back": list(forward.completions(w)),   # already in order
+        }
+    return hooks
+
+def write_compressed(hooks: dict[str, dict[str, list[str]]], out_path: Path) -> Path:
+    """Write the compact TSV copy; returns the path actually written."""
+    data = "".join(
+        f"{w}\t{' '.join(h['front'])}\t{' '.join(h['back'])}\n"
         for w, h in hooks.items()
-    }
-    
+    ).encode("ascii")
+    if zstandard is not None:
+        out_path = out_path.with_name(out_path.name + ".zst")
+        out_path.write_bytes(zstandard.ZstdCompressor(level=19).compress(data))
+    else:
+        out_path = out_path.with_name(out_path.name + ".gz")
+        out_path.write_bytes(gzip.compress(data, compresslevel=9))
+    return out_path
+
+def process_list(in_path: Path, out_dir: Path, write_json: bool = True) -> str:
+    """Generate the hook files for one list (runs in a worker process)."""
+    start = time.perf_counter()
+    words = load_word_set(in_path)
+    hooks = build_hook_dict(words)
+
+    written = []
+    if write_json:
+        json_path = out_dir / (in_path.stem + "_hooks.json")
+        with json_path.open("w", encoding="utf-8") as fh:
+            json.dump(hooks, fh, separators=(",", ":"))
+        written.append(json_path)
+    written.append(write_compressed(hooks, out_dir / (in_path.stem + "_hooks.tsv")))
+
+    files = ", ".join(str(p) for p in written)
+    return (f"• {in_path.name}: {len(hooks):,} base words in "
+            f"{time.perf_counter() - start:.1f}s → {files}")
+
 # ──────────────────────────────────────────────────────────────────────────
 # CLI entry-point
 # ──────────────────────────────────────────────────────────────────────────
@@ -92,24 +112,23 @@ def main():
         help="Path(s) to word-list files",
     )
     parser.add_argument("--outdir", default=None, help="Directory for JSON output")
+    parser.add_argument("--no-json", action="store_true", help="Only write the compressed copy")
     args = parser.parse_args()
 
+    jobs = []
     for list_path in args.lists:
         in_path = Path(list_path)
         if not in_path.exists():
             print(f"[WARN] {in_path} not found – skipping")
             continue
-
         out_dir = Path(args.outdir) if args.outdir else in_path.parent
-        out_path = out_dir / (in_path.stem + "_hooks.json")
-
-        print(f"• Processing {in_path.name} ...", end=" ", flush=True)
-        words = load_word_set(in_path)
-        hooks = build_hook_dict(words)
+        jobs.append((in_path, out_dir))
 
-        with out_path.open("w", encoding="utf-8") as fh:
-            json.dump(hooks, fh, indent=1, sort_keys=True)
-        print(f"done → {out_path}  ({len(hooks):,} base words)")
+    # One process per list – the lists are independent
+    with ProcessPoolExecutor(max_workers=max(1, len(jobs))) as pool:
+        futures = [pool.submit(process_list, p, d, not args.no_json) for p, d in jobs]
+        for fut in futures:
+            print(fut.result())
 
     print("All finished.")
 
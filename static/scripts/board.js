@@ -49,6 +49,8 @@ document.addEventListener("DOMContentLoaded", () => {
   // Add after the declaration of let playerScore = 0;
   let consecutiveZeroScoreTurns = 0;
   let gameEnded = false;
+  // Lets the server keep this game's board between bot moves (a new game reloads the page)
+  const gameId = Date.now().toString(36) + Math.random().toString(36).slice(2);
 
   // Update the exchange button event listener
   exchangeButton.addEventListener("click", () => {
@@ -1871,6 +1873,7 @@ document.addEventListener("DOMContentLoaded", () => {
 
     // Construct the request data
     const requestData = {
+      gameId: gameId,
       board: boardState,
       playerRack: playerRackState,
       botRack: botRackState,
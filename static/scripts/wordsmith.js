@@ -13,7 +13,7 @@ document.addEventListener('DOMContentLoaded', () => {
     const guessedWordsContainer = document.getElementById('guessed-words-container');
 
     let testWords = [];
-    let allWords = [];
+    let anagramSets = {};
     let currentTestWordIndex = 0;
     let currentAnagrams = [];
 
@@ -84,7 +84,8 @@ document.addEventListener('DOMContentLoaded', () => {
             dictionary: document.getElementById('dictionary').value,
             wordLength: wordLengthSlider.value,
             includeBlanks: document.getElementById('blanks').checked,
-            timeLimit: document.getElementById('time-limit').value ? parseInt(document.getElementById('time-limit').value) : 5
+            timeLimit: document.getElementById('time-limit').value ? parseInt(document.getElementById('time-limit').value) : 5,
+            compact: true
         };
 
         // Send the settings to the server via AJAX
@@ -98,7 +99,7 @@ document.addEventListener('DOMContentLoaded', () => {
         .then(response => response.json())
         .then(data => {
             testWords = data.testWords;
-            allWords = data.allWords;
+            anagramSets = data.anagrams;
             currentTestWordIndex = 0;
             displayNextTestWord();
         })
@@ -152,7 +153,7 @@ document.addEventListener('DOMContentLoaded', () => {
             tilesContainer.appendChild(tile);
         });
 
-        currentAnagrams = allWords.filter(w => w.split('').sort().join('') === sortedLetters.join(''));
+        currentAnagrams = (anagramSets[sortedLetters.join('')] || []).slice();
         anagramCounter.textContent = `Valid Words: ${currentAnagrams.length}`; // Change text here
         wordInput.value = '';
         guessedWordsContainer.innerHTML = '';
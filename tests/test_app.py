@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+pytest.importorskip("flask")
+os.environ.setdefault("LEXICON_WARM", "0")
+
+from app import ANAGRAM_RESULT_LIMIT, app  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+def test_solve_anagram_rejects_bad_parameters(client):
+    for data in ({"letters": "AEINRST", "limit": -5}, {"letters": "AEINRST", "limit": 0},
+                 {"letters": "AEINRST", "limit": "many"}, {"letters": "AEINRST", "minLength": "x"},
+                 {"letters": "AEINRST", "maxLength": "7.5"}, {"letters": "?" * 3 + "AEI"},
+                 {"letters": "AEINRSTAEINRSTAE"}, {"letters": "AEINRST", "minLength": 0},
+                 {"letters": "AEINRST", "minLength": -2}, {"letters": "AEINRST", "maxLength": -1},
+                 {"letters": "AEINRST", "maxLength": 0}, {"letters": "AEINRST", "minLength": 5, "maxLength": 4}):
+        resp = client.post("/solve_anagram", json=data)
+        assert resp.status_code == 400, data
+        assert resp.get_json()["error"]
+
+
+def test_solve_anagram_limits_results(client):
+    full = client.post("/solve_anagram", json={"letters": "AEINRST"}).get_json()
+    assert not full["truncated"] and len(full["words"]) <= ANAGRAM_RESULT_LIMIT
+    cut = client.post("/solve_anagram", json={"letters": "AEINRST", "limit": 5}).get_json()
+    assert cut["truncated"] and cut["words"] == full["words"][:5]
+
+
+EMPTY_BOARD = "\n".join(" ".join("." * 15) for _ in range(15))
+
+
+def test_score_move(client):
+    resp = client.post("/score_move", json={"board": EMPTY_BOARD, "word": "CAT", "row": 7, "col": 6, "direction": "H"})
+    assert resp.status_code == 200
+    assert resp.get_json() == {"score": 10, "words": [{"word": "CAT", "valid": True}], "valid": True}
+    resp = client.post("/score_move", json={"board": EMPTY_BOARD, "word": "CXT", "row": 7, "col": 6, "direction": "V"})
+    assert resp.status_code == 200 and not resp.get_json()["valid"]
+
+
+def test_score_move_rejects_bad_moves(client):
+    move = {"board": EMPTY_BOARD, "word": "CAT", "row": 7, "col": 6, "direction": "H"}
+    for change in ({"col": 14}, {"row": 13, "direction": "V"}, {"row": -1}, {"direction": "horizontal"},
+                   {"word": "C?T"}, {"word": ""}, {"row": "seven"}, {"board": ". . ."}, {"word": None}):
+        resp = client.post("/score_move", json={**move, **change})
+        assert resp.status_code == 400, change
+        assert resp.get_json()["error"]
+
+
+def test_bingo_checks_reject_oversized_racks(client):
+    for url, extra in (("/bingo_practice/check_bingos", {}),
+                       ("/bingo_practice/check_extension_bingos", {"targetLength": 8})):
+        for rack in ("???????", "??AEINR?", "ABCDEFGHIJKLMNOP??", "AEINRSTAEI"):
+            resp = client.post(url, json={"rack": rack, **extra})
+            assert resp.status_code == 400, (url, rack)
+            assert resp.get_json()["error"]
+        assert client.post(url, json={"rack": "AEINRS??", **extra}).status_code == 200
+    resp = client.post("/bingo_practice/check_extension_bingos", json={"rack": "AEINRST", "targetLength": "x"})
+    assert resp.status_code == 400
@@ -1,4 +1,10 @@
-from game_logic.board import Board, H, V
+import random
+from copy import deepcopy
+
+import pytest
+
+from game_logic import board as board_module
+from game_logic.board import ALL_LETTERS, Board, H, V, cross_check_mask
 from game_logic.dawg import Dawg
 
 DICT = "static/data/NWL2023.txt"
@@ -19,6 +25,177 @@ def test_first_move_anchors():
     # Cross-checks on an empty board should allow any letter
     cc = board.cross_checks(DAWG)
     assert (7, 7) in cc
-    assert len(cc[(7, 7)][H]) == 26
-    assert len(cc[(7, 7)][V]) == 26
+    assert cc[(7, 7)][H] == ALL_LETTERS
+    assert cc[(7, 7)][V] == ALL_LETTERS
+
+
+
+
+def test_bitboard_anchors_match_a_square_scan():
+    rng = random.Random(7)
+    for _ in range(50):
+        board = Board()
+        for r, c in rng.sample([(r, c) for r in range(15) for c in range(15)], rng.randrange(1, 40)):
+            board.grid[r][c] = rng.choice("ABCxyz")
+        expected = {
+            (r, c) for r in range(15) for c in range(15)
+            if board.grid[r][c] == "." and any(
+                0 <= r + dr < 15 and 0 <= c + dc < 15 and board.grid[r + dr][c + dc] != "."
+                for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)))
+        }
+        occupied = {(r, c) for r in range(15) for c in range(15) if board.grid[r][c] != "."}
+        assert board.anchors() == expected
+        assert board.layout.mask_squares(board.occupancy()) == occupied
+        assert not board.is_first_move()
+
+    # no wrap-around between the last column and the next row's first
+    board = Board()
+    board.place_tiles([(3, 14, "A")])
+    assert board.anchors() == {(2, 14), (4, 14), (3, 13)}
+    assert board.anchor_mask() & board.layout.bit(4, 0) == 0
+
+
+BUSY = """
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . Z . . . . . .
+    . . . . . . . B E L L . . . .
+    . . . . . . K I N O . . . . .
+    . . . . . M A t . . . . . . .
+    . . . . . . T . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    """
+
+
+def test_cross_checks_match_whole_word_lookups():
+    board = Board.from_string(BUSY)
+    cc = board.cross_checks(DAWG)
+
+    def word_through(r, c, dr, dc, ch):
+        before, after = "", ""
+        rr, cc_ = r - dr, c - dc
+        while 0 <= rr < 15 and 0 <= cc_ < 15 and board.grid[rr][cc_] != ".":
+            before = board.grid[rr][cc_] + before
+            rr, cc_ = rr - dr, cc_ - dc
+        rr, cc_ = r + dr, c + dc
+        while 0 <= rr < 15 and 0 <= cc_ < 15 and board.grid[rr][cc_] != ".":
+            after += board.grid[rr][cc_]
+            rr, cc_ = rr + dr, cc_ + dc
+        return before + ch + after
+
+    for (r, c), allowed in cc.items():
+        for direction, (dr, dc) in ((H, (1, 0)), (V, (0, 1))):
+            word = word_through(r, c, dr, dc, "")
+            if not word:
+                assert allowed[direction] == ALL_LETTERS
+                continue
+            expected = sum(
+                1 << i for i, ch in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+                if DAWG.is_word(word_through(r, c, dr, dc, ch))
+            )
+            assert allowed[direction] == expected, (r, c, direction)
+
+
+def test_cross_check_masks_are_memoized_and_bounded(monkeypatch):
+    dawg = Dawg.build_from_words(["AT", "IT", "ITS", "TA", "TI"])
+    cache = board_module._MASK_CACHES.get(dawg)
+    assert cache is None
+
+    assert cross_check_mask(dawg, "", "T") == 1 << 0 | 1 << 8   # AT, IT
+    assert cross_check_mask(dawg, "T", "") == 1 << 0 | 1 << 8   # TA, TI
+    assert cross_check_mask(dawg, "I", "S") == 1 << 19          # ITS
+    assert cross_check_mask(dawg, "Q", "") == 0
+    cache = board_module._MASK_CACHES[dawg]
+    assert (cache.hits, cache.misses) == (0, 4)
+
+    assert cross_check_mask(dawg, "", "T") == 1 << 0 | 1 << 8
+    assert cache.hits == 1
+
+    # Least recently used fragments are dropped first
+    monkeypatch.setattr(board_module, "CROSS_CHECK_CACHE_SIZE", 2)
+    cross_check_mask(dawg, "A", "")
+    assert list(cache.entries) == [("", "T"), ("A", "")]
+
+
+def test_cross_table_sums_and_words():
+    board = Board.from_string(BUSY)
+    down = board.cross_table(H)  # a horizontal move makes vertical cross-words
+    across = board.cross_table(V)
+
+    # Below B‑I‑t (the t is a blank, worth 0)
+    assert down.sums[10][7] == 4
+    assert down.word(10, 7, "s") == "BITS"
+    assert down.score(10, 7, "S") == 5
+    assert across.word(10, 7, "A") == "TA"
+    # Above B‑I‑t, on a plain square
+    assert down.word(6, 7, "O") == "OBIT"
+    # No neighbours, no cross-word
+    assert down.sums[0][0] is None and down.word(0, 0, "A") is None
+    assert down.score(0, 0, "Q") == 0
+    # Occupied squares are never filled in
+    assert down.sums[7][7] is None
+
+    # Cached per position, rebuilt once the grid changes
+    assert board.cross_table(H) is down
+    board.grid[11][7] = "E"
+    assert board.cross_table(H) is not down
+    board.grid = [row[:] for row in board.grid]
+    assert board.cross_table(V) is not across
+    assert board.cross_table(H).word(10, 7, "S") == "BITSE"
+
+
+def test_apply_move_matches_a_fresh_board():
+    from game_logic.generator import Move
+
+    board = Board.from_string(_empty_board_str())
+    board.anchors(), board.cross_checks(DAWG)  # cached, then kept up to date
+    plays = [
+        Move("ZONE", 7, 5, H, 0, []),
+        Move("BOA", 6, 6, V, 0, []),
+        Move("BALL", 6, 6, H, 0, []),
+        Move("NEt", 7, 7, V, 0, []),
+        Move("AT", 9, 6, H, 0, []),
+    ]
+    for move in plays:
+        placed = board.apply_move(move)
+        assert placed and all(board.grid[r][c] == ch for r, c, ch in placed)
+
+        fresh = Board.from_string(board.to_string())
+        assert board.anchors() == fresh.anchors()
+        assert board.cross_checks(DAWG) == fresh.cross_checks(DAWG)
+        for direction in (H, V):
+            ours, theirs = board.cross_table(direction), fresh.cross_table(direction)
+            assert ours.sums == theirs.sums
+            assert ours.before == theirs.before and ours.after == theirs.after
+
+
+def test_apply_move_refuses_occupied_squares():
+    board = Board.from_string(BUSY)
+    with pytest.raises(ValueError):
+        board.place_tiles([(7, 7, "A")])
+
+
+def test_grid_edits_in_place_keep_the_board_consistent():
+    board = Board()
+    board.place_tiles([(7, 7, "A"), (7, 8, "T")])
+    board.anchors(), board.line(V, 7), board.line(H, 7), board.cross_table(H)
+
+    # e.g. debug_utils: a deep copy edited square by square
+    copy = deepcopy(board)
+    copy.grid[8][7] = "N"
+    assert (9, 7) in copy.anchors() and (9, 7) not in board.anchors()
+    assert copy.line(V, 7)[8] == "N" and board.line(V, 7)[8] == "."
+    assert copy.line(H, 8)[7] == "N" and board.line(H, 8)[7] == "."
 
+    copy.grid[7] = ["."] * 15
+    assert copy.anchors() == {(7, 7), (8, 6), (8, 8), (9, 7)}
+    copy.grid[7][0] = "Q"
+    assert (6, 0) in copy.anchors() and copy.line(V, 0)[7] == "Q"
+    assert board.to_string() != copy.to_string()
@@ -12,7 +12,7 @@ sys.path.append(str(parent_dir))
 
 # Import necessary modules from game_logic
 from game_logic.board import Board, H, V  # Import H and V directly from board module
-from game_logic.dawg import Dawg
+from game_logic.dawg import Dawg, mask_letters
 from game_logic.generator import Move
 from game_logic.validation import validate_cross_words, extract_cross_words
 from game_logic.debug_utils import DebugUtils
@@ -83,8 +83,8 @@ def test_aal_move():
     if (r, c) in cross_checks:
         h_allowed = cross_checks[(r, c)][H]  # Use imported H constant
         v_allowed = cross_checks[(r, c)][V]  # Use imported V constant
-        print(f"Horizontal play allowed letters at ({r},{c}): {sorted(h_allowed)}")
-        print(f"Vertical play allowed letters at ({r},{c}): {sorted(v_allowed)}")
+        print(f"Horizontal play allowed letters at ({r},{c}): {mask_letters(h_allowed)}")
+        print(f"Vertical play allowed letters at ({r},{c}): {mask_letters(v_allowed)}")
     else:
         print(f"No cross-checks found for position ({r},{c})")
 
@@ -1,5 +1,5 @@
 # tests/test_dawg.py
-from game_logic.dawg import Dawg
+from game_logic.dawg import Dawg, PackedDawg, mask_letters
 
 DICT = "static/data/NWL2023.txt"
 
@@ -20,3 +20,69 @@ def test_basic_lookup():
     assert d.is_prefix("QU")
     assert not d.is_prefix("ZX")
 
+
+
+def test_suffixes_are_shared():
+    words = ["CATS", "DOGS", "CAT", "DOG", "RATS", "RAT"]
+    d = Dawg.build_from_words(words)
+
+    for w in words:
+        assert d.is_word(w)
+    assert not d.is_word("CA") and not d.is_word("DOGSS")
+
+    st = d.build_stats
+    assert st["words"] == 6
+    assert st["trie_nodes"] == 13
+    # C/R share "AT(S)"; CAT and DOG end in the same terminal → S → end tail
+    assert st["dawg_nodes"] == 7
+    assert d.stats() == {"nodes": st["dawg_nodes"], "edges": st["dawg_edges"]}
+
+
+def test_packed_matches_node_dawg():
+    words = ["CAT", "CATS", "DOG", "DOGS", "RAT", "RATS", "ZYZZYVA"]
+    d = Dawg.build_from_words(words)
+    p = PackedDawg.from_dawg(d)
+
+    assert p.stats() == d.stats()
+    for w in words + ["CA", "RATSS", "ZZ", "dog", "DO?"]:
+        assert p.is_word(w) == d.is_word(w)
+        assert p.is_prefix(w) == d.is_prefix(w)
+
+    # Node handles step the same way on both back-ends
+    n = p.step(p.step(p.root(), "C"), "A")
+    assert n is not None and not p.is_terminal(n)
+    assert p.is_terminal(p.step(n, "T"))
+    assert p.step(n, "X") is None and p.step(n, "") is None
+
+
+def test_completions():
+    words = ["DOG", "DOGS", "DOGMA", "DOGMAS", "BULLDOG", "DO"]
+    d = Dawg.build_from_words(words)
+    p = PackedDawg.from_dawg(d)
+
+    for g in (d, p):
+        assert list(g.completions("DOG")) == ["MA", "MAS", "S"]
+        assert list(g.completions("do")) == ["G", "GMA", "GMAS", "GS"]
+        assert list(g.completions("DOGMAS")) == []
+        assert list(g.completions("CAT")) == []
+
+
+def test_node_handles_and_cursor():
+    words = ["CAT", "CATS", "CAB", "COT", "DOG"]
+    d = Dawg.build_from_words(words)
+    p = PackedDawg.from_dawg(d)
+
+    for g in (d, p):
+        ca = g.walk("ca")
+        assert ca is not None and g.walk("T", ca) == g.walk("CAT")
+        assert g.walk("CAX") is None and g.walk("X", ca) is None
+        assert g.walk("CA", None) == ca and g.walk("", g.root()) == g.root()  # None is the root
+        assert mask_letters(g.children_mask(g.root())) == "CD"
+        assert mask_letters(g.children_mask(ca)) == "BT"
+
+        cur = g.cursor().walk("CA")
+        cat = cur.step("T")
+        assert cur.letters() == "BT" and not cur.is_terminal
+        assert cat.is_terminal and cat.flags == 1 and cat.letters() == "S"
+        assert cur.step("Z") is None and cat.walk("SS") is None
+        assert cur.walk("B").is_terminal     # the kept cursor resumes from CA
@@ -0,0 +1,219 @@
+from collections import Counter
+from itertools import combinations, product
+
+import pytest
+
+from game_logic import generator, parallel
+from game_logic.board import Board, BoardLayout, H, V
+from game_logic.dawg import Dawg, PackedDawg
+from game_logic.gaddag import Gaddag, gaddag_strings
+from game_logic.generator import _score_move, find_all_moves, find_best_moves, placed_tiles
+from game_logic.validation import validate_cross_words
+
+# A GADDAG of the full list takes ~25 s to build, so use the short words only
+with open("static/data/NWL2023.txt", encoding="utf8") as fh:
+    WORDS = [w.strip() for w in fh if len(w.strip()) <= 5]
+DAWG = Dawg.build_from_words(WORDS)
+GADDAG = Gaddag.build_from_words(WORDS)
+
+
+def _key(moves):
+    return sorted((m.word, m.row, m.col, m.direction, m.score) for m in moves)
+
+
+def test_gaddag_paths():
+    assert list(gaddag_strings("CAT")) == ["TAC", "C^AT", "AC^T"]
+    for w in ("CAT", "QUIZ", "ZEBRA"):
+        assert GADDAG.is_word(w)
+    assert not GADDAG.is_word("CATZ") and not GADDAG.is_word("C^AT")
+    for g in (GADDAG, Gaddag(PackedDawg.from_dawg(GADDAG._graph))):
+        assert g.walk("TAC", None) == g.walk("TAC") and g.is_terminal(g.walk("TAC"))
+
+
+def test_same_moves_as_dawg_on_empty_board():
+    board = Board()
+    rack = Counter({"": 1, "E": 1, "R": 1, "S": 1, "T": 1, "A": 1})
+
+    dawg_moves = find_all_moves(board, rack.copy(), DAWG)
+    gaddag_moves = find_all_moves(board, rack.copy(), DAWG, gaddag=GADDAG)
+
+    assert gaddag_moves and _key(gaddag_moves) == _key(dawg_moves)
+
+
+BUSY_BOARD = """
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . Z . . . . . .
+    . . . . . . . B E L L . . . .
+    . . . . . . K I N O . . . . .
+    . . . . . M A T . . . . . . .
+    . . . . . . T . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    """
+
+
+def test_gaddag_moves_are_legal_on_busy_board():
+    board = Board.from_string(BUSY_BOARD)
+    moves = find_all_moves(board, Counter("SAEDR"), DAWG, gaddag=GADDAG)
+
+    assert all(validate_cross_words(board, m, DAWG) for m in moves)
+    assert _key(moves) == _key(find_all_moves(board, Counter("SAEDR"), DAWG))
+    keys = {(m.word, m.row, m.col, m.direction) for m in moves}
+    assert len(keys) == len(moves)                 # no duplicates
+    assert ("BELLS", 7, 7, H) in keys              # hooks the end of a word
+    assert ("MATS", 9, 5, H) in keys               # extends a board prefix
+    assert ("ZENS", 6, 8, V) in keys               # runs through board tiles
+    assert ("MEADS", 9, 5, V) in keys              # starts on a board tile
+
+
+def test_gaddag_scores_match_reference_scorer():
+    # a blank on the board (lower case) scores 0 when a move runs through it
+    board = Board.from_string("""
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . Z . . . . . .
+    . . . . . . . B E L L . . . .
+    . . . . . . K I N O . . . . .
+    . . . . . M A t . . . . . . .
+    . . . . . . T . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    . . . . . . . . . . . . . . .
+    """)
+    moves = find_all_moves(board, Counter({"": 1, "S": 1, "E": 1, "D": 1, "R": 1}), DAWG, gaddag=GADDAG)
+
+    assert any("t" in m.word for m in moves)
+    for m in moves:
+        assert m.score == _score_move(board, m.row, m.col, m.direction, m.word), m
+
+
+def test_best_moves_match_the_full_ranking():
+    board = Board.from_string(BUSY_BOARD)
+    for rack in (Counter("QUIZXEA"), Counter({"": 1, "E": 1, "R": 1, "S": 1, "T": 1, "A": 1, "N": 1}),
+                 Counter({"": 2, "A": 1, "I": 1, "O": 1})):
+        ranked = find_all_moves(board, rack, DAWG, gaddag=GADDAG)
+        for k in (1, 3, 10):
+            best = find_best_moves(board, rack, DAWG, gaddag=GADDAG, k=k)
+            # pruning must never lose a move that belongs in the top k
+            assert [m.total_score for m in best] == [m.total_score for m in ranked[:k]]
+            assert all(m.tiles and m.score == _score_move(board, m.row, m.col, m.direction, m.word) for m in best)
+
+
+def test_best_moves_without_a_gaddag_are_pruned_too(monkeypatch):
+    offered = []
+    real_offer = generator._TopK.offer
+    monkeypatch.setattr(generator._TopK, "offer", lambda top, *args: offered.append(1) or real_offer(top, *args))
+    board = Board.from_string(BUSY_BOARD)
+    for rack in (Counter("QUIZXEA"), Counter({"": 2, "E": 1, "R": 1, "S": 1, "T": 1, "A": 1})):
+        ranked = find_all_moves(board, rack, DAWG)
+        for k in (1, 5):
+            pruned = find_best_moves(board, rack, DAWG, gaddag=GADDAG, k=k)
+            del offered[:]
+            best = find_best_moves(board, rack, DAWG, k=k)
+            assert [m.total_score for m in best] == [m.total_score for m in pruned] == \
+                [m.total_score for m in ranked[:k]]
+            assert all(m.tiles == placed_tiles(board, m) for m in best)
+    # most of the blank rack's 17k moves were never generated, let alone ranked
+    assert len(offered) < len(ranked) / 10
+
+
+def test_best_moves_with_more_than_seven_tiles():
+    # anchors in the last column have nothing to their right to reach into
+    board = Board.from_string(BUSY_BOARD)
+    board.place_tiles([(7, 13, "A"), (7, 14, "T")])
+    rack = Counter({"": 1, "A": 1, "E": 1, "I": 1, "N": 1, "R": 1, "S": 1, "T": 1})
+    ranked = find_all_moves(board, rack, DAWG, gaddag=GADDAG)
+    best = find_best_moves(board, rack, DAWG, gaddag=GADDAG, k=5)
+    assert [m.total_score for m in best] == [m.total_score for m in ranked[:5]]
+
+
+def test_blanks_are_played_once_per_word_on_their_cheapest_squares():
+    board = Board.from_string(BUSY_BOARD)
+    rack = Counter({"": 2, "E": 1, "S": 1, "D": 1})
+    moves = find_all_moves(board, rack, DAWG, gaddag=GADDAG)
+    assert _key(moves) == _key(find_all_moves(board, rack, DAWG))
+
+    # no two moves differ only in which copy of a letter is the blank
+    keys = {(m.word.upper(), m.row, m.col, m.direction) for m in moves}
+    assert len(keys) == len(moves)
+    traded = 0
+    for m in moves:
+        dr, dc = (0, 1) if m.direction == H else (1, 0)
+        new = [i for i in range(len(m.word)) if board.grid[m.row + dr * i][m.col + dc * i] == "."]
+        blanks = Counter(m.word[i].upper() for i in new if m.word[i].islower())
+        real = Counter(m.word[i] for i in new if m.word[i].isupper())
+        # a blank never stands for a letter still held as a real tile
+        assert all(rack[letter] == real[letter] for letter in blanks), m
+        # and sits wherever it costs least
+        choices = [combinations([i for i in new if m.word[i].upper() == letter], n) for letter, n in blanks.items()]
+        best = 0
+        for picks in product(*choices):
+            word = [ch.upper() if i in new else ch for i, ch in enumerate(m.word)]
+            for i in (i for pick in picks for i in pick):
+                word[i] = word[i].lower()
+            best = max(best, _score_move(board, m.row, m.col, m.direction, "".join(word)))
+        assert m.score == best, m
+        traded += any(real[letter] for letter in blanks)
+    assert traded  # the rack's E and S do share words with a blank
+
+
+def test_parallel_search_matches_serial():
+    board = Board.from_string(BUSY_BOARD)
+    rack = Counter({"": 1, "E": 1, "R": 1, "S": 1, "T": 1, "A": 1, "N": 1})
+    try:
+        for gaddag in (None, GADDAG):
+            serial = find_all_moves(board, rack, DAWG, gaddag=gaddag)
+            pooled = find_all_moves(board, rack, DAWG, gaddag=gaddag, workers=2)
+            assert [(m.word, m.row, m.col, m.direction, m.total_score) for m in pooled] == \
+                [(m.word, m.row, m.col, m.direction, m.total_score) for m in serial]
+        best = find_best_moves(board, rack, DAWG, gaddag=GADDAG, k=5, workers=2)
+        assert [m.total_score for m in best] == [m.total_score for m in serial[:5]]
+    finally:
+        parallel.shutdown()
+
+
+def test_replaced_pool_serves_searches_already_using_it():
+    board = Board.from_string(BUSY_BOARD)
+    rack = Counter("SAEDR")
+    serial = find_all_moves(board, rack, DAWG, gaddag=GADDAG)
+    try:
+        with parallel._lease(DAWG, GADDAG, 2) as pool:
+            # another request switches to a different pool meanwhile
+            assert find_all_moves(board, rack, DAWG, gaddag=GADDAG, workers=3)
+            assert pool.submit(len, "still open").result() == 10
+        with pytest.raises(RuntimeError):   # retired once the last search left
+            pool.submit(len, "closed")
+        assert _key(find_all_moves(board, rack, DAWG, gaddag=GADDAG, workers=3)) == _key(serial)
+    finally:
+        parallel.shutdown()
+
+
+def test_boards_of_another_layout():
+    layout = BoardLayout(21, tw={(0, 0), (10, 20)}, dw={(10, 10)}, dl={(10, 8)})
+    board = Board(layout=layout)
+    assert board.anchors() == {(10, 10)}
+    cat = next(m for m in find_all_moves(board, Counter("CAT"), DAWG, gaddag=GADDAG)
+               if (m.word, m.row, m.col, m.direction) == ("CAT", 10, 8, H))
+    assert cat.score == (3 * 2 + 1 + 1) * 2
+
+    board.apply_move(cat)
+    board.place_tiles([(10, 18, "D"), (10, 19, "O"), (11, 20, "O"), (12, 20, "N")])
+    rack = Counter({"": 1, "E": 1, "R": 1, "A": 1, "Z": 1})
+    ranked = find_all_moves(board, rack, DAWG, gaddag=GADDAG)
+    assert any(m.col + len(m.word) == 21 for m in ranked if m.direction == H)
+    assert _key(ranked) == _key(find_all_moves(board, rack, DAWG))
+    assert all(m.score == _score_move(board, m.row, m.col, m.direction, m.word) for m in ranked)
+    best = find_best_moves(board, rack, DAWG, gaddag=GADDAG, k=3)
+    assert [m.total_score for m in best] == [m.total_score for m in ranked[:3]]
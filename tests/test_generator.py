@@ -1,8 +1,9 @@
 from collections import Counter
 
-from game_logic.dawg import Dawg
+from game_logic.dawg import Dawg, PackedDawg
 from game_logic.board import Board
-from game_logic.generator import find_all_moves
+from game_logic.generator import Move, _score_move, find_all_moves
+from game_logic.validation import ShadowValidator, validate_cross_words
 
 DICT = "static/data/NWL2023.txt"
 DAWG = Dawg.from_wordlist_file(DICT)
@@ -21,4 +22,76 @@ def test_simple_move_generation():
 
     assert any(m.word == "CAT" and m.row == 7 and m.col <= 7 for m in moves)
     # There should be at least one move, even with this minimal rack
-    assert len(moves) > 0
\ No newline at end of file
+    assert len(moves) > 0
+
+def test_packed_dawg_generates_same_moves():
+    board = Board.from_string(_empty_board_str())
+    rack = Counter({"": 1, "Q": 1, "U": 1, "I": 1, "T": 1})
+    packed = PackedDawg.from_dawg(DAWG)
+
+    def key(moves):
+        return sorted((m.word, m.row, m.col, m.direction, m.score) for m in moves)
+
+    assert key(find_all_moves(board, rack.copy(), packed)) == key(find_all_moves(board, rack.copy(), DAWG))
+
+
+BUSY_BOARD = """
+. . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . .
+. . . . . . . . Z . . . . . .
+. . . . . . . B E L L . . . .
+. . . . . . K I N O . . . . .
+. . . . . M A T . . . . . . .
+. . . . . . T . . . . . . . .
+. . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . .
+. . . . . . . . . . . . . . .
+"""
+
+
+def test_incremental_scores_match_reference_scorer():
+    board = Board.from_string(BUSY_BOARD)
+    moves = find_all_moves(board, Counter({"": 1, "S": 1, "E": 1, "D": 1, "R": 1, "Q": 1, "I": 1}), DAWG)
+
+    assert moves
+    for m in moves:
+        assert m.score == _score_move(board, m.row, m.col, m.direction, m.word), m
+
+
+def test_each_move_is_generated_once():
+    board = Board.from_string(BUSY_BOARD)
+    moves = find_all_moves(board, Counter({"": 1, "A": 1, "E": 1, "R": 1, "S": 1, "T": 1}), DAWG)
+
+    keys = [(m.word.upper(), m.row, m.col, m.direction, "".join(m.tiles)) for m in moves]
+    assert moves and len(keys) == len(set(keys))
+    # left parts never overlay board tiles, words never run into them
+    assert all(validate_cross_words(board, m, DAWG) for m in moves)
+
+
+def test_shadow_validation_reports_illegal_moves():
+    board = Board.from_string(BUSY_BOARD)
+    moves = find_all_moves(board, Counter("SAEDRQI"), DAWG)
+    shadow = ShadowValidator(rate=1.0, seed=0)
+
+    assert shadow.check(board, moves, DAWG) == []
+    # AAL down from (5, 9) would make AALO
+    bad = Move("AAL", 5, 9, "V", 16, ["A", "A", "L"])
+    assert shadow.check(board, [bad], DAWG) == [bad]
+    assert shadow.stats() == {"rate": 1.0, "checked": len(moves) + 1, "mismatches": 1}
+
+    shadow.rate = 0.1
+    shadow.check(board, moves, DAWG)
+    assert len(moves) + 1 < shadow.checked <= len(moves) * 1.1 + 2
+
+
+def test_left_parts_as_long_as_the_rack_allows():
+    board = Board.from_string(_empty_board_str())
+    board.place_tiles([(7, 10, "S")])
+    # eight rack tiles before the anchor at (7, 9), one on it
+    moves = find_all_moves(board, Counter("ENTERTAIN"), DAWG)
+    assert ("ENTERTAINS", 7, 1, "H") in {(m.word, m.row, m.col, m.direction) for m in moves}
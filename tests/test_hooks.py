@@ -0,0 +1,53 @@
+from game_logic.hooks import HookIndex, hook_letters
+from game_logic.lexicon import open_lexicons
+from game_logic.word_index import CSW, NWL, WordIndex
+
+
+def _index(tmp_path):
+    nwl = tmp_path / "nwl.txt"
+    csw = tmp_path / "csw.txt"
+    nwl.write_text("AT\nCAT\nHAT\nCATS\nSCAT\nDOG\n")
+    csw.write_text("AT\nCAT\nHAT\nCATS\nSCAT\nDOG\nDOGS\nATE\n")
+    return WordIndex(open_lexicons([nwl, csw], tmp_path / "words.lex"))
+
+
+def test_hook_masks(tmp_path):
+    hooks = HookIndex(_index(tmp_path), NWL)
+
+    assert hook_letters(0b101) == ["A", "C"]
+    assert hooks.lengths() == [2, 3, 4]
+    assert {w: (hook_letters(f), hook_letters(b)) for w, f, b in hooks.hooks(3)} == {
+        "CAT": (["S"], ["S"]),
+        "DOG": ([], []),
+        "HAT": ([], []),
+    }
+    assert list(hooks.hooks(9)) == []
+
+
+def test_select_filters(tmp_path):
+    index = _index(tmp_path)
+    nwl, csw = HookIndex(index, NWL), HookIndex(index, CSW)
+
+    assert nwl.select(2) == [("AT", ["C", "H"], [])]
+    assert csw.select(2) == [("AT", ["C", "H"], ["E"])]
+    assert [w for w, _, _ in csw.select(3, "back")] == ["CAT", "DOG"]
+    assert [w for w, _, _ in csw.select(3, "front")] == ["CAT"]
+    assert [w for w, _, _ in csw.select(3, "both", min_hooks=2)] == ["CAT"]
+    assert [w for w, _, _ in nwl.select(3, min_hooks=0)] == ["CAT", "DOG", "HAT"]
+    assert len(nwl.select(3, min_hooks=0, limit=2)) == 2
+
+
+def test_generate_hooks_multi_letter(tmp_path):
+    from generate_hooks import build_hook_dict, process_list
+
+    words = {"DOG", "DOGS", "DOGMA", "BULLDOG", "HOTDOG", "DO"}
+    hooks = build_hook_dict(words)
+    assert hooks["DOG"] == {"front": ["BULL", "HOT"], "back": ["MA", "S"]}
+    assert hooks["DO"] == {"front": [], "back": ["G", "GMA", "GS"]}
+    assert hooks["BULLDOG"] == {"front": [], "back": []}
+
+    src = tmp_path / "LIST.txt"
+    src.write_text("\n".join(sorted(words)))
+    process_list(src, tmp_path)
+    assert (tmp_path / "LIST_hooks.json").exists()
+    assert list(tmp_path.glob("LIST_hooks.tsv.*"))
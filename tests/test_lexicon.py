@@ -0,0 +1,35 @@
+import os
+
+from game_logic import lexicon
+from game_logic.lexicon import CompiledLexicon, compile_words, open_lexicon
+
+WORDS = ["cat", "CATS", "DOG", "AA", "A", "ZYZZYVA", "DOGS"]
+
+
+def test_compiled_lookup(tmp_path):
+    path = compile_words(WORDS, tmp_path / "mini.lex")
+    lex = CompiledLexicon(path)
+
+    # Single letters are dropped and the table comes back sorted/upper-case
+    assert list(lex.words) == ["AA", "CAT", "CATS", "DOG", "DOGS", "ZYZZYVA"]
+    assert len(lex) == 6
+    assert lex.words[1] == "CAT" and lex.words[-1] == "ZYZZYVA"
+
+    assert "CATS" in lex.words and "cat" in lex
+    assert "CA" not in lex.words and "A" not in lex
+    assert lex.is_prefix("ZYZ") and not lex.is_prefix("ZZ")
+
+
+def test_open_lexicon_recompiles_stale_file(tmp_path):
+    src = tmp_path / "mini.txt"
+    src.write_text("CAT\nDOG\n")
+    lex = open_lexicon(src)
+    assert (tmp_path / "mini.lex").exists()
+    assert lex.is_word("DOG") and not lex.is_word("EMU")
+    assert open_lexicon(src) is lex  # cached per process
+
+    src.write_text("CAT\nDOG\nEMU\n")
+    stamp = os.stat(tmp_path / "mini.lex").st_mtime
+    os.utime(src, (stamp + 10, stamp + 10))
+    lexicon._OPEN.clear()
+    assert open_lexicon(src).is_word("EMU")
@@ -0,0 +1,48 @@
+from collections import Counter
+
+import pytest
+
+from game_logic.generator import calculate_rack_equity
+from game_logic.rack import BLANK, Rack
+
+
+def test_take_put_and_queries():
+    rack = Rack.from_letters("RETAIN?")
+    assert len(rack) == 7 and rack.blanks == 1 and rack["e"] == 1
+    assert rack.letter_mask() == sum(1 << (ord(c) - 65) for c in "RETAIN")
+    assert [ch for _, ch in rack.letters()] == list("AEINRT")
+    key = rack.key()
+
+    rack.take(ord("E") - 65)
+    rack.take(BLANK)
+    assert len(rack) == 5 and rack.key() != key
+    rack.put(BLANK)
+    rack.put(ord("E") - 65)
+    assert rack.key() == key and hash(rack) == hash(Rack.from_letters("?NIATER"))
+
+    rack.take_tile("s")          # a blank played as S
+    rack.take_tile("T")
+    assert rack.blanks == 0 and rack["T"] == 0
+    assert list(rack.tiles()) == list("AEINR")
+
+    with pytest.raises(ValueError):
+        Rack.from_letters("A1")
+
+
+def test_counter_round_trip_and_copies():
+    counter = Counter({"": 2, "Q": 1, "U": 1})
+    rack = Rack.from_counter(counter)
+    assert rack.to_counter() == counter
+    assert repr(rack) == "Rack(QU??)"
+
+    copy = Rack.coerce(rack)
+    copy.take(BLANK)
+    assert rack.blanks == 2 and copy.blanks == 1
+    assert Rack.coerce("QU??") == rack
+
+
+def test_rack_equity_accepts_both_forms():
+    counter = Counter({"S": 2, "": 1, "Q": 1})
+    expected = 2 * 8.0 + 25.6 - 6.8 - 4
+    assert calculate_rack_equity(counter) == pytest.approx(expected)
+    assert calculate_rack_equity(Rack.from_counter(counter)) == pytest.approx(expected)
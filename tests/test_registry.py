@@ -0,0 +1,68 @@
+import threading
+import time
+
+import pytest
+
+from game_logic.registry import LexiconRegistry, lexicons
+
+
+def test_lazy_build_with_status():
+    calls = []
+    reg = LexiconRegistry()
+    reg.register("words", lambda: calls.append(1) or {"CAT"})
+    reg.register("count", lambda: len(reg.get("words")))
+
+    assert calls == [] and not reg.ready("words")
+    assert reg.status()["words"] == {"ready": False, "loading": False, "seconds": None, "error": None}
+
+    assert reg.get("count") == 1          # builds its dependency on the way
+    assert reg.get("words") == {"CAT"} and calls == [1]
+    st = reg.status()
+    assert st["words"]["ready"] and st["count"]["ready"]
+    assert st["words"]["seconds"] >= 0
+
+
+def test_failed_build_is_reported_and_retried():
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise OSError("missing file")
+        return "ok"
+
+    reg = LexiconRegistry()
+    reg.register("flaky", flaky)
+    with pytest.raises(OSError):
+        reg.get("flaky")
+    assert reg.status()["flaky"]["error"] == "OSError: missing file"
+    assert reg.get("flaky") == "ok" and reg.status()["flaky"]["error"] is None
+
+
+def test_warm_builds_once_in_background():
+    gate = threading.Event()
+    calls = []
+
+    def slow():
+        gate.wait(5)
+        calls.append(1)
+        return 42
+
+    reg = LexiconRegistry()
+    reg.register("slow", slow)
+    threads = reg.warm()
+    time.sleep(0.05)
+    assert reg.status()["slow"]["loading"] and not reg.ready("slow")
+
+    waiter = threading.Thread(target=reg.get, args=("slow",))
+    waiter.start()
+    gate.set()
+    for t in threads + [waiter]:
+        t.join(5)
+    assert reg.get("slow") == 42 and calls == [1]
+    assert reg.warm() == []                # nothing left to build
+
+
+def test_default_resources():
+    assert {"dawg", "gaddag", "word_index", "hooks:nwl", "hooks:csw"} <= set(lexicons.names())
+    assert lexicons.get("dawg").is_word("QI")
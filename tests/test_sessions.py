@@ -0,0 +1,73 @@
+import threading
+
+from game_logic.board import Board
+from game_logic.sessions import GameSessions
+
+
+def _board_str(tiles):
+    grid = [["."] * 15 for _ in range(15)]
+    for r, c, ch in tiles:
+        grid[r][c] = ch
+    return "\n".join(" ".join(row) for row in grid)
+
+
+def test_board_is_kept_and_caught_up():
+    games = GameSessions()
+    opening = [(7, 6, "A"), (7, 7, "T")]
+    board = games.board("g1", _board_str(opening))
+    anchors = board.anchors()
+
+    # The player adds tiles: same board object, updated in place
+    later = opening + [(8, 7, "O")]
+    again = games.board("g1", _board_str(later))
+    assert again is board
+    assert again.grid[8][7] == "O"
+    assert (8, 7) in anchors and (8, 7) not in again.anchors()
+    assert again.anchors() == Board.from_string(_board_str(later)).anchors()
+
+
+def test_unrelated_board_starts_over():
+    games = GameSessions()
+    board = games.board("g1", _board_str([(7, 7, "A")]))
+    # A tile changed rather than added (e.g. a new game under the same id)
+    other = games.board("g1", _board_str([(7, 7, "B")]))
+    assert other is not board
+    assert games.board("g1", _board_str([(7, 7, "B")])) is other
+
+
+def test_least_recently_used_games_are_dropped():
+    games = GameSessions(max_games=2)
+    first = games.board("a", _board_str([]))
+    games.board("b", _board_str([]))
+    games.board("a", _board_str([]))       # "a" is now the most recent
+    games.board("c", _board_str([]))
+    assert len(games) == 2
+    assert games.board("a", _board_str([])) is first
+    games.discard("a")
+    assert games.board("a", _board_str([])) is not first
+
+
+def test_sessions_of_one_game_take_turns():
+    games = GameSessions()
+    state = _board_str([(7, 7, "A")])
+    order = []
+
+    def second_turn():
+        # sent after the first turn's play, so it catches up the same board
+        with games.session("g1", _board_str([(7, 7, "A"), (7, 8, "T")])) as board:
+            order.append(("second", board))
+
+    with games.session("g1", state) as board:
+        other = threading.Thread(target=second_turn)
+        other.start()
+        other.join(0.2)
+        assert other.is_alive()             # waiting for this turn to end
+        board.place_tiles([(7, 8, "T")])
+        order.append(("first", board))
+    other.join()
+    assert order == [("first", board), ("second", board)]
+
+    # another game is not held up
+    with games.session("g1", state):
+        with games.session("g2", state) as other_board:
+            assert other_board.grid[7][7] == "A"
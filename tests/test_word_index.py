@@ -0,0 +1,96 @@
+import pytest
+
+from game_logic.lexicon import open_lexicons
+from game_logic.word_index import ALL, CSW, NWL, WordIndex, lexicon_mask
+
+
+def _index(tmp_path):
+    nwl = tmp_path / "nwl.txt"
+    csw = tmp_path / "csw.txt"
+    nwl.write_text("CAT\nDOG\nOK\n")
+    csw.write_text("CAT\nDOG\nZE\nQIN\n")
+    return WordIndex(open_lexicons([nwl, csw], tmp_path / "words.lex"))
+
+
+def test_flags_and_masked_queries(tmp_path):
+    index = _index(tmp_path)
+
+    assert len(index) == 5  # shared words are stored once
+    assert index.flags("CAT") == NWL | CSW
+    assert index.flags("ok") == NWL
+    assert index.flags("ZE") == CSW
+    assert index.flags("EMU") == 0
+    assert index.contains("QIN", CSW) and not index.contains("QIN", NWL)
+
+    assert list(index.words(NWL)) == ["CAT", "DOG", "OK"]
+    assert list(index.words(CSW)) == ["CAT", "DOG", "QIN", "ZE"]
+    assert dict(index.items(ALL)) == {"CAT": 3, "DOG": 3, "OK": 1, "QIN": 2, "ZE": 2}
+    # flags also sit on the automaton's terminal nodes
+    assert index.dawg.word_flags("QIN") == CSW
+
+
+def test_lexicon_mask_names():
+    assert lexicon_mask("nwl") == NWL
+    assert lexicon_mask("collins") == CSW
+    assert lexicon_mask("both") == ALL
+    assert lexicon_mask(None) == ALL
+
+
+def test_bingo_lookups_with_blanks(tmp_path):
+    nwl = tmp_path / "nwl.txt"
+    csw = tmp_path / "csw.txt"
+    nwl.write_text("RETAINS\nRETINAS\nSTAINER\nNASTIER\nRETAINED\n")
+    csw.write_text("RETAINS\nANESTRI\nRATINES\nSTEARIN\n")
+    index = WordIndex(open_lexicons([nwl, csw], tmp_path / "words.lex"))
+
+    assert index.anagrams("SATIRE" + "N", NWL) == ["NASTIER", "RETAINS", "RETINAS", "STAINER"]
+    assert index.bingos("AEINRST", mask=CSW) == ["ANESTRI", "RATINES", "RETAINS", "STEARIN"]
+    assert index.bingos("AEINRS?", mask=NWL) == ["NASTIER", "RETAINS", "RETINAS", "STAINER"]
+    assert index.bingos("AEIRS??", mask=NWL) == ["NASTIER", "RETAINS", "RETINAS", "STAINER"]
+    assert index.bingos("AEIRS??", mask=NWL) == index.bingos("??SRIEA", mask=NWL)
+    assert index.bingos("QQQQQQ?") == []
+
+    assert index.extension_bingos("ADEINRT", 8) == ["RETAINED"]
+    assert index.extension_bingos("ADEINRT?", 8) == ["RETAINED"]
+    assert index.extension_bingos("ADEEINRT", 8) == []    # no letter is extra
+
+
+def test_subanagrams(tmp_path):
+    index = _index(tmp_path)
+
+    hits, truncated = index.subanagrams("TACGOD")
+    assert hits == [("CAT", NWL | CSW), ("DOG", NWL | CSW)] and not truncated
+    assert index.subanagrams("TAC", CSW)[0] == [("CAT", NWL | CSW)]
+    assert index.subanagrams("Z?", CSW)[0] == [("ZE", CSW)]
+    assert index.subanagrams("Z?", NWL)[0] == []
+    assert index.subanagrams("?OK", NWL)[0] == [("OK", NWL)]
+
+    words_and_flags = index.subanagrams("??OG")[0]
+    words = [w for w, _ in words_and_flags]
+    assert words == ["DOG", "OK", "ZE"]
+    assert [w for w, _ in index.subanagrams("??OG", min_length=3)[0]] == ["DOG"]
+    assert [w for w, _ in index.subanagrams("??OG", max_length=2)[0]] == ["OK", "ZE"]
+    assert index.subanagrams("??OG", limit=1) == ([("DOG", NWL | CSW)], True)
+    # a limit cuts the full ranking, however early the walk stops
+    for limit in range(1, 5):
+        assert index.subanagrams("??OG", limit=limit) == (words_and_flags[:limit], limit < 3)
+    for bad in ({"limit": 0}, {"min_length": 0}, {"max_length": -1}, {"max_length": 0}, {"min_length": 3, "max_length": 2}):
+        with pytest.raises(ValueError):
+            index.subanagrams("??OG", **bad)
+
+
+def test_length_buckets_and_sampling(tmp_path):
+    index = _index(tmp_path)
+
+    assert list(index.words_of_length(3, NWL)) == ["CAT", "DOG"]
+    assert list(index.words_of_length(3, CSW)) == ["CAT", "DOG", "QIN"]
+    assert list(index.words_of_length(2, NWL)) == ["OK"]
+    assert list(index.words_of_length(9)) == []
+    assert [index.word_table[i] for i in index.by_length(NWL)[3]] == ["CAT", "DOG"]
+
+    assert sorted(index.sample(3, 10, CSW)) == ["CAT", "DOG", "QIN"]
+    picked = index.sample(3, 2, CSW)
+    assert len(picked) == len(set(picked)) == 2
+    assert set(picked) <= {"CAT", "DOG", "QIN"}
+
+    assert index.anagram_map(["DOG", "GOD"], NWL) == {"DGO": ["DOG"]}
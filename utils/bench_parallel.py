@@ -0,0 +1,58 @@
+"""Time the move search serially and over process pools.
+
+    python -m utils.bench_parallel [BOARD_FILE] [RACK ...]
+
+BOARD_FILE holds a board as sent to /get_move (rows of squares separated
+by spaces, "." for empty); without it the standard opening position is
+used.  Each rack is searched with find_best_moves (k=1, as the bot does)
+and find_all_moves, serially and with 2, 4 and more workers up to the
+CPU count, and the best of a few runs is printed.  The pool is warmed
+first, so the figures are per search, not per process start.
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+from game_logic import parallel
+from game_logic.board import Board
+from game_logic.generator import find_all_moves, find_best_moves
+from game_logic.rack import Rack
+from game_logic.registry import lexicons
+
+RUNS = 5
+
+
+def _best_time(fn) -> float:
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv):
+    board = Board.from_string(open(argv[0]).read()) if argv else Board()
+    racks = argv[1:] or ["AEINRST", "?EIRST", "??AEINR"]
+    dawg, gaddag = lexicons.get("dawg"), lexicons.get("gaddag")
+    counts = [1, 2, 4] + [n for n in (8, 16) if n <= (os.cpu_count() or 1)]
+    print(f"{os.cpu_count()} CPUs")
+    try:
+        for letters in racks:
+            for name, search in (("best", find_best_moves), ("all", find_all_moves)):
+                times = []
+                for workers in counts:
+                    def run():
+                        search(board, Rack.from_letters(letters), dawg, gaddag=gaddag, workers=workers)
+                    _best_time(run)  # start the pool
+                    times.append(f"{workers}: {_best_time(run) * 1000:7.1f} ms")
+                print(f"{letters:8} {name:4}  " + "   ".join(times))
+    finally:
+        parallel.shutdown()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])